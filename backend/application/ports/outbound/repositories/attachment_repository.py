@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+
+class AttachmentWriter(ABC):
+    """Receives the content of one attachment, chunk by chunk."""
+    @abstractmethod
+    def write(self, chunk: bytes) -> None: ...
+
+    @abstractmethod
+    def commit(self) -> tuple[str, int]:
+        """Store the content written so far and return its (attachment_id, size)."""
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Discard the content written so far."""
+
+
+class AttachmentRepository(ABC):
+    """
+    Content-addressed store for task attachments: an attachment is identified
+    by the hash of its content, so identical files are stored only once.
+    """
+    @abstractmethod
+    def open_writer(self) -> AttachmentWriter: ...
+
+    @abstractmethod
+    def open(self, attachment_id: str) -> BinaryIO: ...
+
+    @abstractmethod
+    def exists(self, attachment_id: str) -> bool: ...
+
+    def put(self, content: bytes) -> tuple[str, int]:
+        """Store an attachment that is already in memory."""
+        writer = self.open_writer()
+        try:
+            writer.write(content)
+            return writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 
 # application/ports/task_repository.py
 from abc import ABC, abstractmethod
+from typing import Callable, Iterable
+from application.ports.outbound.repositories.versions import ChangeVersions
 from domain.models.list import TaskList
 
 class TaskListRepository(ABC):
@@ -20,4 +22,51 @@ class TaskListRepository(ABC):
     def delete(self, list_id: str) -> None: ...
     
     @abstractmethod
-    def update(self, task_list: TaskList) -> TaskList: ...
\ No newline at end of file
+    def update(self, task_list: TaskList) -> TaskList: ...
+
+    def save_many(self, task_lists: list[TaskList]) -> list[TaskList]:
+        """Save several task lists; repositories that can persist them with a single write override this."""
+        return [self.save(task_list) for task_list in task_lists]
+
+    def existing_ids(self, list_ids: Iterable[str]) -> set[str]:
+        """Return which of `list_ids` belong to stored task lists, e.g. to check many references at once."""
+        existing = set()
+        for list_id in set(list_ids):
+            try:
+                if list_id and self.get_by_id(list_id):
+                    existing.add(list_id)
+            except ValueError:
+                continue
+        return existing
+
+    def flush(self) -> None:
+        """Write any pending changes to durable storage."""
+
+    def close(self) -> None:
+        """Write any pending changes and release the resources held by the repository."""
+        self.flush()
+
+    async def wait_until_durable(self) -> None:
+        """Wait, without blocking the event loop, until the changes made so far meet the durability policy."""
+
+    def add_change_listener(self, listener: Callable[[list[str]], None]) -> None:
+        """
+        Register a callable that is given the ids of the task lists every time this
+        repository saves or deletes some, e.g. to drop cached copies of them.
+        """
+        self._change_listeners = getattr(self, "_change_listeners", []) + [listener]
+
+    def version_tag(self, list_id: str | None = None) -> str:
+        """
+        Return an opaque tag that changes whenever the task list `list_id` is
+        saved or deleted, or any task list when no id is given, e.g. to build
+        ETags. Tags are only meaningful within the current process.
+        """
+        return ChangeVersions.of(self).tag(list_id)
+
+    def _notify_change(self, ids: list[str]) -> None:
+        """Tell the registered listeners which task lists were saved or deleted, and bump their versions."""
+        if ids:
+            ChangeVersions.of(self).bump(ids)
+            for listener in getattr(self, "_change_listeners", ()):
+                listener(ids)
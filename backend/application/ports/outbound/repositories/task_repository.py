@@ -3,12 +3,22 @@ from abc import ABC, abstractmethod
 
 # application/ports/task_repository.py
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+from application.ports.outbound.repositories.versions import ChangeVersions
 from domain.models.task import Task
 
+# Orders `TaskRepository.query` can return tasks in
+TASK_QUERY_SORTS = ("order", "due_date", "created_at")
+
 class TaskRepository(ABC):
     @abstractmethod
     def save(self, task: Task) -> Task: ...
     
+    @abstractmethod
+    def save_many(self, tasks: list[Task]) -> list[Task]:
+        """Save several tasks and persist them with a single write."""
+
     @abstractmethod
     def get_by_id(self, id: str) -> Task | None: ...
     
@@ -19,4 +29,82 @@ class TaskRepository(ABC):
     def delete(self, id: str) -> None: ...
 
     @abstractmethod
-    def get_by_list_id(self, list_id: str) -> list[Task]: ...
\ No newline at end of file
+    def delete_many(self, ids: list[str]) -> list[str]:
+        """Delete several tasks with a single write and return the ids that existed."""
+
+    @abstractmethod
+    def get_by_list_id(self, list_id: str) -> list[Task]: ...
+
+    @abstractmethod
+    def get_page_by_list_id(self, list_id: str, limit: int, after: tuple | None = None) -> list[Task]:
+        """
+        Return at most `limit` tasks of a list ordered by `Task.sort_key()`,
+        starting right after the sort key `after`.
+        """
+
+    @abstractmethod
+    def delete_by_list_id(self, list_id: str) -> int:
+        """Delete every task of a list with a single write and return how many were deleted."""
+
+    @abstractmethod
+    def query(self, done: bool | None = None, owner: str | None = None, list_id: str | None = None,
+              due_after: datetime | None = None, due_before: datetime | None = None,
+              sort: str = "order", descending: bool = False, limit: int | None = None) -> list[Task]:
+        """
+        Return the tasks matching every given filter, at most `limit` of them.
+        The due date range includes `due_after` and excludes `due_before`; tasks
+        without a due date never match a range. `sort` is one of TASK_QUERY_SORTS:
+        "order" (by `Task.sort_key()`), "due_date" (tasks without one last) or
+        "created_at", with the id as a tie-breaker. `descending` reverses the order.
+        """
+
+    @abstractmethod
+    def iter_tasks(self, list_id: str | None = None, updated_since: datetime | None = None,
+                   batch_size: int = 1000) -> Iterator[Task]:
+        """
+        Yield every task, or the tasks of `list_id` in order, last modified at
+        or after `updated_since`, reading them `batch_size` at a time so the
+        whole store is never copied, e.g. to stream an export. Tasks saved or
+        deleted meanwhile may or may not be yielded; none is yielded twice.
+        """
+
+    def flush(self) -> None:
+        """Write any pending changes to durable storage."""
+
+    def close(self) -> None:
+        """Write any pending changes and release the resources held by the repository."""
+        self.flush()
+
+    async def wait_until_durable(self) -> None:
+        """
+        Wait, without blocking the event loop, until the changes made so far meet
+        the repository's durability policy: right away when writes are acknowledged
+        once applied in memory, after their commit when they are acknowledged once
+        on disk. Repositories that commit before every write returns have nothing
+        to wait for.
+        """
+
+    def add_change_listener(self, listener: Callable[[list[str]], None]) -> None:
+        """
+        Register a callable that is given the ids of the tasks every time this
+        repository saves or deletes some, e.g. to drop cached copies of them.
+        """
+        self._change_listeners = getattr(self, "_change_listeners", []) + [listener]
+
+    def version_tag(self, list_id: str | None = None) -> str:
+        """
+        Return an opaque tag that changes whenever a task of `list_id` is saved
+        or deleted, or any task when no list is given, e.g. to build ETags.
+        Tags are only meaningful within the current process.
+        """
+        return ChangeVersions.of(self).tag(list_id)
+
+    def _notify_change(self, ids: list[str], list_ids: Iterable[str]) -> None:
+        """
+        Tell the registered listeners which tasks were saved or deleted, and bump
+        the versions of the lists they were in before and after the change.
+        """
+        if ids:
+            ChangeVersions.of(self).bump(list_ids)
+            for listener in getattr(self, "_change_listeners", ()):
+                listener(ids)
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from application.ports.outbound.repositories.task_repository import TaskRepository
+
+
+class TaskSearchIndex(ABC):
+    """
+    Full-text index over the title, description and checklist of the tasks of
+    a TaskRepository, kept up to date as the repository changes.
+    """
+    @abstractmethod
+    def watch(self, repository: TaskRepository) -> None:
+        """Index the tasks of `repository` and follow its changes from then on."""
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> list[str]:
+        """
+        Return the ids of at most `limit` tasks matching every word of `query`,
+        best match first. Words also match longer words they are a prefix of.
+        """
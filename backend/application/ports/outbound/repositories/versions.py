@@ -0,0 +1,43 @@
+import threading
+from typing import Dict, Iterable
+from uuid import uuid4
+
+_creation_lock = threading.Lock()
+
+
+class ChangeVersions:
+    """
+    Monotonic change counters of a repository, overall and per list.
+
+    A list's version is the overall version at its last change, so versions
+    never repeat within a process. They start again from zero when the process
+    restarts, which is why tags include a token drawn for each instance.
+    """
+    def __init__(self):
+        self.token = uuid4().hex[:12]
+        self.version = 0
+        self._by_list: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, repository) -> "ChangeVersions":
+        """Return the counters of a repository, creating them on first use."""
+        versions = getattr(repository, "_change_versions", None)
+        if versions is None:
+            with _creation_lock:
+                versions = getattr(repository, "_change_versions", None)
+                if versions is None:
+                    versions = repository._change_versions = cls()
+        return versions
+
+    def bump(self, list_ids: Iterable[str]) -> None:
+        """Record a change touching the given lists."""
+        with self._lock:
+            self.version += 1
+            for list_id in list_ids:
+                self._by_list[list_id] = self.version
+
+    def tag(self, list_id: str | None = None) -> str:
+        """Opaque tag of the current version of a list, or of the whole repository."""
+        version = self.version if list_id is None else self._by_list.get(list_id, 0)
+        return f"{self.token}-{version}"
@@ -8,7 +8,5 @@ class DeleteTaskListService:
         self.task_list_repository = task_list_repository
 
     def execute(self, list_id: str):
-        tasks = self.task_repository.get_by_list_id(list_id)
-        for task in tasks:
-            self.task_repository.delete(task.id)
+        self.task_repository.delete_by_list_id(list_id)
         return self.task_list_repository.delete(list_id)
\ No newline at end of file
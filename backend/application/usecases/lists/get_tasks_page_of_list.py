@@ -0,0 +1,38 @@
+import base64
+import json
+from datetime import datetime
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+
+
+class GetTasksPageOfListService:
+    """
+    Returns the tasks of a list one page at a time, ordered by
+    (order, created_at, id). The cursor is an opaque token that encodes the
+    sort key of the last task of the previous page.
+    """
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, list_id: str, limit: int, cursor: str | None = None):
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        after = decode_cursor(cursor) if cursor else None
+        # Ask for one extra task to know whether there is a next page
+        tasks: list[Task] = self.task_repository.get_page_by_list_id(list_id, limit + 1, after)
+        next_cursor = encode_cursor(tasks[limit - 1].sort_key()) if len(tasks) > limit else None
+        return tasks[:limit], next_cursor
+
+
+def encode_cursor(sort_key: tuple) -> str:
+    order, created_at, task_id = sort_key
+    payload = json.dumps([order, created_at.isoformat(), task_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        order, created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return (int(order), datetime.fromisoformat(created_at), str(task_id))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,16 @@
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+
+
+class AttachFileToTaskService:
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, task_id: str, attachment_id: str, attachment_size: int):
+        task: Task = self.task_repository.get_by_id(task_id)
+        if not task:
+            raise ValueError(f"Task with ID {task_id} does not exist.")
+        # The stored reference replaces any legacy inline attachment
+        task.update(attachment=None, attachment_id=attachment_id, attachment_size=attachment_size)
+        self.task_repository.save(task)
+        return task
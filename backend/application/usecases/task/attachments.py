@@ -0,0 +1,16 @@
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+
+
+def move_attachment_out_of_line(fields: dict, attachment_repository: AttachmentRepository | None) -> dict:
+    """
+    Store the inline `attachment` bytes of a task's fields in the attachment
+    repository and replace them with a reference (attachment_id and size).
+    Without a repository the fields are returned unchanged.
+    """
+    attachment = fields.get('attachment')
+    if not attachment or attachment_repository is None:
+        return fields
+    if not isinstance(attachment, (bytes, bytearray)):
+        raise Exception("Attachment of the Task must be bytes or bytearray")
+    attachment_id, attachment_size = attachment_repository.put(bytes(attachment))
+    return {**fields, 'attachment': None, 'attachment_id': attachment_id, 'attachment_size': attachment_size}
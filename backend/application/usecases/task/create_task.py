@@ -2,12 +2,16 @@ from datetime import datetime
 from domain.models.task import Task
 from application.ports.outbound.repositories.task_repository import TaskRepository
 from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+from application.usecases.task.attachments import move_attachment_out_of_line
 
 
 class CreateTaskService:
-    def __init__(self, task_repository: TaskRepository, task_list_repository: TaskListRepository):
+    def __init__(self, task_repository: TaskRepository, task_list_repository: TaskListRepository,
+                 attachment_repository: AttachmentRepository | None = None):
         self.task_repository = task_repository
         self.task_list_repository = task_list_repository
+        self.attachment_repository = attachment_repository
     
     def execute(self,
             title: str,
@@ -34,6 +38,7 @@ class CreateTaskService:
             done=done,
             order=order
         )
+        task.update(**move_attachment_out_of_line({'attachment': task.attachment}, self.attachment_repository))
 
         self.task_repository.save(task)
         return task
\ No newline at end of file
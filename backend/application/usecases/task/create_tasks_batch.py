@@ -0,0 +1,55 @@
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+from application.usecases.task.attachments import move_attachment_out_of_line
+
+
+class CreateTasksBatchService:
+    """
+    Creates many tasks at once. Every referenced list is looked up only once
+    and all the valid tasks are persisted with a single write.
+    Returns one result per item, in order: the created Task, or the exception
+    that prevented it from being created.
+    """
+    def __init__(self, task_repository: TaskRepository, task_list_repository: TaskListRepository,
+                 attachment_repository: AttachmentRepository | None = None):
+        self.task_repository = task_repository
+        self.task_list_repository = task_list_repository
+        self.attachment_repository = attachment_repository
+
+    def execute(self, items: list[dict]) -> list[Task | Exception]:
+        existing_lists = self._existing_lists({item.get('list_id') for item in items})
+        results: list[Task | Exception] = []
+        for item in items:
+            try:
+                if item.get('list_id') not in existing_lists:
+                    raise ValueError(f"Task list with ID {item.get('list_id')} does not exist.")
+                task = Task(
+                    title=item.get('title'),
+                    list_id=item.get('list_id'),
+                    description=item.get('description'),
+                    due_date=item.get('due_date'),
+                    attachment=item.get('attachment'),
+                    checklist=item.get('checklist') or [],
+                    owner=item.get('owner'),
+                    done=item.get('done', False),
+                    order=item.get('order', 0)
+                )
+                task.update(**move_attachment_out_of_line({'attachment': task.attachment}, self.attachment_repository))
+                results.append(task)
+            except Exception as e:
+                results.append(e)
+
+        self.task_repository.save_many([result for result in results if isinstance(result, Task)])
+        return results
+
+    def _existing_lists(self, list_ids: set) -> set:
+        existing = set()
+        for list_id in list_ids:
+            try:
+                if list_id and self.task_list_repository.get_by_id(list_id):
+                    existing.add(list_id)
+            except ValueError:
+                continue
+        return existing
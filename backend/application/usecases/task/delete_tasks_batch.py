@@ -0,0 +1,13 @@
+from application.ports.outbound.repositories.task_repository import TaskRepository
+
+
+class DeleteTasksBatchService:
+    """
+    Deletes many tasks at once with a single write.
+    Returns the ids of the tasks that existed and were deleted.
+    """
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, task_ids: list[str]) -> list[str]:
+        return self.task_repository.delete_many(task_ids)
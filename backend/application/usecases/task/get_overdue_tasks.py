@@ -0,0 +1,20 @@
+from datetime import datetime
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+
+
+class GetOverdueTasksService:
+    """
+    Returns the pending tasks whose due date has passed, across every list,
+    most overdue first. Served from the repository's due date index.
+    """
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, limit: int | None = None, now: datetime | None = None):
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive integer")
+        tasks: list[Task] = self.task_repository.query(
+            done=False, due_before=now or datetime.now(), sort="due_date", limit=limit
+        )
+        return tasks
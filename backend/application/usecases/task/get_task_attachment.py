@@ -0,0 +1,29 @@
+import base64
+import binascii
+import io
+from typing import BinaryIO
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+
+
+class GetTaskAttachmentService:
+    def __init__(self, task_repository: TaskRepository, attachment_repository: AttachmentRepository):
+        self.task_repository = task_repository
+        self.attachment_repository = attachment_repository
+
+    def execute(self, task_id: str) -> tuple[BinaryIO, int]:
+        """Return an open binary stream over the attachment of a task and its size."""
+        task: Task = self.task_repository.get_by_id(task_id)
+        if not task:
+            raise ValueError(f"Task with ID {task_id} does not exist.")
+        if task.attachment_id:
+            return self.attachment_repository.open(task.attachment_id), task.attachment_size
+        if task.attachment:
+            # Attachments created before the attachment repository are stored inline, base64 encoded
+            try:
+                content = base64.b64decode(task.attachment, validate=True)
+            except binascii.Error:
+                content = bytes(task.attachment)
+            return io.BytesIO(content), len(content)
+        raise ValueError(f"Task with ID {task_id} has no attachment.")
@@ -0,0 +1,23 @@
+from datetime import datetime, timedelta
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+
+
+class GetTasksDueSoonService:
+    """
+    Returns the pending tasks due within the next `days` days, across every
+    list, soonest first. Tasks already overdue are not included.
+    """
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, days: float, limit: int | None = None, now: datetime | None = None):
+        if days <= 0:
+            raise ValueError("days must be a positive number")
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive integer")
+        now = now or datetime.now()
+        tasks: list[Task] = self.task_repository.query(
+            done=False, due_after=now, due_before=now + timedelta(days=days), sort="due_date", limit=limit
+        )
+        return tasks
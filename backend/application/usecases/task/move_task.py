@@ -0,0 +1,50 @@
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from application.usecases.task.ordering import order_between, rebalance
+
+
+class MoveTaskService:
+    """
+    Moves a task to a list, right before or right after another task of that
+    list (at the end when no neighbour is given). The task gets an order key
+    between those of its new neighbours, so a move saves a single task; only
+    when no key is left between them is the whole list renumbered, still with
+    a single write.
+    """
+    def __init__(self, task_repository: TaskRepository, task_list_repository: TaskListRepository):
+        self.task_repository = task_repository
+        self.task_list_repository = task_list_repository
+
+    def execute(self, task_id: str, list_id: str, before_id: str | None = None, after_id: str | None = None):
+        if before_id is not None and after_id is not None:
+            raise ValueError("Give either before_id or after_id, not both")
+        if task_id in (before_id, after_id):
+            raise ValueError("A task cannot be moved next to itself")
+        task: Task = self.task_repository.get_by_id(task_id)
+        task_list = self.task_list_repository.get_by_id(list_id)
+        if not task_list:
+            raise ValueError(f"Task list with ID {list_id} does not exist.")
+
+        siblings = [sibling for sibling in self.task_repository.get_by_list_id(task_list.id) if sibling.id != task_id]
+        neighbour_id = before_id or after_id
+        if neighbour_id is None:
+            position = len(siblings)
+        else:
+            positions = [index for index, sibling in enumerate(siblings) if sibling.id == neighbour_id]
+            if not positions:
+                raise ValueError(f"Task with ID {neighbour_id} is not in list {task_list.id}.")
+            position = positions[0] if before_id else positions[0] + 1
+
+        previous = siblings[position - 1] if position > 0 else None
+        next = siblings[position] if position < len(siblings) else None
+        order = order_between(previous, next)
+        if order is not None:
+            task.update(list_id=task_list.id, order=order)
+            self.task_repository.save(task)
+            return task
+
+        task.update(list_id=task_list.id)
+        changed = rebalance(siblings[:position] + [task] + siblings[position:])
+        self.task_repository.save_many(changed if task in changed else changed + [task])
+        return task
@@ -0,0 +1,55 @@
+from datetime import datetime
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from application.usecases.task.ordering import ORDER_GAP
+
+
+class MoveTasksBatchService:
+    """
+    Moves many tasks to another list at once: the tasks with the given ids, or
+    every task of `from_list_id` matching the given filters. The target list is
+    looked up once and all the moved tasks are saved with a single write. They
+    keep their relative order and go to the end of the target list, ORDER_GAP
+    apart. Tasks already in the target list stay where they are.
+
+    Returns the moved tasks and the ids that did not exist.
+    """
+    def __init__(self, task_repository: TaskRepository, task_list_repository: TaskListRepository):
+        self.task_repository = task_repository
+        self.task_list_repository = task_list_repository
+
+    def execute(self, list_id: str, ids: list[str] | None = None, from_list_id: str | None = None,
+                done: bool | None = None, owner: str | None = None,
+                due_after: datetime | None = None, due_before: datetime | None = None) -> tuple[list[Task], list[str]]:
+        if (ids is None) == (from_list_id is None):
+            raise ValueError("Give either the ids of the tasks to move or the list to move them from")
+        if ids is not None and any(value is not None for value in (done, owner, due_after, due_before)):
+            raise ValueError("Filters only apply when moving the tasks of a list, not to given ids")
+        task_list = self.task_list_repository.get_by_id(list_id)
+        if not task_list:
+            raise ValueError(f"Task list with ID {list_id} does not exist.")
+
+        missing: list[str] = []
+        if ids is not None:
+            tasks = []
+            for task_id in dict.fromkeys(ids):
+                try:
+                    tasks.append(self.task_repository.get_by_id(task_id))
+                except ValueError:
+                    missing.append(task_id)
+            tasks.sort(key=Task.sort_key)
+        else:
+            tasks = self.task_repository.query(list_id=from_list_id, done=done, owner=owner,
+                                               due_after=due_after, due_before=due_before)
+        tasks = [task for task in tasks if task.list_id != task_list.id]
+        if not tasks:
+            return [], missing
+
+        last = self.task_repository.query(list_id=task_list.id, descending=True, limit=1)
+        order = (last[0].order or 0) if last else 0
+        for task in tasks:
+            order += ORDER_GAP
+            task.update(list_id=task_list.id, order=order)
+        self.task_repository.save_many(tasks)
+        return tasks, missing
@@ -0,0 +1,36 @@
+from domain.models.task import Task
+
+# Distance between the order keys of neighbouring tasks after a rebalance, so
+# that about ten moves can land between the same two tasks before the keys run out
+ORDER_GAP = 1024
+
+
+def order_between(previous: Task | None, next: Task | None) -> int | None:
+    """
+    Return an order key that sorts a task strictly between `previous` and
+    `next` (either may be None at the ends of a list), or None when no integer
+    is left between their keys and the list has to be rebalanced.
+    """
+    if previous is None and next is None:
+        return ORDER_GAP
+    if previous is None:
+        return (next.order or 0) - ORDER_GAP
+    if next is None:
+        return (previous.order or 0) + ORDER_GAP
+    low, high = previous.order or 0, next.order or 0
+    if high - low < 2:
+        return None
+    return (low + high) // 2
+
+
+def rebalance(tasks: list[Task]) -> list[Task]:
+    """
+    Spread the order keys of `tasks`, given in their new order, ORDER_GAP
+    apart. Returns the tasks whose key changed: the only ones to save.
+    """
+    changed = []
+    for position, task in enumerate(tasks, start=1):
+        if task.order != position * ORDER_GAP:
+            task.update(order=position * ORDER_GAP)
+            changed.append(task)
+    return changed
@@ -0,0 +1,28 @@
+from datetime import datetime
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TASK_QUERY_SORTS, TaskRepository
+
+
+class QueryTasksService:
+    """
+    Returns the tasks matching the given filters (done, owner, list and due
+    date range), sorted by one of TASK_QUERY_SORTS. The filtering is left to
+    the repository, which serves it from its indexes.
+    """
+    def __init__(self, task_repository: TaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, done: bool | None = None, owner: str | None = None, list_id: str | None = None,
+                due_after: datetime | None = None, due_before: datetime | None = None,
+                sort: str = "order", descending: bool = False, limit: int | None = None):
+        if sort not in TASK_QUERY_SORTS:
+            raise ValueError(f"Unknown sort {sort}, expected one of: {', '.join(TASK_QUERY_SORTS)}")
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive integer")
+        if due_after is not None and due_before is not None and due_after.replace(tzinfo=None) > due_before.replace(tzinfo=None):
+            raise ValueError("due_after must not be later than due_before")
+        tasks: list[Task] = self.task_repository.query(
+            done=done, owner=owner, list_id=list_id, due_after=due_after, due_before=due_before,
+            sort=sort, descending=descending, limit=limit
+        )
+        return tasks
@@ -0,0 +1,25 @@
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_search_index import TaskSearchIndex
+
+
+class SearchTasksService:
+    """
+    Returns the tasks whose title, description or checklist contain every word
+    of a query, best match first, as ranked by the search index.
+    """
+    def __init__(self, search_index: TaskSearchIndex, task_repository: TaskRepository):
+        self.search_index = search_index
+        self.task_repository = task_repository
+
+    def execute(self, query: str, limit: int = 20):
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        tasks: list[Task] = []
+        for task_id in self.search_index.search(query, limit):
+            try:
+                tasks.append(self.task_repository.get_by_id(task_id))
+            except ValueError:
+                # Deleted since the index was searched
+                continue
+        return tasks
@@ -1,15 +1,18 @@
 from datetime import datetime
 from domain.models.task import Task
 from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+from application.usecases.task.attachments import move_attachment_out_of_line
 
 
 class UpdateTaskService:
-    def __init__(self, task_repository: TaskRepository):
+    def __init__(self, task_repository: TaskRepository, attachment_repository: AttachmentRepository | None = None):
         self.task_repository = task_repository
+        self.attachment_repository = attachment_repository
     
     def execute(self, task_id: str, updates: dict):
         task: Task = self.task_repository.get_by_id(task_id)
-        task.update(**updates)
+        task.update(**move_attachment_out_of_line(updates, self.attachment_repository))
         self.task_repository.save(task)
         print("task here:", task.to_dict())
         return task
\ No newline at end of file
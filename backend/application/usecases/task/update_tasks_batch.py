@@ -0,0 +1,37 @@
+import copy
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+from application.usecases.task.attachments import move_attachment_out_of_line
+
+
+class UpdateTasksBatchService:
+    """
+    Applies many task updates at once and persists them with a single write.
+    Each update is applied to a copy of the task, so an invalid update leaves
+    the stored task untouched. Returns one result per item, in order: the
+    updated Task, or the exception that prevented the update.
+    """
+    def __init__(self, task_repository: TaskRepository, attachment_repository: AttachmentRepository | None = None):
+        self.task_repository = task_repository
+        self.attachment_repository = attachment_repository
+
+    def execute(self, updates: list[tuple[str, dict]]) -> list[Task | Exception]:
+        updated: dict[str, Task] = {}
+        results: list[Task | Exception] = []
+        for task_id, changes in updates:
+            try:
+                # Later updates of the same task build on the earlier ones
+                task = updated.get(task_id) or self.task_repository.get_by_id(task_id)
+                if not task:
+                    raise ValueError(f"Task with ID {task_id} does not exist.")
+                task = copy.copy(task)
+                task.update(**move_attachment_out_of_line(changes, self.attachment_repository))
+                updated[task_id] = task
+                results.append(task)
+            except Exception as e:
+                results.append(e)
+
+        self.task_repository.save_many(list(updated.values()))
+        # Report the final state of tasks updated more than once
+        return [updated[result.id] if isinstance(result, Task) else result for result in results]
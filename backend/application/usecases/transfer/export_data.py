@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Iterator
+from domain.models.list import TaskList
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+
+
+class ExportDataService:
+    """
+    Exports the task lists and their tasks as a stream of ("list", TaskList)
+    and ("task", Task) records: every list first, then the tasks, so that an
+    import can create the lists before the tasks that reference them.
+
+    `list_id` restricts the export to one list and its tasks; `modified_since`
+    to the tasks modified at or after that time (every selected list is still
+    exported). Tasks are read from the repository a batch at a time.
+    """
+    def __init__(self, task_repository: TaskRepository, task_list_repository: TaskListRepository):
+        self.task_repository = task_repository
+        self.task_list_repository = task_list_repository
+
+    def execute(self, list_id: str | None = None, modified_since: datetime | None = None) -> Iterator[tuple[str, TaskList | Task]]:
+        # Checked right away: the records are only produced as they are consumed
+        if list_id is not None:
+            task_list = self.task_list_repository.get_by_id(list_id)
+            if not task_list:
+                raise ValueError(f"Task list with ID {list_id} does not exist.")
+            task_lists = [task_list]
+        else:
+            task_lists = self.task_list_repository.get_all()
+        return self._records(task_lists, list_id, modified_since)
+
+    def _records(self, task_lists: list[TaskList], list_id: str | None,
+                 modified_since: datetime | None) -> Iterator[tuple[str, TaskList | Task]]:
+        for task_list in task_lists:
+            yield "list", task_list
+        for task in self.task_repository.iter_tasks(list_id=list_id, updated_since=modified_since):
+            yield "task", task
@@ -0,0 +1,87 @@
+from domain.models.list import TaskList
+from domain.models.task import Task
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+from application.usecases.task.attachments import move_attachment_out_of_line
+
+
+class ImportDataService:
+    """
+    Imports task lists and tasks, such as the records written by
+    ExportDataService, one batch of ("list" | "task", fields) records at a time.
+
+    Records keep their ids, so importing the same data again replaces what the
+    first import created instead of duplicating it. The lists of a batch are
+    saved before its tasks, and the tasks with one write, so a task may
+    reference a list of the same batch. Lists known to exist are remembered
+    across the batches of an import: every referenced list is looked up only
+    once, all the unknown ones of a batch together.
+
+    Returns one result per record, in order: the saved TaskList or Task, or the
+    exception that prevented it from being imported.
+    """
+    def __init__(self, task_repository: TaskRepository, task_list_repository: TaskListRepository,
+                 attachment_repository: AttachmentRepository | None = None):
+        self.task_repository = task_repository
+        self.task_list_repository = task_list_repository
+        self.attachment_repository = attachment_repository
+        self._known_lists: set[str] = set()
+
+    def execute(self, records: list[tuple[str, dict]]) -> list[TaskList | Task | Exception]:
+        results: list[TaskList | Task | Exception | None] = [None] * len(records)
+        task_positions = []
+        for position, (kind, fields) in enumerate(records):
+            if kind == "task":
+                task_positions.append(position)
+                continue
+            try:
+                if kind != "list":
+                    raise ValueError(f"Unknown record type: {kind}")
+                results[position] = TaskList(name=fields.get('name'), id=fields.get('id'), order=fields.get('order', 0))
+            except Exception as e:
+                results[position] = e
+
+        task_lists = self.task_list_repository.save_many(
+            [result for result in results if isinstance(result, TaskList)]
+        )
+        self._known_lists.update(task_list.id for task_list in task_lists)
+
+        referenced = {records[position][1].get('list_id') for position in task_positions}
+        self._known_lists.update(self.task_list_repository.existing_ids(referenced - self._known_lists))
+        for position in task_positions:
+            try:
+                results[position] = self._task(records[position][1])
+            except Exception as e:
+                results[position] = e
+
+        self.task_repository.save_many([result for result in results if isinstance(result, Task)])
+        return results
+
+    def _task(self, fields: dict) -> Task:
+        if fields.get('list_id') not in self._known_lists:
+            raise ValueError(f"Task list with ID {fields.get('list_id')} does not exist.")
+        attachment_id = fields.get('attachment_id')
+        if attachment_id and (self.attachment_repository is None or not self.attachment_repository.exists(attachment_id)):
+            raise ValueError(f"Attachment {attachment_id} is not in the attachment store.")
+        if isinstance(fields.get('attachment'), str):
+            # Exports hold inline attachments as the text written by Task.to_dict
+            fields = {**fields, 'attachment': fields['attachment'].encode('utf-8')}
+        # Moved before the task is built: updating the task would change its modification time
+        fields = move_attachment_out_of_line(fields, self.attachment_repository)
+        return Task(
+            id=fields.get('id'),
+            title=fields.get('title'),
+            list_id=fields.get('list_id'),
+            description=fields.get('description'),
+            due_date=fields.get('due_date'),
+            attachment=fields.get('attachment'),
+            checklist=fields.get('checklist') or [],
+            owner=fields.get('owner'),
+            done=fields.get('done', False),
+            order=fields.get('order', 0),
+            created_at=fields.get('created_at'),
+            updated_at=fields.get('updated_at'),
+            attachment_id=fields.get('attachment_id'),
+            attachment_size=fields.get('attachment_size')
+        )
@@ -0,0 +1,65 @@
+"""
+Cold-start time of JsonTaskRepository: how long it takes to load a task.json
+of a given size, comparing validated hydration (Task.from_dict, which runs
+the constructor checks) with the trusted path used by repository loads.
+The same tasks are also opened from a MmapTaskRepository, which only reads
+its offset index on startup.
+
+Run from the backend directory:
+    python -m benchmarks.cold_start [number_of_tasks ...]
+Defaults to 100000 and 1000000 tasks.
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+from benchmarks.task_memory import build_payload
+from domain.models.task import Task
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from infrastructure.repositories.mmap_task_repository import MmapTaskRepository
+
+
+def timed(function):
+    gc.collect()
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "task.json")
+            with open(file_path, "w") as f:
+                f.write(build_payload(count))
+
+            def parse():
+                with open(file_path) as f:
+                    return json.load(f)
+
+            records, parse_time = timed(parse)
+            _, validated_time = timed(lambda: [Task.from_dict(record) for record in records])
+            tasks, trusted_time = timed(lambda: [Task.from_trusted_dict(record) for record in records])
+            del records
+            mmap_path = os.path.join(directory, "task.mmap")
+            mmap_repository = MmapTaskRepository(file_path=mmap_path)
+            mmap_repository.save_many(tasks)
+            mmap_repository.close()
+            del tasks, mmap_repository
+            _, startup_time = timed(lambda: JsonTaskRepository(file_path=file_path))
+            mmap_repository, mmap_startup_time = timed(lambda: MmapTaskRepository(file_path=mmap_path))
+            mmap_repository.close()
+
+        print(f"tasks: {count}")
+        print(f"  json.load:                     {parse_time:7.3f} s")
+        print(f"  hydrate with Task.from_dict:   {validated_time:7.3f} s")
+        print(f"  hydrate with from_trusted_dict:{trusted_time:7.3f} s")
+        print(f"  JsonTaskRepository startup:    {startup_time:7.3f} s")
+        print(f"  MmapTaskRepository startup:    {mmap_startup_time:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Analytic queries over resident tasks: a Python scan of the Task objects
+against the vectorized predicates of ColumnarTaskRepository. Needs numpy.
+
+Run from the backend directory:
+    python -m benchmarks.columnar_filters [number_of_tasks]
+Defaults to 1000000 tasks.
+"""
+import gc
+import json
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from benchmarks.task_memory import build_payload
+from domain.models.task import Task
+from infrastructure.repositories.columnar_task_repository import ColumnarTaskRepository
+
+
+class _Tasks:
+    """Minimal in-memory inner repository, so only the columns are measured."""
+    def __init__(self, tasks):
+        self.tasks = tasks
+
+    def get_all(self):
+        return self.tasks
+
+
+def timed(function, repeat: int = 5):
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tasks = [Task.from_trusted_dict(record) for record in json.loads(build_payload(count))]
+    now = datetime(2024, 3, 1)
+    list_id, owner = tasks[0].list_id, tasks[0].owner
+    repository = ColumnarTaskRepository(_Tasks(tasks))
+
+    queries = {
+        "done ratio": (
+            lambda: sum(task.done for task in tasks) / len(tasks),
+            lambda: repository.done_ratio(),
+        ),
+        "overdue per list": (
+            lambda: Counter(task.list_id for task in tasks if not task.done and task.due_date and task.due_date < now),
+            lambda: repository.overdue_by_list(now),
+        ),
+        "owner counts": (
+            lambda: Counter(task.owner for task in tasks),
+            lambda: repository.owner_counts(),
+        ),
+        "filter list+owner+pending": (
+            lambda: sum(1 for task in tasks if task.list_id == list_id and task.owner == owner and not task.done),
+            lambda: repository.count(list_id=list_id, owner=owner, done=False),
+        ),
+    }
+    print(f"tasks: {count}")
+    for name, (scan, columnar) in queries.items():
+        _, scan_time = timed(scan)
+        _, columnar_time = timed(columnar)
+        print(f"  {name:26} python scan {scan_time:9.2f} ms   columnar {columnar_time:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
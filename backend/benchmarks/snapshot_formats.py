@@ -0,0 +1,47 @@
+"""
+Save and load time and file size of a task snapshot in the JSON format and
+in the binary snapshot format, through JsonTaskRepository.
+
+Run from the backend directory:
+    python -m benchmarks.snapshot_formats [number_of_tasks ...]
+Defaults to 100000 and 1000000 tasks.
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+from benchmarks.task_memory import build_payload
+from domain.models.task import Task
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+
+
+def timed(function):
+    gc.collect()
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for count in sizes:
+        tasks = [Task.from_trusted_dict(record) for record in json.loads(build_payload(count))]
+        print(f"tasks: {count}")
+        with tempfile.TemporaryDirectory() as directory:
+            for format in ("json", "binary"):
+                file_path = os.path.join(directory, f"task.{format}")
+                repository = JsonTaskRepository(file_path=file_path, format=format)
+                repository.tasks = {task.id: task for task in tasks}
+                _, save_time = timed(repository._save_to_file)
+                del repository
+                loaded, load_time = timed(lambda: JsonTaskRepository(file_path=file_path, format=format))
+                assert len(loaded.tasks) == count
+                del loaded
+                size = os.path.getsize(file_path) / 2 ** 20
+                print(f"  {format:6}  save {save_time:7.3f} s   load {load_time:7.3f} s   size {size:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
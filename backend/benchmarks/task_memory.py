@@ -0,0 +1,85 @@
+"""
+Memory used per resident task, before and after the compact Task layout.
+
+"before" rebuilds the previous layout: attributes in a per-instance __dict__
+and every identifier kept as the separate string json.loads created for it.
+"after" is the current Task, with __slots__ and interned list_id/owner.
+
+Run from the backend directory:
+    python -m benchmarks.task_memory [number_of_tasks]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from datetime import datetime
+from uuid import uuid4
+from domain.models.task import Task
+
+
+class DictTask:
+    """Attribute layout of Task before __slots__ and interning."""
+    def __init__(self, data: dict):
+        self.id = data['id']
+        self.title = data['title']
+        self.list_id = data['list_id']
+        self.description = data['description']
+        self.created_at = datetime.strptime(data['created_at'], '%Y-%m-%d')
+        self.due_date = datetime.strptime(data['due_date'], '%Y-%m-%d') if data['due_date'] else None
+        self.attachment = None
+        self.checklist = data['checklist']
+        self.owner = data['owner']
+        self.done = data['done']
+        self.order = data['order']
+        self.attachment_id = None
+        self.attachment_size = None
+
+
+def build_payload(count: int, lists: int = 20, owners: int = 50) -> str:
+    list_ids = [str(uuid4()) for _ in range(lists)]
+    owner_names = [f"user{i}@example.com" for i in range(owners)]
+    return json.dumps([
+        {
+            "id": str(uuid4()),
+            "title": f"Task {i}",
+            "list_id": list_ids[i % lists],
+            "description": "",
+            "created_at": "2024-01-01",
+            "due_date": "2024-02-01" if i % 3 == 0 else None,
+            "attachment": None,
+            "checklist": [],
+            "owner": owner_names[i % owners],
+            "done": i % 2 == 0,
+            "order": i,
+        }
+        for i in range(count)
+    ])
+
+
+def bytes_per_task(factory, payload: str, count: int) -> float:
+    """Memory still allocated once the records are parsed, hydrated and the raw records dropped."""
+    gc.collect()
+    tracemalloc.start()
+    records = json.loads(payload)
+    tasks = [factory(record) for record in records]
+    del records
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return allocated / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    payload = build_payload(count)
+    before = bytes_per_task(DictTask, payload, count)
+    after = bytes_per_task(Task.from_dict, payload, count)
+    print(f"tasks: {count}")
+    print(f"before (__dict__, no interning): {before:8.1f} bytes/task")
+    print(f"after  (__slots__, interned):    {after:8.1f} bytes/task")
+    print(f"saved: {100 * (before - after) / before:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Latency of reads served by an async app while it keeps writing to a
+JsonTaskRepository, for stores of different sizes. One coroutine saves a task
+every 50 ms (waiting as the routes do for the durability policy) while another
+reads a page of a list every 2 ms and records how late each of its reads
+completes.
+
+Compares committing on the calling thread (a flush interval of 0, which blocks
+the event loop) with the background writer thread. Every commit rewrites the
+whole snapshot, so the cost of a commit grows with the store.
+
+Run from the backend directory:
+    python -m benchmarks.write_latency [number_of_tasks ...]
+Defaults to 10000 and 100000 tasks.
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from benchmarks.task_memory import build_payload
+from domain.models.task import Task
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+
+READS = 250
+
+
+async def measure(repository: JsonTaskRepository, tasks: list) -> list:
+    reading = True
+
+    async def write():
+        i = 0
+        while reading:
+            task = tasks[i * 7919 % len(tasks)]
+            task.title = f"Edited {i}"
+            repository.save(task)
+            await repository.wait_until_durable()
+            i += 1
+            await asyncio.sleep(0.05)
+
+    async def read():
+        nonlocal reading
+        latencies = []
+        for _ in range(READS):
+            scheduled = time.perf_counter() + 0.002
+            await asyncio.sleep(0.002)
+            repository.get_page_by_list_id(tasks[0].list_id, 50)
+            latencies.append(time.perf_counter() - scheduled)
+        reading = False
+        return latencies
+
+    _, latencies = await asyncio.gather(write(), read())
+    return sorted(latencies)
+
+
+def percentile(values: list, fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1000
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    for count in sizes:
+        records = json.loads(build_payload(count))
+        print(f"tasks: {count}")
+        with tempfile.TemporaryDirectory() as directory:
+            for label, interval, durability in [("inline", 0.0, "async"),
+                                                ("writer async", 0.05, "async"),
+                                                ("writer sync", 0.05, "sync")]:
+                repository = JsonTaskRepository(file_path=os.path.join(directory, f"{interval}-{durability}.json"),
+                                                flush_interval=interval, durability=durability)
+                tasks = [Task.from_trusted_dict(record) for record in records]
+                repository.save_many(tasks)
+                repository.flush()
+                latencies = asyncio.run(measure(repository, tasks))
+                repository.close()
+                print(f"  {label:12}  read p50 {percentile(latencies, 0.5):8.2f} ms   "
+                      f"p99 {percentile(latencies, 0.99):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
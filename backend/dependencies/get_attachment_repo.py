@@ -0,0 +1,9 @@
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+from infrastructure.repositories.local_attachment_repository import LocalAttachmentRepository
+from dependencies.settings import ATTACHMENTS_DIR
+
+# Create a single instance to be reused across requests
+_attachment_repo_instance = LocalAttachmentRepository(ATTACHMENTS_DIR)
+
+def get_attachment_repository() -> AttachmentRepository:
+    return _attachment_repo_instance
\ No newline at end of file
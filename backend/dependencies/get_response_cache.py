@@ -0,0 +1,16 @@
+from fastapi import Depends
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from dependencies.get_task_list_repo import get_task_list_repository
+from dependencies.get_task_repo import get_task_repository
+from infrastructure.api.response_cache import ResponseCache
+
+# Create a single instance to be reused across requests
+_response_cache_instance = ResponseCache()
+
+def get_response_cache(task_repo: TaskRepository = Depends(get_task_repository),
+                       task_list_repo: TaskListRepository = Depends(get_task_list_repository)) -> ResponseCache:
+    # The repositories in use tell the cache which entities they change
+    _response_cache_instance.watch("task", task_repo)
+    _response_cache_instance.watch("list", task_list_repo)
+    return _response_cache_instance
@@ -0,0 +1,13 @@
+from fastapi import Depends
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_search_index import TaskSearchIndex
+from dependencies.get_task_repo import get_task_repository
+from infrastructure.repositories.inverted_search_index import InvertedSearchIndex
+
+# Create a single instance to be reused across requests; it is built on the first search
+_search_index_instance = InvertedSearchIndex()
+
+def get_search_index(task_repo: TaskRepository = Depends(get_task_repository)) -> TaskSearchIndex:
+    # Follows the changes of the repository in use
+    _search_index_instance.watch(task_repo)
+    return _search_index_instance
@@ -0,0 +1,11 @@
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from dependencies.settings import SQLITE_PATH
+
+_sqlite_database_instance: SqliteDatabase | None = None
+
+def get_sqlite_database() -> SqliteDatabase:
+    # Both SQLite repositories share one database, opened on first use
+    global _sqlite_database_instance
+    if _sqlite_database_instance is None:
+        _sqlite_database_instance = SqliteDatabase(SQLITE_PATH)
+    return _sqlite_database_instance
\ No newline at end of file
@@ -1,8 +1,20 @@
 from application.ports.outbound.repositories.task_list_repository import TaskListRepository
 from infrastructure.repositories.json_task_list_repository import JsonTaskListRepository
+from infrastructure.repositories.sqlite_task_list_repository import SqliteTaskListRepository
+from dependencies.get_sqlite_database import get_sqlite_database
+from dependencies.settings import DURABILITY, FLUSH_INTERVAL, SHARED_STORAGE, SNAPSHOT_FORMAT, STORAGE_BACKEND
+
+
+def _create_task_list_repository() -> TaskListRepository:
+    if STORAGE_BACKEND == "sqlite":
+        return SqliteTaskListRepository(get_sqlite_database())
+    if STORAGE_BACKEND in ("json", "mmap"):
+        return JsonTaskListRepository(flush_interval=FLUSH_INTERVAL, format=SNAPSHOT_FORMAT, durability=DURABILITY,
+                                      shared=SHARED_STORAGE)
+    raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND}")
 
 # Create a single instance to be reused across requests
-_task_list_repo_instance = JsonTaskListRepository()
+_task_list_repo_instance = _create_task_list_repository()
 
 def get_task_list_repository() -> TaskListRepository:
     return _task_list_repo_instance
\ No newline at end of file
@@ -1,8 +1,35 @@
 from application.ports.outbound.repositories.task_repository import TaskRepository
 from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from infrastructure.repositories.columnar_task_repository import ColumnarTaskRepository
+from infrastructure.repositories.mmap_task_repository import MmapTaskRepository
+from dependencies.get_sqlite_database import get_sqlite_database
+from dependencies.settings import (
+    COLUMNAR_TASKS, DURABILITY, FLUSH_INTERVAL, SHARED_STORAGE, SNAPSHOT_FORMAT, STORAGE_BACKEND,
+)
+
+
+def _create_task_repository() -> TaskRepository:
+    if STORAGE_BACKEND == "sqlite":
+        repository = SqliteTaskRepository(get_sqlite_database())
+    elif STORAGE_BACKEND == "json":
+        repository = JsonTaskRepository(journaled=True, flush_interval=FLUSH_INTERVAL, format=SNAPSHOT_FORMAT,
+                                        durability=DURABILITY, shared=SHARED_STORAGE)
+    elif STORAGE_BACKEND == "mmap":
+        if SHARED_STORAGE:
+            raise ValueError("Shared storage is not supported by the mmap backend")
+        repository = MmapTaskRepository(flush_interval=FLUSH_INTERVAL, durability=DURABILITY)
+    else:
+        raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND}")
+    if COLUMNAR_TASKS:
+        if SHARED_STORAGE:
+            # The columns only follow this process's writes, not those of the other workers
+            raise ValueError("Columnar tasks are not supported with shared storage")
+        repository = ColumnarTaskRepository(repository)
+    return repository
 
 # Create a single instance to be reused across requests
-_task_repo_instance = JsonTaskRepository()
+_task_repo_instance = _create_task_repository()
 
 def get_task_repository() -> TaskRepository:
     return _task_repo_instance
\ No newline at end of file
@@ -0,0 +1,35 @@
+import os
+
+# Writes made within this window (in seconds) are committed to disk together.
+# Use 0 to commit every write as soon as it happens.
+FLUSH_INTERVAL = float(os.getenv("TODO_FLUSH_INTERVAL", "0.05"))
+
+# When writes are acknowledged: "async" once applied in memory (committed by a
+# background writer within FLUSH_INTERVAL), or "sync" once committed to disk.
+# With a FLUSH_INTERVAL above 0 the event loop never waits for the disk either way.
+DURABILITY = os.getenv("TODO_DURABILITY", "async")
+
+# Storage used by the repositories: "json" (files in data/), "sqlite", or "mmap"
+# (lazily decoded, memory-mapped task file in data/; lists are kept as JSON)
+STORAGE_BACKEND = os.getenv("TODO_STORAGE_BACKEND", "json")
+
+# Let several processes (uvicorn --workers N) use the same "json" files ("1" to
+# enable). Writes lock the files and every worker applies the others' changes
+# from the task journal. The "sqlite" backend is shared already; "mmap" is not supported.
+SHARED_STORAGE = os.getenv("TODO_SHARED_STORAGE", "0") == "1"
+
+# SQLite database file; defaults to data/todo.sqlite3
+SQLITE_PATH = os.getenv("TODO_SQLITE_PATH")
+
+# Directory of the content-addressed attachment store; defaults to data/attachments
+ATTACHMENTS_DIR = os.getenv("TODO_ATTACHMENTS_DIR")
+
+
+# Keep NumPy columns of the tasks for vectorized filters and aggregates ("1" to enable; needs numpy).
+# The columns only see the writes of their own process: not supported with SHARED_STORAGE, and the
+# "sqlite" backend must then be served by a single worker.
+COLUMNAR_TASKS = os.getenv("TODO_COLUMNAR_TASKS", "0") == "1"
+
+# File format of the JSON repositories' snapshots: "json" (data/task.json) or
+# "binary" (data/task.snap); convert existing files with infrastructure.repositories.snapshot_converter
+SNAPSHOT_FORMAT = os.getenv("TODO_SNAPSHOT_FORMAT", "json")
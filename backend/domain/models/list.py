@@ -1,9 +1,15 @@
+from sys import intern
 from uuid import uuid4
 
 
 class TaskList:
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("id", "name", "order")
+
     def __init__(self, name: str, id: str = None, order: int = 0):
-        self.id = id if id else str(uuid4())
+        id = id if id else str(uuid4())
+        # Interned so the tasks of the list share the same string as their list_id
+        self.id = intern(id) if type(id) is str else id
         if name in [None, ""]:
             raise Exception("Task List name could not be empty")
         self.name = name
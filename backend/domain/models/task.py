@@ -1,7 +1,39 @@
 from datetime import datetime
+from functools import lru_cache
+from sys import intern
 from uuid import uuid4
 
+
+def _intern(value):
+    # Identifiers such as list_id and owner repeat across many tasks: share one copy
+    return intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime(value: str) -> datetime:
+    """
+    Parse a stored date. Dates repeat a lot across tasks (they are saved with
+    day precision), so parsed values are cached and shared; datetimes are immutable.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Fallback for dates without zero padding, such as 2024-1-5
+        return datetime.strptime(value, '%Y-%m-%d')
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a stored date that may carry a time; only day-precision values go through the cache."""
+    return _parse_datetime(value) if len(value) <= 10 else datetime.fromisoformat(value)
+
+
 class Task:
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "id", "title", "list_id", "description", "created_at", "due_date", "attachment",
+        "checklist", "owner", "done", "order", "attachment_id", "attachment_size", "updated_at",
+    )
+
     def __init__(
             self,
             title: str,
@@ -15,6 +47,9 @@ class Task:
             owner: str = None,
             done: bool = False,
             order: int = 0,
+            attachment_id: str | None = None,
+            attachment_size: int | None = None,
+            updated_at: datetime | None = None,
     ):
         if title in ["", None]:
             raise Exception("Title of the Task could not be empty")
@@ -23,15 +58,20 @@ class Task:
 
         self.id = id if id else str(uuid4())
         self.title = title
-        self.list_id = list_id
+        self.list_id = _intern(list_id)
         self.description = description if description else ""
         self.created_at = created_at if created_at else datetime.now()
         self.due_date = due_date if due_date else None
         self.attachment = attachment
         self.checklist = checklist if checklist else []
-        self.owner = owner if owner else 'default'
+        self.owner = _intern(owner) if owner else 'default'
         self.done = done if done else False
         self.order = order
+        # Reference to the content stored in the attachment repository
+        self.attachment_id = attachment_id
+        self.attachment_size = attachment_size
+        # Last modification; a new task was last modified when it was created
+        self.updated_at = updated_at if updated_at else self.created_at
     
     def update(self, **kwargs):
         for key, value in kwargs.items():
@@ -45,7 +85,7 @@ class Task:
                 if value in ["", None]:
                     raise Exception(f"List ID of the Task could not be empty")
             # Skip updating immutable fields
-            if key in ["created_at", "id"]:
+            if key in ["created_at", "id", "updated_at"]:
                 continue
             if key == "owner":
                 if value in ["", None]:
@@ -59,6 +99,12 @@ class Task:
             if key == "attachment":
                 if value and not isinstance(value, (bytes, bytearray)):
                     raise Exception(f"Attachment of the Task must be bytes or bytearray")
+            if key == "attachment_id":
+                if value and not isinstance(value, str):
+                    raise Exception(f"Attachment ID of the Task must be a string")
+            if key == "attachment_size":
+                if value is not None and not isinstance(value, int):
+                    raise Exception(f"Attachment size of the Task must be an integer")
             if key == "checklist":
                 if value and not isinstance(value, list):
                     raise Exception(f"Checklist of the Task must be a list")
@@ -68,44 +114,49 @@ class Task:
             if key == "description":
                 if value is None:
                     value = ""
+            if key in ["list_id", "owner"]:
+                value = _intern(value)
             setattr(self, key, value)
+        if kwargs:
+            self.updated_at = datetime.now()
     
     def mark_complete(self):
         self.done = True
+        self.updated_at = datetime.now()
     
     def mark_incomplete(self):
         self.done = False
+        self.updated_at = datetime.now()
     
     def add_item_checklist(self, item: str):
         if item in ["", None]:
             raise Exception("Checklist item could not be empty")
         self.checklist.append(item)
+        self.updated_at = datetime.now()
     
     def remove_item_from_checklist(self, item: str):
         if item in self.checklist:
             self.checklist.remove(item)
+            self.updated_at = datetime.now()
         else:
             raise Exception("Checklist item not found")
     
+    def sort_key(self) -> tuple:
+        """
+        Key that orders the tasks of a list: by order, then creation date,
+        with the id as a tie-breaker so the ordering is total.
+        """
+        return (self.order or 0, self.created_at, self.id)
+
     @staticmethod
     def from_dict(data: dict):
         if data.get('created_at'):
-            try:
-                created_at = datetime.strptime(data['created_at'], '%Y-%m-%d')
-            except ValueError:
-                # Fallback to ISO format if the simple format fails
-                created_at = datetime.fromisoformat(data['created_at'])
+            created_at = _parse_datetime(data['created_at'])
         else:
             raise ValueError("created_at is required in data")
         
-        # Parse due_date as YYYY-MM-DD format
-        due_date = None
-        if data.get('due_date'):
-            try:
-                due_date = datetime.strptime(data['due_date'], '%Y-%m-%d')
-            except ValueError:
-                # Fallback to ISO format if the simple format fails
-                due_date = datetime.fromisoformat(data['due_date'])
+        # Parse due_date as YYYY-MM-DD or ISO format
+        due_date = _parse_datetime(data['due_date']) if data.get('due_date') else None
                 
         return Task(
             title=data['title'],
@@ -118,23 +169,110 @@ class Task:
             owner=data.get('owner', 'default'),
             id=data.get('id'),
             done=data.get('done', False),
-            order=data.get('order', 0)
+            order=data.get('order', 0),
+            attachment_id=data.get('attachment_id'),
+            attachment_size=data.get('attachment_size'),
+            # Unique to the microsecond: not worth a place in the date cache
+            updated_at=datetime.fromisoformat(data['updated_at']) if data.get('updated_at') else None
         )
 
-    def to_dict(self):
+    @staticmethod
+    def from_trusted_dict(data: dict):
+        """
+        Rebuild a Task from a dictionary written by `to_dict`, e.g. when a
+        repository loads its own files. The data was validated when it was
+        saved, so the constructor checks are skipped.
+        """
+        task = object.__new__(Task)
+        task.id = data['id']
+        task.title = data['title']
+        task.list_id = _intern(data['list_id'])
+        task.description = data.get('description') or ""
+        task.created_at = _parse_timestamp(data['created_at'])
+        due_date = data.get('due_date')
+        task.due_date = _parse_datetime(due_date) if due_date else None
+        attachment = data.get('attachment')
+        task.attachment = attachment.encode('utf-8') if attachment else None
+        task.checklist = data.get('checklist') or []
+        task.owner = _intern(data.get('owner') or 'default')
+        task.done = data.get('done') or False
+        task.order = data.get('order', 0)
+        task.attachment_id = data.get('attachment_id')
+        task.attachment_size = data.get('attachment_size')
+        # Files written before modification times were kept lack it
+        updated_at = data.get('updated_at')
+        task.updated_at = datetime.fromisoformat(updated_at) if updated_at else task.created_at
+        return task
+
+    @staticmethod
+    def from_trusted_fields(id, title, list_id, description, created_at, due_date, attachment,
+                            checklist, owner, done, order, attachment_id, attachment_size, updated_at=None):
+        """
+        Rebuild a Task from already decoded field values, in `__slots__` order,
+        e.g. when a repository loads a binary snapshot. Like `from_trusted_dict`,
+        the constructor checks are skipped.
+        """
+        task = object.__new__(Task)
+        task.id = id
+        task.title = title
+        task.list_id = _intern(list_id)
+        task.description = description
+        task.created_at = created_at
+        task.due_date = due_date
+        task.attachment = attachment
+        task.checklist = checklist
+        task.owner = _intern(owner)
+        task.done = done
+        task.order = order
+        task.attachment_id = attachment_id
+        task.attachment_size = attachment_size
+        task.updated_at = updated_at or created_at
+        return task
+
+    def to_dict(self, fields: tuple[str, ...] | None = None):
         """
         Convert the Task object to a dictionary for JSON serialization.
+        When `fields` is given only those keys are built, in that order.
+        """
+        if fields is not None:
+            return {field: _SERIALIZERS[field](self) for field in check_task_fields(fields)}
+        return {field: serialize(self) for field, serialize in _SERIALIZERS.items()}
+
+    def to_stored_dict(self) -> dict:
+        """
+        Like `to_dict`, but with the full creation time, which `sort_key` orders
+        by: what repositories write to their files for `from_trusted_dict`.
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "list_id": self.list_id,
-            "description": self.description,
-            "created_at": self.created_at.strftime('%Y-%m-%d') if self.created_at else None,
-            "due_date": self.due_date.strftime('%Y-%m-%d') if self.due_date else None,
-            "attachment": self.attachment.decode('utf-8') if self.attachment else None,
-            "checklist": self.checklist,
-            "owner": self.owner,
-            "done": self.done,
-            "order": self.order
-        }
+        record = self.to_dict()
+        record["created_at"] = self.created_at.isoformat()
+        return record
+
+
+# Builds each key of Task.to_dict, in order; on its own for projections
+_SERIALIZERS = {
+    "id": lambda task: task.id,
+    "title": lambda task: task.title,
+    "list_id": lambda task: task.list_id,
+    "description": lambda task: task.description,
+    "created_at": lambda task: task.created_at.strftime('%Y-%m-%d') if task.created_at else None,
+    # Kept to the microsecond, unlike the other dates: exports filter on it
+    "updated_at": lambda task: task.updated_at.isoformat() if task.updated_at else None,
+    "due_date": lambda task: task.due_date.strftime('%Y-%m-%d') if task.due_date else None,
+    "attachment": lambda task: task.attachment.decode('utf-8') if task.attachment else None,
+    "checklist": lambda task: task.checklist,
+    "owner": lambda task: task.owner,
+    "done": lambda task: task.done,
+    "order": lambda task: task.order,
+    "attachment_id": lambda task: task.attachment_id,
+    "attachment_size": lambda task: task.attachment_size,
+}
+
+TASK_FIELDS = tuple(_SERIALIZERS)
+
+
+def check_task_fields(fields: tuple[str, ...]) -> tuple[str, ...]:
+    """Return `fields` if every one of them is a key of Task.to_dict, else raise ValueError."""
+    unknown = [field for field in fields if field not in _SERIALIZERS]
+    if unknown:
+        raise ValueError(f"Unknown task field(s): {', '.join(unknown)}")
+    return fields
@@ -0,0 +1,20 @@
+from fastapi import Request, Response, status
+
+
+def entity_tag(*versions: str) -> str:
+    """Build a strong ETag out of repository version tags."""
+    return '"' + ".".join(versions) + '"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """
+    Return a 304 response when the request's If-None-Match header already
+    names `etag`, so the caller can skip loading and encoding the body.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    tags = [tag.strip() for tag in header.split(",")]
+    if "*" in tags or etag in (tag.removeprefix("W/") for tag in tags):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
@@ -0,0 +1,19 @@
+from domain.models.task import TASK_FIELDS, check_task_fields
+
+# Default projection of collection endpoints: what a board card needs
+TASK_LIST_VIEW_FIELDS = ("id", "title", "list_id", "done", "order")
+
+# Default projection of the endpoints listing tasks by due date
+TASK_DUE_VIEW_FIELDS = TASK_LIST_VIEW_FIELDS + ("due_date",)
+
+
+def parse_task_fields(fields: str | None, default: tuple[str, ...] | None = None) -> tuple[str, ...] | None:
+    """
+    Turn a `fields=` query value such as "id,title,done" into the tuple given
+    to Task.to_dict. "all" selects every field and None means `default`.
+    """
+    if fields is None:
+        return default
+    if fields.strip() == "all":
+        return TASK_FIELDS
+    return check_task_fields(tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip())))
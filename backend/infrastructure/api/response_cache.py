@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+import json
+import threading
+import weakref
+from fastapi import Response, status
+
+
+def encode_json(content) -> bytes:
+    """Encode `content` exactly like JSONResponse does."""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def join_fragments(fragments: Iterable[bytes]) -> bytes:
+    """Assemble encoded JSON values into an encoded JSON array."""
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def data_response(data: bytes, status_code: int = status.HTTP_200_OK, headers: dict | None = None, **extra) -> Response:
+    """
+    Build the usual {"successful": true, "data": ...} response around `data`,
+    which is already encoded. `extra` keys are added after the data.
+    """
+    body = b'{"successful":true,"data":' + data
+    for key, value in extra.items():
+        body += b"," + encode_json(key) + b":" + encode_json(value)
+    return Response(content=body + b"}", status_code=status_code, headers=headers, media_type="application/json")
+
+
+class ResponseCache:
+    """
+    Cache of the encoded JSON of tasks and task lists, as the API serves them,
+    so that reads of unchanged entities skip `to_dict` and the JSON encoder.
+
+    Entries are keyed by kind ("task" or "list"), id and selected fields. The
+    repositories report the entities they save or delete through change
+    listeners (see `watch`) and every cached variant of those entities is
+    dropped. At most `max_entities` entities are kept, least recently used first out.
+    """
+    def __init__(self, max_entities: int = 100000):
+        self.max_entities = max_entities
+        self._fragments: "OrderedDict[tuple, Dict[Optional[tuple], bytes]]" = OrderedDict()
+        self._watched = {kind: weakref.WeakSet() for kind in ("task", "list")}
+        # Bumped by every invalidation: a fragment encoded meanwhile may be stale
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def watch(self, kind: str, repository) -> None:
+        """
+        Invalidate entries of `kind` whenever `repository` changes them.
+        Watching a repository for the first time drops the entries of that kind,
+        since they may have been encoded from another store.
+        """
+        with self._lock:
+            if repository in self._watched[kind]:
+                return
+            self._watched[kind].add(repository)
+            self._generation += 1
+            for key in [key for key in self._fragments if key[0] == kind]:
+                del self._fragments[key]
+        repository.add_change_listener(lambda ids: self.invalidate(kind, ids))
+
+    def fragment(self, kind: str, entity, fields: tuple[str, ...] | None = None) -> bytes:
+        """Return the encoded JSON of `entity.to_dict(fields)`, from the cache when possible."""
+        key = (kind, entity.id)
+        with self._lock:
+            variants = self._fragments.get(key)
+            if variants is not None:
+                self._fragments.move_to_end(key)
+                encoded = variants.get(fields)
+                if encoded is not None:
+                    return encoded
+            generation = self._generation
+        encoded = encode_json(entity.to_dict(fields) if fields is not None else entity.to_dict())
+        with self._lock:
+            if self._generation == generation:
+                self._fragments.setdefault(key, {})[fields] = encoded
+                self._fragments.move_to_end(key)
+                if len(self._fragments) > self.max_entities:
+                    self._fragments.popitem(last=False)
+        return encoded
+
+    def invalidate(self, kind: str, ids: Iterable[str]) -> None:
+        """Drop every cached variant of the given entities."""
+        with self._lock:
+            self._generation += 1
+            for id in ids:
+                self._fragments.pop((kind, id), None)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
 from application.usecases.lists.get_task_list import GetTaskListByIdService
@@ -9,8 +9,13 @@ from application.usecases.lists.delete_task_list import DeleteTaskListService
 from application.ports.outbound.repositories.task_list_repository import TaskListRepository
 from application.ports.outbound.repositories.task_repository import TaskRepository
 from application.usecases.lists.get_tasks_of_list import GetTasksOfListService
+from application.usecases.lists.get_tasks_page_of_list import GetTasksPageOfListService
 from dependencies.get_task_list_repo import get_task_list_repository
 from dependencies.get_task_repo import get_task_repository
+from dependencies.get_response_cache import get_response_cache
+from infrastructure.api.conditional import entity_tag, not_modified
+from infrastructure.api.fields import TASK_LIST_VIEW_FIELDS, parse_task_fields
+from infrastructure.api.response_cache import ResponseCache, data_response, join_fragments
 
 
 from infrastructure.api.schemas.lists import TaskListBaseSchema, TaskListCreateSchema, TaskListUpdateSchema
@@ -21,13 +26,18 @@ router = APIRouter(
 )
 
 @router.get("/")
-async def get_all_lists(get_task_list_repo: TaskListRepository = Depends(get_task_list_repository)):
+async def get_all_lists(request: Request,
+                        get_task_list_repo: TaskListRepository = Depends(get_task_list_repository),
+                        response_cache: ResponseCache = Depends(get_response_cache)):
     try:
+        # Taken before reading, so a concurrent change can only make the tag older than the body
+        etag = entity_tag(get_task_list_repo.version_tag())
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
         task_lists = GetAllTaskListService(get_task_list_repo).execute()
-        return JSONResponse(
-            content={"successful": True, "data": [task.to_dict() for task in task_lists]},
-            status_code=status.HTTP_200_OK
-        )
+        return data_response(join_fragments(response_cache.fragment("list", task_list) for task_list in task_lists),
+                             headers={"ETag": etag})
     except Exception as e:
         return JSONResponse(
              content={"successful": False, "error": f"Error listing: {str(e)}"},
@@ -36,13 +46,16 @@ async def get_all_lists(get_task_list_repo: TaskListRepository = Depends(get_tas
 
 
 @router.get("/{list_id}")
-async def get_list_by_id(list_id: str, get_task_list_repo: TaskListRepository = Depends(get_task_list_repository)):
+async def get_list_by_id(list_id: str, request: Request,
+                         get_task_list_repo: TaskListRepository = Depends(get_task_list_repository),
+                         response_cache: ResponseCache = Depends(get_response_cache)):
     try:
+        etag = entity_tag(get_task_list_repo.version_tag(list_id))
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
         task_list = GetTaskListByIdService(get_task_list_repo).execute(list_id)
-        return JSONResponse(
-            content={"successful": True, "data": task_list.to_dict()},
-            status_code=status.HTTP_200_OK
-        )
+        return data_response(response_cache.fragment("list", task_list), headers={"ETag": etag})
     except Exception as e:
         return JSONResponse(
              content={"successful": False, "error": f"Error getting: {str(e)}"},
@@ -51,12 +64,27 @@ async def get_list_by_id(list_id: str, get_task_list_repo: TaskListRepository =
 
 
 @router.get("/{list_id}/tasks")
-async def get_tasks_of_list(list_id: str, get_task_repo: TaskRepository = Depends(get_task_repository)):
+async def get_tasks_of_list(list_id: str, request: Request,
+                            limit: int | None = Query(None, ge=1, le=1000, description="Maximum number of tasks to return"),
+                            cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+                            fields: str | None = Query(None, description="Comma-separated task fields to return, or \"all\""),
+                            get_task_repo: TaskRepository = Depends(get_task_repository),
+                            response_cache: ResponseCache = Depends(get_response_cache)):
     try:
-        tasks = GetTasksOfListService(get_task_repo).execute(list_id)
-        return JSONResponse(
-            content={"successful": True, "data": [task.to_dict() for task in tasks]},
-            status_code=status.HTTP_200_OK
+        selected_fields = parse_task_fields(fields, default=TASK_LIST_VIEW_FIELDS)
+        etag = entity_tag(get_task_repo.version_tag(list_id))
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        if limit is None:
+            tasks = GetTasksOfListService(get_task_repo).execute(list_id)
+            return data_response(join_fragments(response_cache.fragment("task", task, selected_fields) for task in tasks),
+                                 headers={"ETag": etag})
+        tasks, next_cursor = GetTasksPageOfListService(get_task_repo).execute(list_id, limit, cursor)
+        return data_response(
+            join_fragments(response_cache.fragment("task", task, selected_fields) for task in tasks),
+            headers={"ETag": etag},
+            next_cursor=next_cursor
         )
     except Exception as e:
         return JSONResponse(
@@ -71,6 +99,7 @@ async def create_list(new_list: TaskListCreateSchema, get_task_list_repo: TaskLi
             name=new_list.name, 
             order=new_list.order
         )
+        await get_task_list_repo.wait_until_durable()
         return JSONResponse(
             content={"successful": True, "data": created_task_list.to_dict()},
             status_code=status.HTTP_201_CREATED
@@ -86,6 +115,7 @@ async def create_list(new_list: TaskListCreateSchema, get_task_list_repo: TaskLi
 async def update_list(list_id: str, updates: TaskListUpdateSchema, get_task_list_repo: TaskListRepository = Depends(get_task_list_repository)):
     try:
         updated_task_list = UpdateTaskListService(get_task_list_repo).execute(list_id, updates.model_dump(exclude_none=True))
+        await get_task_list_repo.wait_until_durable()
         return JSONResponse(
             content={"successful": True, "data": updated_task_list.to_dict()},
             status_code=status.HTTP_200_OK
@@ -103,6 +133,8 @@ async def delete_list(list_id: str,
                            ):
     try:
         DeleteTaskListService(get_task_list_repo, get_task_repository).execute(list_id)
+        await get_task_list_repo.wait_until_durable()
+        await get_task_repository.wait_until_durable()
         return JSONResponse(
             content={"successful": True, "message": "Task list deleted successfully"},
             status_code=status.HTTP_200_OK
@@ -1,17 +1,48 @@
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from datetime import datetime
+from typing import BinaryIO, Iterator
+from fastapi import APIRouter, Depends, Header, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.encoders import jsonable_encoder
 from application.usecases.task.get_task import GetTaskService
 from application.usecases.lists.get_tasks_of_list import GetTasksOfListService
 from application.usecases.task.create_task import CreateTaskService
 from application.usecases.task.update_task import UpdateTaskService
 from application.usecases.task.delete_task import DeleteTaskService
+from application.usecases.task.create_tasks_batch import CreateTasksBatchService
+from application.usecases.task.update_tasks_batch import UpdateTasksBatchService
+from application.usecases.task.delete_tasks_batch import DeleteTasksBatchService
+from application.usecases.task.attach_file_to_task import AttachFileToTaskService
+from application.usecases.task.get_task_attachment import GetTaskAttachmentService
+from application.usecases.task.query_tasks import QueryTasksService
+from application.usecases.task.get_overdue_tasks import GetOverdueTasksService
+from application.usecases.task.get_tasks_due_soon import GetTasksDueSoonService
+from application.usecases.task.search_tasks import SearchTasksService
+from application.usecases.task.move_task import MoveTaskService
+from application.usecases.task.move_tasks_batch import MoveTasksBatchService
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
 from application.ports.outbound.repositories.task_repository import TaskRepository
 from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from application.ports.outbound.repositories.task_search_index import TaskSearchIndex
 from dependencies.get_task_repo import get_task_repository
 from dependencies.get_task_list_repo import get_task_list_repository
+from dependencies.get_attachment_repo import get_attachment_repository
+from dependencies.get_response_cache import get_response_cache
+from dependencies.get_search_index import get_search_index
+from infrastructure.api.conditional import entity_tag, not_modified
+from infrastructure.api.fields import TASK_DUE_VIEW_FIELDS, TASK_LIST_VIEW_FIELDS, parse_task_fields
+from infrastructure.api.response_cache import ResponseCache, data_response, join_fragments
 
-from infrastructure.api.schemas.task import TaskCreateSchema, TaskUpdateSchema, TaskBaseSchema
+from infrastructure.api.schemas.task import (
+    TaskCreateSchema,
+    TaskUpdateSchema,
+    TaskBaseSchema,
+    TaskBatchUpdateSchema,
+    TaskBatchDeleteSchema,
+    TaskBatchMoveSchema,
+    TaskMoveSchema,
+    task_fields
+)
 
 router = APIRouter(
     prefix="/task",
@@ -19,14 +50,200 @@ router = APIRouter(
 )
 
 
-@router.get("/{task_id}")
-async def get_task(task_id: str, get_task_repo: TaskRepository = Depends(get_task_repository)):
+def _batch_results(results: list, error_prefix: str) -> list[dict]:
+    return [
+        {"successful": False, "error": f"{error_prefix}: {str(result)}"} if isinstance(result, Exception)
+        else {"successful": True, "data": result.to_dict()}
+        for result in results
+    ]
+
+
+# Batch routes are declared before "/{task_id}" so "batch" is not taken for an ID
+@router.post("/batch")
+async def create_tasks_batch(tasks: list[TaskCreateSchema],
+                             get_task_repo: TaskRepository = Depends(get_task_repository),
+                             get_task_list_repo: TaskListRepository = Depends(get_task_list_repository),
+                             get_attachment_repo: AttachmentRepository = Depends(get_attachment_repository)
+                             ):
     try:
-        task = GetTaskService(get_task_repo).execute(task_id)
+        results = CreateTasksBatchService(get_task_repo, get_task_list_repo, get_attachment_repo).execute(
+            [task_fields(task) for task in tasks]
+        )
+        await get_task_repo.wait_until_durable()
         return JSONResponse(
-            content={"successful": True, "data": task.to_dict()},
+            content={"successful": True, "data": _batch_results(results, "Error creating")},
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return JSONResponse(
+             content={"successful": False, "error": f"Error creating: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.put("/batch")
+async def update_tasks_batch(updates: list[TaskBatchUpdateSchema],
+                             get_task_repo: TaskRepository = Depends(get_task_repository),
+                             get_attachment_repo: AttachmentRepository = Depends(get_attachment_repository)
+                             ):
+    try:
+        results = UpdateTasksBatchService(get_task_repo, get_attachment_repo).execute(
+            [(update.id, task_fields(update, exclude_none=True, exclude={"id"})) for update in updates]
+        )
+        await get_task_repo.wait_until_durable()
+        return JSONResponse(
+            content={"successful": True, "data": _batch_results(results, "Error updating")},
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error updating: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.delete("/batch")
+async def delete_tasks_batch(batch: TaskBatchDeleteSchema, get_task_repo: TaskRepository = Depends(get_task_repository)):
+    try:
+        deleted = set(DeleteTasksBatchService(get_task_repo).execute(batch.ids))
+        await get_task_repo.wait_until_durable()
+        return JSONResponse(
+            content={"successful": True, "data": [
+                {"successful": True, "id": task_id} if task_id in deleted
+                else {"successful": False, "id": task_id, "error": f"Error deleting: Task with ID {task_id} does not exist."}
+                for task_id in batch.ids
+            ]},
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error deleting: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.post("/batch/move")
+async def move_tasks_batch(batch: TaskBatchMoveSchema,
+                           get_task_repo: TaskRepository = Depends(get_task_repository),
+                           get_task_list_repo: TaskListRepository = Depends(get_task_list_repository)
+                           ):
+    try:
+        moved, missing = MoveTasksBatchService(get_task_repo, get_task_list_repo).execute(
+            batch.list_id, **batch.model_dump(exclude={"list_id"}, exclude_none=True)
+        )
+        await get_task_repo.wait_until_durable()
+        return JSONResponse(
+            content={"successful": True, "data": [{"successful": True, "id": task.id} for task in moved] + [
+                {"successful": False, "id": task_id, "error": f"Error moving: Task with ID {task_id} does not exist."}
+                for task_id in missing
+            ]},
             status_code=status.HTTP_200_OK
         )
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error moving: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.get("/")
+async def query_tasks(request: Request,
+                      done: bool | None = Query(None, description="Only tasks with this status"),
+                      owner: str | None = Query(None, description="Only tasks of this owner"),
+                      list_id: str | None = Query(None, description="Only tasks of this list"),
+                      due_after: datetime | None = Query(None, description="Only tasks due at or after this date"),
+                      due_before: datetime | None = Query(None, description="Only tasks due before this date"),
+                      sort: str = Query("order", description="order, due_date or created_at"),
+                      descending: bool = Query(False, description="Reverse the sort order"),
+                      limit: int | None = Query(None, ge=1, le=1000, description="Maximum number of tasks to return"),
+                      fields: str | None = Query(None, description="Comma-separated task fields to return, or \"all\""),
+                      get_task_repo: TaskRepository = Depends(get_task_repository),
+                      response_cache: ResponseCache = Depends(get_response_cache)):
+    try:
+        selected_fields = parse_task_fields(fields, default=TASK_LIST_VIEW_FIELDS)
+        # Any change may alter the result, unless it is restricted to one list
+        etag = entity_tag(get_task_repo.version_tag(list_id))
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        tasks = QueryTasksService(get_task_repo).execute(
+            done=done, owner=owner, list_id=list_id, due_after=due_after, due_before=due_before,
+            sort=sort, descending=descending, limit=limit
+        )
+        return data_response(join_fragments(response_cache.fragment("task", task, selected_fields) for task in tasks),
+                             headers={"ETag": etag})
+    except Exception as e:
+        return JSONResponse(
+             content={"successful": False, "error": f"Error getting: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.get("/overdue")
+async def get_overdue_tasks(limit: int | None = Query(None, ge=1, le=1000, description="Maximum number of tasks to return"),
+                            fields: str | None = Query(None, description="Comma-separated task fields to return, or \"all\""),
+                            get_task_repo: TaskRepository = Depends(get_task_repository),
+                            response_cache: ResponseCache = Depends(get_response_cache)):
+    try:
+        selected_fields = parse_task_fields(fields, default=TASK_DUE_VIEW_FIELDS)
+        tasks = GetOverdueTasksService(get_task_repo).execute(limit)
+        return data_response(join_fragments(response_cache.fragment("task", task, selected_fields) for task in tasks))
+    except Exception as e:
+        return JSONResponse(
+             content={"successful": False, "error": f"Error getting: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.get("/due-soon")
+async def get_tasks_due_soon(days: float = Query(2, gt=0, le=366, description="How many days ahead to look"),
+                             limit: int | None = Query(None, ge=1, le=1000, description="Maximum number of tasks to return"),
+                             fields: str | None = Query(None, description="Comma-separated task fields to return, or \"all\""),
+                             get_task_repo: TaskRepository = Depends(get_task_repository),
+                             response_cache: ResponseCache = Depends(get_response_cache)):
+    try:
+        selected_fields = parse_task_fields(fields, default=TASK_DUE_VIEW_FIELDS)
+        tasks = GetTasksDueSoonService(get_task_repo).execute(days, limit)
+        return data_response(join_fragments(response_cache.fragment("task", task, selected_fields) for task in tasks))
+    except Exception as e:
+        return JSONResponse(
+             content={"successful": False, "error": f"Error getting: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.get("/search")
+async def search_tasks(q: str = Query(..., min_length=1, description="Words to look for in the title, description and checklist"),
+                       limit: int = Query(20, ge=1, le=100, description="Maximum number of tasks to return"),
+                       fields: str | None = Query(None, description="Comma-separated task fields to return, or \"all\""),
+                       get_task_repo: TaskRepository = Depends(get_task_repository),
+                       search_index: TaskSearchIndex = Depends(get_search_index),
+                       response_cache: ResponseCache = Depends(get_response_cache)):
+    try:
+        selected_fields = parse_task_fields(fields, default=TASK_LIST_VIEW_FIELDS)
+        tasks = SearchTasksService(search_index, get_task_repo).execute(q, limit)
+        return data_response(join_fragments(response_cache.fragment("task", task, selected_fields) for task in tasks))
+    except Exception as e:
+        return JSONResponse(
+             content={"successful": False, "error": f"Error searching: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.get("/{task_id}")
+async def get_task(task_id: str, request: Request,
+                   fields: str | None = Query(None, description="Comma-separated task fields to return, or \"all\""),
+                   get_task_repo: TaskRepository = Depends(get_task_repository),
+                   response_cache: ResponseCache = Depends(get_response_cache)):
+    try:
+        selected_fields = parse_task_fields(fields)
+        task = GetTaskService(get_task_repo).execute(task_id)
+        # A task only changes along with the version of its list
+        etag = entity_tag(get_task_repo.version_tag(task.list_id))
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        return data_response(response_cache.fragment("task", task, selected_fields), headers={"ETag": etag})
     except Exception as e:
         return JSONResponse(
              content={"successful": False, "error": f"Error getting: {str(e)}"},
@@ -38,10 +255,12 @@ async def get_task(task_id: str, get_task_repo: TaskRepository = Depends(get_tas
 @router.post("/")
 async def create_task(task: TaskCreateSchema,
                     get_task_repo: TaskRepository = Depends(get_task_repository),
-                    get_task_list_repo: TaskListRepository = Depends(get_task_list_repository)
+                    get_task_list_repo: TaskListRepository = Depends(get_task_list_repository),
+                    get_attachment_repo: AttachmentRepository = Depends(get_attachment_repository)
                     ):
     try:
-        created_task = CreateTaskService(get_task_repo, get_task_list_repo).execute(**task.model_dump())
+        created_task = CreateTaskService(get_task_repo, get_task_list_repo, get_attachment_repo).execute(**task_fields(task))
+        await get_task_repo.wait_until_durable()
         return JSONResponse(
             content={"successful": True, "data": created_task.to_dict()},
             status_code=status.HTTP_201_CREATED
@@ -54,9 +273,13 @@ async def create_task(task: TaskCreateSchema,
 
 
 @router.put('/{task_id}')
-async def update_task(task_id: str, updates: TaskUpdateSchema, get_task_repo: TaskRepository = Depends(get_task_repository)):
+async def update_task(task_id: str, updates: TaskUpdateSchema,
+                    get_task_repo: TaskRepository = Depends(get_task_repository),
+                    get_attachment_repo: AttachmentRepository = Depends(get_attachment_repository)
+                    ):
     try:
-        updated_task = UpdateTaskService(get_task_repo).execute(task_id, updates.model_dump(exclude_none=True))
+        updated_task = UpdateTaskService(get_task_repo, get_attachment_repo).execute(task_id, task_fields(updates, exclude_none=True))
+        await get_task_repo.wait_until_durable()
         return JSONResponse(
             content={"successful": True, "data": updated_task.to_dict()},
             status_code=status.HTTP_200_OK
@@ -72,6 +295,7 @@ async def update_task(task_id: str, updates: TaskUpdateSchema, get_task_repo: Ta
 async def delete_task(task_id: str, get_task_repo: TaskRepository = Depends(get_task_repository)):
     try:
         DeleteTaskService(get_task_repo).execute(task_id)
+        await get_task_repo.wait_until_durable()
         return JSONResponse(
             content={"successful": True, "message": "Task deleted successfully"},
             status_code=status.HTTP_200_OK
@@ -80,4 +304,128 @@ async def delete_task(task_id: str, get_task_repo: TaskRepository = Depends(get_
         return JSONResponse(
             content={"successful": False, "error": f"Error deleting: {str(e)}"},
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+
+@router.post('/{task_id}/move')
+async def move_task(task_id: str, move: TaskMoveSchema,
+                    get_task_repo: TaskRepository = Depends(get_task_repository),
+                    get_task_list_repo: TaskListRepository = Depends(get_task_list_repository)
+                    ):
+    try:
+        moved_task = MoveTaskService(get_task_repo, get_task_list_repo).execute(
+            task_id, move.list_id, before_id=move.before_id, after_id=move.after_id
+        )
+        await get_task_repo.wait_until_durable()
+        return JSONResponse(
+            content={"successful": True, "data": moved_task.to_dict()},
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error moving: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def _parse_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single "bytes=start-end" Range header into inclusive offsets.
+    Returns None when the whole content should be sent and raises ValueError
+    when the range cannot be satisfied.
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        # Other units and multiple ranges are not supported: send everything
+        return None
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length <= 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range {range_header}")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(f"Unsatisfiable range {range_header}")
+    return start, end
+
+
+def _read_range(stream: BinaryIO, start: int, end: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    try:
+        stream.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = stream.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        stream.close()
+
+
+@router.put("/{task_id}/attachment")
+async def upload_attachment(task_id: str, request: Request,
+                            get_task_repo: TaskRepository = Depends(get_task_repository),
+                            get_attachment_repo: AttachmentRepository = Depends(get_attachment_repository)
+                            ):
+    try:
+        GetTaskService(get_task_repo).execute(task_id)
+        # Stream the request body into the store without holding it in memory
+        writer = get_attachment_repo.open_writer()
+        try:
+            async for chunk in request.stream():
+                await run_in_threadpool(writer.write, chunk)
+            attachment_id, attachment_size = await run_in_threadpool(writer.commit)
+        except BaseException:
+            writer.abort()
+            raise
+        task = AttachFileToTaskService(get_task_repo).execute(task_id, attachment_id, attachment_size)
+        await get_task_repo.wait_until_durable()
+        return JSONResponse(
+            content={"successful": True, "data": task.to_dict()},
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error uploading: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@router.get("/{task_id}/attachment")
+async def download_attachment(task_id: str,
+                              range_header: str | None = Header(None, alias="Range"),
+                              get_task_repo: TaskRepository = Depends(get_task_repository),
+                              get_attachment_repo: AttachmentRepository = Depends(get_attachment_repository)
+                              ):
+    try:
+        stream, size = GetTaskAttachmentService(get_task_repo, get_attachment_repo).execute(task_id)
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error getting: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    try:
+        byte_range = _parse_range(range_header, size)
+    except ValueError:
+        stream.close()
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+
+    start, end = byte_range if byte_range else (0, size - 1)
+    headers = {"Accept-Ranges": "bytes", "Content-Length": str(end - start + 1)}
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        _read_range(stream, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+        media_type="application/octet-stream",
+        headers=headers
+    )
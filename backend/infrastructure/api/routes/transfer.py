@@ -0,0 +1,151 @@
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from application.usecases.transfer.export_data import ExportDataService
+from application.usecases.transfer.import_data import ImportDataService
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from dependencies.get_attachment_repo import get_attachment_repository
+from dependencies.get_task_repo import get_task_repository
+from dependencies.get_task_list_repo import get_task_list_repository
+from infrastructure.api.response_cache import encode_json
+from infrastructure.api.schemas.task import task_fields
+from infrastructure.api.schemas.transfer import ImportRecord
+
+router = APIRouter(
+    tags=["transfer"]
+)
+
+# Records encoded into each chunk of a streamed export
+EXPORT_CHUNK_RECORDS = 500
+
+# Records validated and committed together by an import
+IMPORT_BATCH_RECORDS = 5000
+
+# Errors listed in an import report; any further ones are only counted
+IMPORT_REPORTED_ERRORS = 1000
+
+# Parses and validates a line in one pass, without building intermediate dicts
+_IMPORT_RECORD = TypeAdapter(ImportRecord)
+
+
+def _ndjson(records: Iterable[tuple[str, object]]) -> Iterator[bytes]:
+    """Encode (type, entity) records as NDJSON lines, a chunk of lines at a time."""
+    lines = []
+    for kind, entity in records:
+        # Tasks with their full creation time, which orders tasks of equal order
+        data = entity.to_stored_dict() if kind == "task" else entity.to_dict()
+        lines.append(encode_json({"type": kind, "data": data}))
+        if len(lines) == EXPORT_CHUNK_RECORDS:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+@router.get("/export")
+async def export_data(list_id: str | None = Query(None, description="Only export this list and its tasks"),
+                      modified_since: datetime | None = Query(None, description="Only export tasks modified at or after this time"),
+                      get_task_repo: TaskRepository = Depends(get_task_repository),
+                      get_task_list_repo: TaskListRepository = Depends(get_task_list_repository)):
+    try:
+        records = ExportDataService(get_task_repo, get_task_list_repo).execute(list_id, modified_since)
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error exporting: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    # A plain generator: Starlette runs every step in a worker thread, so
+    # reading and encoding the store never blocks the event loop
+    return StreamingResponse(
+        _ndjson(records),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="export.ndjson"'}
+    )
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a stream of bytes into lines, keeping only the unfinished line between chunks."""
+    pending = bytearray()
+    async for chunk in chunks:
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            pending += chunk
+            continue
+        pending += chunk[:end]
+        for line in pending.split(b"\n"):
+            yield line
+        pending = bytearray(chunk[end + 1:])
+    if pending:
+        yield pending
+
+
+def _validate(line: bytes) -> tuple[str, dict]:
+    record = _IMPORT_RECORD.validate_json(line)
+    return record.type, task_fields(record.data)
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(f"{'.'.join(map(str, detail['loc'])) or 'data'}: {detail['msg']}" for detail in error.errors())
+    return str(error)
+
+
+def _import_batch(service: ImportDataService, batch: list[tuple[int, bytes]], report: dict) -> None:
+    """Validate and commit a batch of numbered NDJSON lines, adding the outcome to `report`."""
+    numbers, records, errors = [], [], []
+    for number, line in batch:
+        try:
+            records.append(_validate(line))
+            numbers.append(number)
+        except Exception as e:
+            errors.append((number, e))
+    for number, (kind, _), result in zip(numbers, records, service.execute(records)):
+        if isinstance(result, Exception):
+            errors.append((number, result))
+        else:
+            report["imported"][kind + "s"] += 1
+    report["batches"] += 1
+    report["failed"] += len(errors)
+    room = IMPORT_REPORTED_ERRORS - len(report["errors"])
+    report["errors"].extend(
+        {"line": number, "error": _error_message(error)} for number, error in sorted(errors, key=lambda item: item[0])[:room]
+    )
+
+
+# Takes an NDJSON body in the format of GET /export. The body is read as it
+# arrives and every IMPORT_BATCH_RECORDS records are validated and committed
+# together, so the batches committed before a failure stay imported.
+@router.post("/import")
+async def import_data(request: Request,
+                      get_task_repo: TaskRepository = Depends(get_task_repository),
+                      get_task_list_repo: TaskListRepository = Depends(get_task_list_repository),
+                      get_attachment_repo: AttachmentRepository = Depends(get_attachment_repository)):
+    try:
+        service = ImportDataService(get_task_repo, get_task_list_repo, get_attachment_repo)
+        report = {"lines": 0, "batches": 0, "imported": {"lists": 0, "tasks": 0}, "failed": 0, "errors": []}
+        batch = []
+        async for line in _lines(request.stream()):
+            report["lines"] += 1
+            if line.strip():
+                batch.append((report["lines"], line))
+            if len(batch) == IMPORT_BATCH_RECORDS:
+                await run_in_threadpool(_import_batch, service, batch, report)
+                batch = []
+        if batch:
+            await run_in_threadpool(_import_batch, service, batch, report)
+        await get_task_list_repo.wait_until_durable()
+        await get_task_repo.wait_until_durable()
+        return JSONResponse(
+            content={"successful": True, "data": report},
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return JSONResponse(
+            content={"successful": False, "error": f"Error importing: {str(e)}"},
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
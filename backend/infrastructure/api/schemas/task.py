@@ -38,3 +38,31 @@ class TaskUpdateSchema(BaseModel):
     done: Optional[bool] = Field(None, example=False)
     order: Optional[int] = Field(None, example=1, description="Order/position of the task in the list")
 
+class TaskBatchUpdateSchema(TaskUpdateSchema):
+    id: str = Field(..., example="123e4567-e89b-12d3-a456-426614174000")
+
+class TaskBatchDeleteSchema(BaseModel):
+    ids: list[str] = Field(..., example=["123e4567-e89b-12d3-a456-426614174000"])
+
+class TaskMoveSchema(BaseModel):
+    list_id: str = Field(..., example="123e4567-e89b-12d3-a456-426614174000")
+    before_id: Optional[str] = Field(None, description="Place the task right before this task of the list")
+    after_id: Optional[str] = Field(None, description="Place the task right after this task of the list")
+
+class TaskBatchMoveSchema(BaseModel):
+    list_id: str = Field(..., example="123e4567-e89b-12d3-a456-426614174000", description="List to move the tasks to")
+    ids: Optional[list[str]] = Field(None, description="Tasks to move; leave out to move the tasks matching the filters")
+    from_list_id: Optional[str] = Field(None, description="Move the tasks of this list that match the filters below")
+    done: Optional[bool] = None
+    owner: Optional[str] = None
+    due_after: Optional[datetime] = None
+    due_before: Optional[datetime] = None
+
+
+def task_fields(schema: BaseModel, **dump_options) -> dict:
+    """The fields of a validated task schema as the use cases take them."""
+    # model_dump encodes Base64Bytes back to base64; the use cases expect the raw bytes
+    fields = schema.model_dump(**dump_options)
+    if "attachment" in fields:
+        fields["attachment"] = schema.attachment
+    return fields
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Literal, Optional, Union
+from infrastructure.api.schemas.lists import TaskListCreateSchema
+from infrastructure.api.schemas.task import TaskCreateSchema
+from infrastructure.repositories.task_query import naive
+
+class TaskListImportSchema(TaskListCreateSchema):
+    id: Optional[str] = Field(None, example="123e4567-e89b-12d3-a456-426614174000", description="Kept by the imported list; a list with the same ID is replaced")
+
+class TaskImportSchema(TaskCreateSchema):
+    # Written by GET /export as the text of Task.to_dict, not as base64
+    attachment: Optional[str] = Field(None, example="Sample attachment data")
+    id: Optional[str] = Field(None, example="123e4567-e89b-12d3-a456-426614174000", description="Kept by the imported task; a task with the same ID is replaced")
+    created_at: Optional[datetime] = Field(None, example="2023-12-31")
+    updated_at: Optional[datetime] = Field(None, example="2023-12-31T10:30:00")
+    attachment_id: Optional[str] = Field(None, description="Attachment already in the attachment store")
+    attachment_size: Optional[int] = Field(None, example=1024)
+
+    @field_validator("created_at", "updated_at")
+    @classmethod
+    def _in_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # Stored times are naive, and sort_key compares creation times
+        if value is None or value.tzinfo is None:
+            return value
+        return naive(value.astimezone(timezone.utc))
+
+class TaskListImportRecord(BaseModel):
+    type: Literal["list"]
+    data: TaskListImportSchema
+
+class TaskImportRecord(BaseModel):
+    type: Literal["task"]
+    data: TaskImportSchema
+
+# One line of an NDJSON import, as written by GET /export
+ImportRecord = Annotated[Union[TaskListImportRecord, TaskImportRecord], Field(discriminator="type")]
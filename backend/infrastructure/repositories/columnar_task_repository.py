@@ -0,0 +1,273 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+import threading
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from domain.models.task import Task
+from infrastructure.repositories.task_query import matcher, select
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only this repository needs it
+    np = None
+
+
+_EPOCH = datetime(1970, 1, 1)
+# Stored in the date columns for tasks without a due date
+_NO_DATE = -(2 ** 63)
+
+
+def _to_seconds(value: Optional[datetime]) -> int:
+    """Seconds since the epoch of a naive datetime, or the missing-date marker."""
+    if value is None:
+        return _NO_DATE
+    return (value.replace(tzinfo=None) - _EPOCH) // timedelta(seconds=1)
+
+
+class _Dictionary:
+    """Dictionary encoding of a string column: every distinct value gets a small integer code."""
+    def __init__(self):
+        self.values: List[Optional[str]] = [None]
+        self.codes: Dict[Optional[str], int] = {None: 0}
+
+    def encode(self, value: Optional[str]) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: Optional[str]) -> int:
+        """Code of `value`, or -1 when it never appeared in the column."""
+        return self.codes.get(value, -1)
+
+
+class ColumnarTaskRepository(TaskRepository):
+    """
+    TaskRepository that keeps the analytic fields of every task in NumPy
+    columns next to another repository, which still stores the tasks.
+
+    `done` is a boolean mask, `due_date` and `created_at` are int64 seconds
+    since the epoch, `order` is an int64 column and `list_id` and `owner` are
+    dictionary encoded. Filters and aggregates are evaluated with vectorized
+    predicates over those columns instead of iterating `Task` objects.
+
+    Rows freed by deletions are reused by later saves. Requires numpy.
+    """
+    def __init__(self, inner: TaskRepository, capacity: int = 1024):
+        if np is None:
+            raise ImportError("ColumnarTaskRepository requires numpy (pip install numpy)")
+        self.inner = inner
+        self._lock = threading.RLock()
+        self._list_ids = _Dictionary()
+        self._owners = _Dictionary()
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._allocate(capacity)
+        self._load(inner.get_all())
+
+    def _allocate(self, capacity: int):
+        self._alive = np.zeros(capacity, dtype=np.bool_)
+        self._done = np.zeros(capacity, dtype=np.bool_)
+        self._due = np.full(capacity, _NO_DATE, dtype=np.int64)
+        self._created = np.zeros(capacity, dtype=np.int64)
+        self._order = np.zeros(capacity, dtype=np.int64)
+        self._list_code = np.zeros(capacity, dtype=np.int32)
+        self._owner_code = np.zeros(capacity, dtype=np.int32)
+
+    def _grow(self, needed: int):
+        """Double the capacity of every column until `needed` rows fit."""
+        capacity = len(self._alive)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_alive", "_done", "_due", "_created", "_order", "_list_code", "_owner_code"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            if name == "_due":
+                grown.fill(_NO_DATE)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+    def _load(self, tasks: List[Task]):
+        """Fill the columns from scratch; used once with the tasks of the inner repository."""
+        count = len(tasks)
+        self._grow(count)
+        self._ids = [task.id for task in tasks]
+        self._rows = {task.id: row for row, task in enumerate(tasks)}
+        self._alive[:count] = True
+        self._done[:count] = np.fromiter((bool(task.done) for task in tasks), dtype=np.bool_, count=count)
+        self._due[:count] = np.fromiter((_to_seconds(task.due_date) for task in tasks), dtype=np.int64, count=count)
+        self._created[:count] = np.fromiter((_to_seconds(task.created_at) for task in tasks), dtype=np.int64, count=count)
+        self._order[:count] = np.fromiter((task.order or 0 for task in tasks), dtype=np.int64, count=count)
+        self._list_code[:count] = np.fromiter((self._list_ids.encode(task.list_id) for task in tasks), dtype=np.int32, count=count)
+        self._owner_code[:count] = np.fromiter((self._owners.encode(task.owner) for task in tasks), dtype=np.int32, count=count)
+
+    def _put(self, task: Task):
+        """Write the analytic fields of a task into its row, allocating one if needed."""
+        row = self._rows.get(task.id)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+                self._ids[row] = task.id
+            else:
+                row = len(self._ids)
+                self._grow(row + 1)
+                self._ids.append(task.id)
+            self._rows[task.id] = row
+        self._alive[row] = True
+        self._done[row] = bool(task.done)
+        self._due[row] = _to_seconds(task.due_date)
+        self._created[row] = _to_seconds(task.created_at)
+        self._order[row] = task.order or 0
+        self._list_code[row] = self._list_ids.encode(task.list_id)
+        self._owner_code[row] = self._owners.encode(task.owner)
+
+    def _remove(self, id: str):
+        row = self._rows.pop(id, None)
+        if row is not None:
+            self._alive[row] = False
+            self._ids[row] = None
+            self._free_rows.append(row)
+
+    def _mask(self, done: Optional[bool] = None, list_id: Optional[str] = None, owner: Optional[str] = None,
+              due_before: Optional[datetime] = None, due_after: Optional[datetime] = None):
+        """Boolean mask over the rows of the live tasks matching every given predicate."""
+        size = len(self._ids)
+        mask = self._alive[:size].copy()
+        if done is not None:
+            mask &= self._done[:size] == done
+        if list_id is not None:
+            mask &= self._list_code[:size] == self._list_ids.lookup(list_id)
+        if owner is not None:
+            mask &= self._owner_code[:size] == self._owners.lookup(owner)
+        if due_before is not None or due_after is not None:
+            mask &= self._due[:size] != _NO_DATE
+        if due_before is not None:
+            mask &= self._due[:size] < _to_seconds(due_before)
+        if due_after is not None:
+            mask &= self._due[:size] >= _to_seconds(due_after)
+        return mask
+
+    def _codes_to_counts(self, dictionary: _Dictionary, codes) -> Dict[Optional[str], int]:
+        counts = np.bincount(codes, minlength=len(dictionary.values))
+        return {dictionary.values[code]: int(count) for code, count in enumerate(counts) if count}
+
+    def filter_ids(self, **predicates) -> List[str]:
+        """
+        Ids of the tasks matching every given predicate (done, list_id, owner,
+        due_before, due_after), ordered by order and then created_at.
+        """
+        with self._lock:
+            rows = np.flatnonzero(self._mask(**predicates))
+            rows = rows[np.lexsort((self._created[rows], self._order[rows]))]
+            return [self._ids[row] for row in rows]
+
+    def filter(self, **predicates) -> List[Task]:
+        """Tasks matching every given predicate; see `filter_ids`."""
+        return [self.inner.get_by_id(id) for id in self.filter_ids(**predicates)]
+
+    def count(self, **predicates) -> int:
+        """Number of tasks matching every given predicate; see `filter_ids`."""
+        with self._lock:
+            return int(np.count_nonzero(self._mask(**predicates)))
+
+    def done_ratio(self, list_id: Optional[str] = None) -> float:
+        """Share of done tasks, overall or within a list. 0.0 when there are no tasks."""
+        with self._lock:
+            mask = self._mask(list_id=list_id)
+            total = np.count_nonzero(mask)
+            if not total:
+                return 0.0
+            return float(np.count_nonzero(mask & self._done[:len(mask)]) / total)
+
+    def overdue_by_list(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Number of pending tasks past their due date, per list id."""
+        now = now or datetime.now()
+        with self._lock:
+            mask = self._mask(done=False, due_before=now)
+            return self._codes_to_counts(self._list_ids, self._list_code[:len(mask)][mask])
+
+    def owner_counts(self, **predicates) -> Dict[Optional[str], int]:
+        """Number of tasks per owner, optionally restricted by the `filter_ids` predicates."""
+        with self._lock:
+            mask = self._mask(**predicates)
+            return self._codes_to_counts(self._owners, self._owner_code[:len(mask)][mask])
+
+    def save(self, task: Task) -> Task:
+        with self._lock:
+            task = self.inner.save(task)
+            self._put(task)
+        return task
+
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        with self._lock:
+            tasks = self.inner.save_many(tasks)
+            for task in tasks:
+                self._put(task)
+        return tasks
+
+    def get_by_id(self, id: str) -> Optional[Task]:
+        return self.inner.get_by_id(id)
+
+    def get_all(self) -> List[Task]:
+        return self.inner.get_all()
+
+    def delete(self, id: str) -> None:
+        with self._lock:
+            self.inner.delete(id)
+            self._remove(id)
+
+    def delete_many(self, ids: List[str]) -> List[str]:
+        with self._lock:
+            deleted = self.inner.delete_many(ids)
+            for id in deleted:
+                self._remove(id)
+        return deleted
+
+    def delete_by_list_id(self, list_id: str) -> int:
+        with self._lock:
+            count = self.inner.delete_by_list_id(list_id)
+            rows = np.flatnonzero(self._mask(list_id=list_id))
+            for row in rows:
+                self._remove(self._ids[row])
+        return count
+
+    def get_by_list_id(self, list_id: str) -> List[Task]:
+        return self.inner.get_by_list_id(list_id)
+
+    def get_page_by_list_id(self, list_id: str, limit: int, after: tuple | None = None) -> List[Task]:
+        return self.inner.get_page_by_list_id(list_id, limit, after)
+
+    def query(self, done: Optional[bool] = None, owner: Optional[str] = None, list_id: Optional[str] = None,
+              due_after: Optional[datetime] = None, due_before: Optional[datetime] = None,
+              sort: str = "order", descending: bool = False, limit: Optional[int] = None) -> List[Task]:
+        """
+        Get the tasks matching every given filter; see `TaskRepository.query`.
+        The filters are evaluated over the columns, and only the matching tasks
+        are fetched from the inner repository.
+        """
+        matches = matcher()
+        return select(self.filter(done=done, list_id=list_id, owner=owner, due_before=due_before, due_after=due_after),
+                      matches, sort, descending, limit)
+
+    def iter_tasks(self, list_id: Optional[str] = None, updated_since: Optional[datetime] = None,
+                   batch_size: int = 1000) -> Iterator[Task]:
+        return self.inner.iter_tasks(list_id, updated_since, batch_size)
+
+    def add_change_listener(self, listener) -> None:
+        # Every write goes through the inner repository
+        self.inner.add_change_listener(listener)
+
+    def version_tag(self, list_id: str | None = None) -> str:
+        return self.inner.version_tag(list_id)
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+    async def wait_until_durable(self) -> None:
+        await self.inner.wait_until_durable()
+
+    def close(self) -> None:
+        self.inner.close()
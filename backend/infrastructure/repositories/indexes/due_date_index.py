@@ -0,0 +1,84 @@
+from bisect import bisect_left, insort
+from heapq import merge
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from domain.models.task import Task
+from infrastructure.repositories.task_query import naive
+
+
+class DueDateIndex:
+    """
+    Index of the tasks that have a due date, kept sorted by (done, due_date, id)
+    like SQLite's index on (done, due_date): the pending and the completed tasks
+    due within a range are each found with binary searches, so looking for
+    pending tasks never steps over completed ones. Time zones are dropped from
+    the dates, like the other indexes of dates do. Remembers the key each task
+    was indexed under, so a task whose due date or state was changed in place
+    is re-indexed correctly when it is saved again.
+    """
+    def __init__(self):
+        self._keys: List[Tuple[bool, datetime, str]] = []
+        self._indexed: Dict[str, Tuple[bool, datetime, str]] = {}
+
+    @staticmethod
+    def _key(task: Task) -> Optional[Tuple[bool, datetime, str]]:
+        return (bool(task.done), naive(task.due_date), task.id) if task.due_date is not None else None
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """Index every task at once, sorting a single time (used on load)."""
+        self.clear()
+        for task in tasks:
+            key = self._key(task)
+            if key is not None:
+                self._indexed[task.id] = key
+        self._keys = sorted(self._indexed.values())
+
+    def add(self, task: Task) -> None:
+        """Index a new task or re-index one whose due date or state may have changed."""
+        key = self._key(task)
+        if self._indexed.get(task.id) == key:
+            return
+        self.remove(task.id)
+        if key is not None:
+            insort(self._keys, key)
+            self._indexed[task.id] = key
+
+    def remove(self, task_id: str) -> None:
+        """Drop a task from the index. Unknown ids are ignored."""
+        key = self._indexed.pop(task_id, None)
+        if key is not None:
+            del self._keys[bisect_left(self._keys, key)]
+
+    def _bounds(self, done: bool, after: Optional[datetime], before: Optional[datetime]) -> Tuple[int, int]:
+        start = bisect_left(self._keys, (done, naive(after)) if after is not None else (done,))
+        # (done + 1,) sorts after every key of this state
+        end = bisect_left(self._keys, (done, naive(before)) if before is not None else (done + 1,))
+        return start, max(start, end)
+
+    def range(self, after: Optional[datetime] = None, before: Optional[datetime] = None,
+              done: Optional[bool] = None) -> List[str]:
+        """
+        Return the ids of the tasks due on or after `after` and before `before`,
+        by due date, only those that are (not) done when `done` is given.
+        Costs O(log n + k) for k tasks in the range.
+        """
+        segments = []
+        for state in ((False, True) if done is None else (done,)):
+            start, end = self._bounds(state, after, before)
+            segments.append(self._keys[start:end])
+        if len(segments) == 1:
+            return [key[2] for key in segments[0]]
+        return [key[2] for key in merge(*segments, key=lambda key: key[1:])]
+
+    def count(self, after: Optional[datetime] = None, before: Optional[datetime] = None,
+              done: Optional[bool] = None) -> int:
+        """Number of tasks due within the range, only those that are (not) done when `done` is given, in O(log n)."""
+        total = 0
+        for state in ((False, True) if done is None else (done,)):
+            start, end = self._bounds(state, after, before)
+            total += end - start
+        return total
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._indexed.clear()
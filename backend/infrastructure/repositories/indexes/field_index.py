@@ -0,0 +1,51 @@
+from typing import Callable, Dict, Hashable, Iterable, Set
+from domain.models.task import Task
+
+
+class FieldIndex:
+    """
+    Secondary index from the value of a task field (as returned by `value_of`)
+    to the ids of the tasks holding that value. Like `ListIndex`, it remembers
+    the value each task was indexed under, so a task changed in place is
+    re-indexed correctly when it is saved again.
+    """
+    def __init__(self, value_of: Callable[[Task], Hashable]):
+        self.value_of = value_of
+        self._ids: Dict[Hashable, Set[str]] = {}
+        self._indexed: Dict[str, Hashable] = {}
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        self.clear()
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: Task) -> None:
+        """Index a new task or re-index one whose value may have changed."""
+        value = self.value_of(task)
+        if task.id in self._indexed:
+            if self._indexed[task.id] == value:
+                return
+            self.remove(task.id)
+        self._ids.setdefault(value, set()).add(task.id)
+        self._indexed[task.id] = value
+
+    def remove(self, task_id: str) -> None:
+        """Drop a task from the index. Unknown ids are ignored."""
+        if task_id not in self._indexed:
+            return
+        value = self._indexed.pop(task_id)
+        ids = self._ids[value]
+        ids.discard(task_id)
+        if not ids:
+            del self._ids[value]
+
+    def get(self, value: Hashable) -> Set[str]:
+        """Return the ids of the tasks holding `value`, in no particular order."""
+        return self._ids.get(value, set())
+
+    def count(self, value: Hashable) -> int:
+        return len(self._ids.get(value, ()))
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._indexed.clear()
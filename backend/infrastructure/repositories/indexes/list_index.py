@@ -0,0 +1,74 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Tuple
+from domain.models.task import Task
+
+
+class ListIndex:
+    """
+    Secondary index from list id to the tasks in that list, kept sorted by
+    `Task.sort_key()`, i.e. by (order, created_at, id).
+    Remembers the key each task was indexed under, so a task that was moved or
+    reordered in place is re-indexed correctly when it is saved again.
+    """
+    def __init__(self):
+        self._keys: Dict[str, List[tuple]] = {}
+        self._indexed: Dict[str, Tuple[str, tuple]] = {}
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """Index every task at once, sorting each list a single time (used on load)."""
+        self.clear()
+        for task in tasks:
+            entry = (task.list_id, task.sort_key())
+            self._keys.setdefault(entry[0], []).append(entry[1])
+            self._indexed[task.id] = entry
+        for keys in self._keys.values():
+            keys.sort()
+
+    def add(self, task: Task) -> None:
+        """Index a new task or re-index a task whose list or position may have changed."""
+        self.add_key(task.id, task.list_id, task.sort_key())
+
+    def add_key(self, task_id: str, list_id: str, key: tuple) -> None:
+        """Like `add`, for a task known only by its id, list id and sort key."""
+        entry = (list_id, key)
+        if self._indexed.get(task_id) == entry:
+            return
+        self.remove(task_id)
+        insort(self._keys.setdefault(list_id, []), key)
+        self._indexed[task_id] = entry
+
+    def entry(self, task_id: str) -> Tuple[str, tuple] | None:
+        """Return the (list_id, sort_key) a task is indexed under, or None."""
+        return self._indexed.get(task_id)
+
+    def remove(self, task_id: str) -> None:
+        """Drop a task from the index. Unknown ids are ignored."""
+        entry = self._indexed.pop(task_id, None)
+        if entry is None:
+            return
+        list_id, key = entry
+        keys = self._keys[list_id]
+        del keys[bisect_left(keys, key)]
+        if not keys:
+            del self._keys[list_id]
+
+    def get(self, list_id: str) -> List[str]:
+        """Return the ids of the tasks that belong to a list, in order."""
+        return [key[-1] for key in self._keys.get(list_id, ())]
+
+    def count(self, list_id: str) -> int:
+        """Number of tasks in a list."""
+        return len(self._keys.get(list_id, ()))
+
+    def page(self, list_id: str, limit: int, after: tuple | None = None) -> List[str]:
+        """
+        Return at most `limit` task ids of a list, in order, starting right
+        after the sort key `after`. Costs O(log n + limit).
+        """
+        keys = self._keys.get(list_id, [])
+        start = bisect_right(keys, after) if after is not None else 0
+        return [key[-1] for key in keys[start:start + limit]]
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._indexed.clear()
@@ -0,0 +1,127 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from sys import intern
+from typing import Iterable, Iterator, List, Optional, Tuple
+import mmap
+import struct
+from infrastructure.repositories.persistence import write_atomically
+
+_MAGIC = b"TODOIDX1"
+# magic, data file token, data size covered, superseded records, rows, id width, list id width
+_HEADER = struct.Struct("<8s16sQQQHH")
+_POSITION = struct.Struct("<I")
+
+_EPOCH = datetime(1970, 1, 1)
+
+# (task_id, payload offset, payload length, list_id, sort_key)
+Entry = Tuple[str, int, int, str, tuple]
+
+
+def to_microseconds(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_microseconds(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class OffsetIndex:
+    """
+    Read-only index from task id to the location of its record in a data file,
+    stored as fixed-width rows and read through a memory map.
+
+    Rows are sorted by id and followed by the row numbers sorted by
+    (list_id, order, created_at, id), so both a lookup by id and the tasks of a
+    list are found with binary searches. Opening the index does not depend on
+    how many tasks it holds.
+    """
+    def __init__(self, file_path):
+        with open(file_path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < _HEADER.size:
+                raise ValueError(f"{file_path} is not a task index")
+            magic, self.token, self.data_size, self.dead, self.count, id_width, list_width = \
+                _HEADER.unpack_from(self._map, 0)
+            self._row = struct.Struct(f"<{id_width}sQI{list_width}sqq")
+            self._id_width = id_width
+            self._list_width = list_width
+            self._positions_start = _HEADER.size + self.count * self._row.size
+            if magic != _MAGIC or len(self._map) != self._positions_start + self.count * _POSITION.size:
+                raise ValueError(f"{file_path} is not a task index")
+        except BaseException:
+            self._map.close()
+            raise
+
+    @staticmethod
+    def write(file_path, token: bytes, data_size: int, dead: int, entries: List[Entry]) -> None:
+        """Write an index of `entries` over the first `data_size` bytes of a data file."""
+        encoded = sorted((id.encode('utf-8'), offset, length, list_id.encode('utf-8'), key[0], to_microseconds(key[1]))
+                         for id, offset, length, list_id, key in entries)
+        id_width = max((len(row[0]) for row in encoded), default=0)
+        list_width = max((len(row[3]) for row in encoded), default=0)
+        row = struct.Struct(f"<{id_width}sQI{list_width}sqq")
+        content = bytearray(_HEADER.pack(_MAGIC, token, data_size, dead, len(encoded), id_width, list_width))
+        for values in encoded:
+            content += row.pack(*values)
+        list_order = sorted(range(len(encoded)), key=lambda i: (encoded[i][3], encoded[i][4], encoded[i][5], encoded[i][0]))
+        content += struct.pack(f"<{len(list_order)}I", *list_order)
+        write_atomically(file_path, bytes(content))
+
+    def close(self) -> None:
+        self._map.close()
+
+    def _unpack(self, row: int) -> Tuple[bytes, int, int, bytes, int, int]:
+        return self._row.unpack_from(self._map, _HEADER.size + row * self._row.size)
+
+    def _id_at(self, row: int) -> bytes:
+        return self._unpack(row)[0]
+
+    def _list_key_at(self, position: int) -> tuple:
+        row, = _POSITION.unpack_from(self._map, self._positions_start + position * _POSITION.size)
+        id, _, _, list_id, order, created_at = self._unpack(row)
+        return (list_id, order, created_at, id)
+
+    def _entry(self, values: tuple) -> Entry:
+        id, offset, length, list_id, order, created_at = values
+        id = id.rstrip(b"\0").decode('utf-8')
+        list_id = intern(list_id.rstrip(b"\0").decode('utf-8'))
+        return (id, offset, length, list_id, (order, from_microseconds(created_at), id))
+
+    def _find_row(self, id: str) -> Optional[Tuple[bytes, int, int, bytes, int, int]]:
+        padded = id.encode('utf-8').ljust(self._id_width, b"\0")
+        row = bisect_left(range(self.count), padded, key=self._id_at)
+        if row < self.count and self._id_at(row) == padded:
+            return self._unpack(row)
+        return None
+
+    def find(self, id: str) -> Optional[Tuple[int, int]]:
+        """Return the (offset, length) of the record of a task, or None."""
+        values = self._find_row(id)
+        return (values[1], values[2]) if values else None
+
+    def list_id_of(self, id: str) -> Optional[str]:
+        """Return the list id a task is indexed under, or None."""
+        values = self._find_row(id)
+        return values[3].rstrip(b"\0").decode('utf-8') if values else None
+
+    def list_entries(self, list_id: str, after: tuple | None = None) -> Iterator[Entry]:
+        """Yield the entries of a list in (order, created_at, id) order, starting right after `after`."""
+        padded = list_id.encode('utf-8').ljust(self._list_width, b"\0")
+        positions = range(self.count)
+        if after is None:
+            start = bisect_left(positions, (padded,), key=self._list_key_at)
+        else:
+            key = (padded, after[0], to_microseconds(after[1]), after[2].encode('utf-8').ljust(self._id_width, b"\0"))
+            start = bisect_right(positions, key, key=self._list_key_at)
+        end = bisect_left(positions, (padded + b"\xff",), key=self._list_key_at)
+        for position in range(start, end):
+            row, = _POSITION.unpack_from(self._map, self._positions_start + position * _POSITION.size)
+            yield self._entry(self._unpack(row))
+
+    def entries(self) -> Iterable[Entry]:
+        """Yield every entry, in id order."""
+        for row in range(self.count):
+            yield self._entry(self._unpack(row))
@@ -0,0 +1,191 @@
+from bisect import bisect_left, insort
+from collections import Counter
+from heapq import nlargest
+from math import log
+from typing import Dict, List, Optional
+import re
+import threading
+import unicodedata
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from application.ports.outbound.repositories.task_search_index import TaskSearchIndex
+from domain.models.task import Task
+
+_WORD = re.compile(r"\w+")
+
+# How much an occurrence of a word counts, by the field it occurs in
+FIELD_WEIGHTS = {"title": 3.0, "checklist": 2.0, "description": 1.0}
+
+# Shorter words of a query only match whole words: a one-letter prefix would
+# expand to a large part of the vocabulary
+MIN_PREFIX_LENGTH = 2
+
+# Matching a word by prefix scores less than matching it whole
+PREFIX_FACTOR = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words without accents, so "Canción" matches "cancion"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return _WORD.findall("".join(char for char in decomposed if not unicodedata.combining(char)))
+
+
+def _weighted_words(task: Task) -> Counter:
+    words = Counter()
+    for word in tokenize(task.title):
+        words[word] += FIELD_WEIGHTS["title"]
+    for word in tokenize(task.description or ""):
+        words[word] += FIELD_WEIGHTS["description"]
+    for item in task.checklist or ():
+        for word in tokenize(str(item)):
+            words[word] += FIELD_WEIGHTS["checklist"]
+    return words
+
+
+class InvertedSearchIndex(TaskSearchIndex):
+    """
+    In-process inverted index: every word maps to the tasks containing it and
+    its weight in each (occurrences weighted by field, see FIELD_WEIGHTS). The
+    vocabulary is also kept sorted, so the words starting with a prefix are
+    found with a binary search.
+
+    A query finds the tasks containing every one of its words, whole or as a
+    prefix, and ranks them by the sum of the matched weights, each scaled by
+    how rare the word is (inverse document frequency). Its cost depends on the
+    postings of the words of the query, not on the number of tasks.
+
+    The index follows one repository at a time through its change listeners:
+    every save or delete re-indexes only the tasks involved.
+    """
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        # Words each task is indexed under, to drop them when it changes
+        self._words_of: Dict[str, List[str]] = {}
+        self._repository: Optional[TaskRepository] = None
+        # Ids changed while the watched repository is being indexed, or None
+        self._changed_while_building: Optional[set] = None
+        self._lock = threading.Lock()
+
+    def watch(self, repository: TaskRepository) -> None:
+        """
+        Index every task of `repository` and follow its changes. Watching another
+        repository replaces the contents of the index; watching the same one
+        again does nothing.
+        """
+        with self._lock:
+            if repository is self._repository:
+                return
+            self._repository = repository
+            self._changed_while_building = set()
+            self._clear()
+        repository.add_change_listener(lambda ids: self._on_change(repository, ids))
+        tasks = repository.get_all()
+        with self._lock:
+            if repository is self._repository:
+                # The listener already indexed the latest version of the tasks changed meanwhile
+                for task in tasks:
+                    if task.id not in self._changed_while_building:
+                        self._add(task)
+                self._changed_while_building = None
+
+    def _on_change(self, repository: TaskRepository, ids: List[str]) -> None:
+        tasks = {}
+        for id in dict.fromkeys(ids):
+            try:
+                tasks[id] = repository.get_by_id(id)
+            except ValueError:
+                tasks[id] = None
+        with self._lock:
+            if repository is not self._repository:
+                return
+            if self._changed_while_building is not None:
+                self._changed_while_building.update(tasks)
+            for id, task in tasks.items():
+                self._remove(id)
+                if task is not None:
+                    self._add(task)
+
+    def add(self, task: Task) -> None:
+        """Index a task, replacing what was indexed for it before."""
+        with self._lock:
+            self._remove(task.id)
+            self._add(task)
+
+    def remove(self, task_id: str) -> None:
+        """Drop a task from the index. Unknown ids are ignored."""
+        with self._lock:
+            self._remove(task_id)
+
+    def _add(self, task: Task) -> None:
+        words = _weighted_words(task)
+        for word, weight in words.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                insort(self._vocabulary, word)
+            postings[task.id] = weight
+        self._words_of[task.id] = list(words)
+
+    def _remove(self, task_id: str) -> None:
+        for word in self._words_of.pop(task_id, ()):
+            postings = self._postings[word]
+            del postings[task_id]
+            if not postings:
+                del self._postings[word]
+                del self._vocabulary[bisect_left(self._vocabulary, word)]
+
+    def _clear(self) -> None:
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._words_of.clear()
+
+    def _expand(self, term: str) -> List[str]:
+        """The indexed words `term` matches: itself and, if long enough, the words it is a prefix of."""
+        if len(term) < MIN_PREFIX_LENGTH:
+            return [term] if term in self._postings else []
+        words = []
+        for position in range(bisect_left(self._vocabulary, term), len(self._vocabulary)):
+            word = self._vocabulary[position]
+            if not word.startswith(term):
+                break
+            words.append(word)
+        return words
+
+    def _scores(self, term: str, words: List[str], candidates: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """
+        Score of the tasks containing any of `words`, the matches of `term`.
+        With `candidates`, only those tasks are scored, looking them up in the
+        postings when there are fewer candidates than postings.
+        """
+        count = len(self._words_of)
+        scores: Dict[str, float] = {}
+        for word in words:
+            postings = self._postings[word]
+            factor = log(1 + count / len(postings)) * (1.0 if word == term else PREFIX_FACTOR)
+            if candidates is not None and len(candidates) < len(postings):
+                matched = ((task_id, postings[task_id]) for task_id in candidates if task_id in postings)
+            else:
+                matched = postings.items()
+            for task_id, weight in matched:
+                if candidates is not None and task_id not in candidates:
+                    continue
+                score = weight * factor
+                if score > scores.get(task_id, 0.0):
+                    scores[task_id] = score
+        return scores
+
+    def search(self, query: str, limit: int) -> List[str]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            expanded = [(term, self._expand(term)) for term in terms]
+            # Every term must match: score the rarest first, then only the tasks still in the running
+            expanded.sort(key=lambda item: sum(len(self._postings[word]) for word in item[1]))
+            totals = None
+            for term, words in expanded:
+                scores = self._scores(term, words, totals)
+                totals = scores if totals is None else {task_id: totals[task_id] + score for task_id, score in scores.items()}
+                if not totals:
+                    return []
+        return [task_id for task_id, _ in nlargest(limit, totals.items(), key=lambda item: (item[1], item[0]))]
@@ -0,0 +1,171 @@
+from typing import Iterable, Iterator
+import json
+import os
+import threading
+from infrastructure.repositories.persistence import FileLock, write_atomically
+
+
+class Journal:
+    """
+    Append-only log of repository mutations.
+    Every record is written as a single JSON line, so appending costs the same
+    no matter how many entities the repository holds.
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.record_count = 0
+
+    def append(self, record: dict) -> None:
+        """Append a single mutation record to the log."""
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[dict]) -> None:
+        """Append several mutation records to the log with one durable write."""
+        lines = [json.dumps(record, separators=(',', ':')) + '\n' for record in records]
+        if not lines:
+            return
+        with open(self.file_path, 'a') as f:
+            f.write(''.join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        self.record_count += len(lines)
+
+    def replay(self) -> Iterator[dict]:
+        """
+        Yield every record stored in the log, oldest first.
+        A torn last line (left by a crash in the middle of a write) is cut off
+        so that new records are not appended to it.
+        """
+        self.record_count = 0
+        if not os.path.exists(self.file_path):
+            return
+        valid_size = 0
+        with open(self.file_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"Error replaying journal record: {e}")
+                    break
+                valid_size += len(line)
+                self.record_count += 1
+                yield record
+        if valid_size < os.path.getsize(self.file_path):
+            os.truncate(self.file_path, valid_size)
+
+    def truncate(self) -> None:
+        """Drop every record, typically right after a snapshot was written."""
+        with open(self.file_path, 'w'):
+            pass
+        self.record_count = 0
+
+
+class SharedJournal(Journal):
+    """
+    Journal appended to by several processes at once, e.g. uvicorn workers.
+
+    Appends are made while holding `lock` exclusively, right after reading the
+    records other processes appended, so every process sees the same records in
+    the same order. Each process remembers how far it has read and only reads
+    what was appended since. Appends are not fsynced one by one: call `sync`.
+
+    `truncate` replaces the file with a new, empty one rather than emptying it
+    in place, so the other processes can tell (`replaced`) that the records
+    they had not read yet went into a snapshot.
+    """
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.lock = FileLock(f"{file_path}.lock")
+        self.offset = 0
+        self._appender = None
+        self._reader = None
+        self._inode = None
+        # `sync` may run on a writer thread while the files are being reopened
+        self._files_lock = threading.Lock()
+
+    def _open(self) -> None:
+        with self._files_lock:
+            self._close_files()
+            self._appender = open(self.file_path, 'ab')
+            self._reader = open(self.file_path, 'rb')
+        self._inode = os.fstat(self._appender.fileno()).st_ino
+        self.offset = 0
+        self.record_count = 0
+
+    def _close_files(self) -> None:
+        for f in (self._appender, self._reader):
+            if f is not None:
+                f.close()
+        self._appender = self._reader = None
+
+    def replay(self) -> Iterator[dict]:
+        """Yield every record from the start of the log. Call while holding `lock`."""
+        self._open()
+        return self.read_new()
+
+    def changed(self) -> bool:
+        """Tell, without locking, whether another process appended to or replaced the log."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return True
+        return stat.st_ino != self._inode or stat.st_size != self.offset
+
+    def replaced(self) -> bool:
+        """Tell whether the log was replaced since it was opened. Call while holding `lock`."""
+        try:
+            return os.stat(self.file_path).st_ino != self._inode
+        except FileNotFoundError:
+            return True
+
+    def read_new(self) -> Iterator[dict]:
+        """
+        Yield the complete records appended since the last read. Call while
+        holding `lock`. A torn last line is left in place; `discard_torn_tail`
+        drops it once the lock is held exclusively.
+        """
+        self._reader.seek(self.offset)
+        for line in self._reader:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"Error reading journal record: {e}")
+                break
+            self.offset += len(line)
+            self.record_count += 1
+            yield record
+
+    def discard_torn_tail(self) -> None:
+        """Cut off whatever follows the last complete record. Call while holding `lock` exclusively."""
+        if os.fstat(self._appender.fileno()).st_size > self.offset:
+            os.truncate(self.file_path, self.offset)
+
+    def append_many(self, records: Iterable[dict]) -> None:
+        """Append records right after the last one read. Call while holding `lock` exclusively."""
+        data = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records).encode('utf-8')
+        if not data:
+            return
+        self._appender.write(data)
+        self._appender.flush()
+        self.offset += len(data)
+        self.record_count += data.count(b'\n')
+
+    def sync(self) -> None:
+        """Make the appended records durable."""
+        with self._files_lock:
+            if self._appender is not None:
+                os.fsync(self._appender.fileno())
+
+    def truncate(self) -> None:
+        """Replace the log with an empty one. Call while holding `lock` exclusively."""
+        write_atomically(self.file_path, b"")
+        self._open()
+
+    def close(self) -> None:
+        with self._files_lock:
+            self._close_files()
+        self.lock.close()
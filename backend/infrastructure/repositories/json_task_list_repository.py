@@ -1,52 +1,159 @@
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
 import json
 import os
+import threading
 from pathlib import Path
 from application.ports.outbound.repositories.task_list_repository import TaskListRepository
 from domain.models.list import TaskList
+from infrastructure.repositories.persistence import FileLock, GroupCommit, write_atomically
+from infrastructure.repositories.snapshot_codec import decode_task_lists, encode_task_lists, is_snapshot
 from uuid import uuid4
 
 class JsonTaskListRepository(TaskListRepository):
     """
     JSON file-based implementation of TaskListRepository.
     Stores task lists in a JSON file for persistence across application restarts.
+
+    Writes made within `flush_interval` seconds of each other are committed
+    together by a background writer thread; call `flush` or `close` to commit
+    them right away. `durability` ("async" or "sync") decides whether
+    `wait_until_durable` returns at once or once the changes are committed.
+
+    With `format="binary"` the file is written with the binary snapshot codec
+    instead of JSON. Either format is recognised on load.
+
+    With `shared=True` several processes can use the same file. Each write
+    rewrites it under an exclusive file lock, after loading it again if another
+    process changed it, and reads load it again when it changed. Task lists are
+    few, so the whole file is read rather than a journal.
     """
-    def __init__(self, file_path=None):
+    def __init__(self, file_path=None, flush_interval: float = 0.0, format: str = "json", durability: str = "async",
+                 shared: bool = False):
+        if format not in ("json", "binary"):
+            raise ValueError(f"Unknown snapshot format: {format}")
         # Default file path is in the data directory
         if file_path is None:
             # Create data directory if it doesn't exist
             data_dir = Path(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data'))
             data_dir.mkdir(exist_ok=True)
-            file_path = data_dir / 'task_lists.json'
+            file_path = data_dir / ('task_lists.snap' if format == "binary" else 'task_lists.json')
         
         self.file_path = file_path
+        self.format = format
         self.task_lists: Dict[str, TaskList] = {}
+        self._lock = threading.RLock()
+        self._writing_depth = 0
+        self.shared = shared
+        self._file_lock = FileLock(f"{file_path}.lock") if shared else None
+        # Identity of the file as this process last loaded or wrote it
+        self._signature = None
+        # Shared writes must reach the file before the lock is released, so they are not grouped
+        self._group_commit = GroupCommit(self._save_to_file, 0.0 if shared else flush_interval, durability)
+        if shared:
+            with self._file_lock.shared():
+                self._load_from_file()
+        else:
+            self._load_from_file()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _refresh(self):
+        """In shared mode, load the file again if another process changed it."""
+        if not self.shared or self._file_signature() == self._signature:
+            return
+        with self._lock:
+            if self._writing_depth:
+                return
+            with self._file_lock.shared():
+                self._refresh_locked()
+
+    def _refresh_locked(self):
+        if self._file_signature() == self._signature:
+            return
+        previous = {id: task_list.to_dict() for id, task_list in self.task_lists.items()}
+        self.task_lists = {}
         self._load_from_file()
+        changed = [
+            id for id in previous.keys() | self.task_lists.keys()
+            if id not in self.task_lists or previous.get(id) != self.task_lists[id].to_dict()
+        ]
+        self._notify_change(changed)
+
+    @contextmanager
+    def _writing(self):
+        """Hold the repository for a write; in shared mode, also the file lock, with the file loaded afresh."""
+        with self._lock:
+            if self.shared and not self._writing_depth:
+                with self._file_lock.exclusive():
+                    self._refresh_locked()
+                    self._writing_depth += 1
+                    try:
+                        yield
+                    finally:
+                        self._writing_depth -= 1
+                return
+            self._writing_depth += 1
+            try:
+                yield
+            finally:
+                self._writing_depth -= 1
     
     def _load_from_file(self):
-        """Load task lists from the JSON file."""
+        """Load task lists from the file, in either format."""
+        self._signature = self._file_signature()
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                # Convert the JSON data back to TaskList objects
-                for task_list_data in data:
-                    task_list = TaskList.from_dict(task_list_data)
+                with open(self.file_path, 'rb') as f:
+                    data = f.read()
+
+                if is_snapshot(data):
+                    task_lists = decode_task_lists(data)
+                else:
+                    # Convert the JSON data back to TaskList objects
+                    task_lists = [TaskList.from_dict(task_list_data) for task_list_data in json.loads(data)]
+                for task_list in task_lists:
                     self.task_lists[task_list.id] = task_list
-            except (json.JSONDecodeError, KeyError) as e:
+            except (ValueError, KeyError) as e:
                 print(f"Error loading task lists from file: {e}")
                 # If there's an error, start with an empty dictionary
                 self.task_lists = {}
     
     def _save_to_file(self):
-        """Save task lists to the JSON file."""
-        # Convert TaskList objects to dictionaries
-        data = [task_list.to_dict() for task_list in self.task_lists.values()]
-        
-        # Save to file
-        with open(self.file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Save task lists to the file, replacing it atomically."""
+        # Encoded outside the lock, so writers are not held up meanwhile
+        with self._lock:
+            task_lists = list(self.task_lists.values())
+        if self.format == "binary":
+            write_atomically(self.file_path, encode_task_lists(task_lists))
+        else:
+            # Convert TaskList objects to dictionaries
+            data = [task_list.to_dict() for task_list in task_lists]
+            write_atomically(self.file_path, json.dumps(data, indent=2))
+        if self.shared:
+            self._signature = self._file_signature()
+
+    def flush(self) -> None:
+        """Commit every pending change right away."""
+        self._group_commit.flush()
+
+    async def wait_until_durable(self) -> None:
+        await self._group_commit.durable()
+
+    def close(self) -> None:
+        """Commit every pending change; called on application shutdown."""
+        self._group_commit.close()
+        if self.shared:
+            self._file_lock.close()
+
+    def version_tag(self, list_id: str | None = None) -> str:
+        self._refresh()
+        return super().version_tag(list_id)
 
     def save(self, task_list: TaskList) -> TaskList:
         """
@@ -57,14 +164,29 @@ class JsonTaskListRepository(TaskListRepository):
         if not hasattr(task_list, 'id') or not task_list.id:
             task_list.id = str(uuid4())
 
-        # Store the task list
-        self.task_lists[task_list.id] = task_list
-        
-        # Save to file
-        self._save_to_file()
+        # Store the task list and save to file
+        with self._writing():
+            self.task_lists[task_list.id] = task_list
+            self._group_commit.request()
+            self._notify_change([task_list.id])
         
         return task_list
 
+    def save_many(self, task_lists: List[TaskList]) -> List[TaskList]:
+        """
+        Save several task lists, persisting all of them with a single write.
+        Task lists without an ID get one generated.
+        """
+        with self._writing():
+            for task_list in task_lists:
+                if not task_list.id:
+                    task_list.id = str(uuid4())
+                self.task_lists[task_list.id] = task_list
+            if task_lists:
+                self._group_commit.request()
+                self._notify_change([task_list.id for task_list in task_lists])
+        return task_lists
+
     def update(self, task_list: TaskList) -> TaskList:
         """
         Update a task list in the JSON file.
@@ -73,13 +195,13 @@ class JsonTaskListRepository(TaskListRepository):
         if not hasattr(task_list, 'id') or not task_list.id:
             raise ValueError("TaskList must have an ID to be updated.")
         
-        if task_list.id not in self.task_lists:
-            raise ValueError(f"TaskList with ID {task_list.id} does not exist.")
-        
-        self.task_lists[task_list.id] = task_list
-        
-        # Save to file
-        self._save_to_file()
+        # Store the task list and save to file
+        with self._writing():
+            if task_list.id not in self.task_lists:
+                raise ValueError(f"TaskList with ID {task_list.id} does not exist.")
+            self.task_lists[task_list.id] = task_list
+            self._group_commit.request()
+            self._notify_change([task_list.id])
         
         return task_list
 
@@ -88,15 +210,22 @@ class JsonTaskListRepository(TaskListRepository):
         get a task by its ID.
         Returns None if no task is found.
         """
+        self._refresh()
         result = self.task_lists.get(list_id)
         if not result:
             raise ValueError(f"TaskList with ID {list_id} does not exist.")
         return result
     
+    def existing_ids(self, list_ids: Iterable[str]) -> set[str]:
+        """Return which of `list_ids` belong to stored task lists."""
+        self._refresh()
+        return {list_id for list_id in list_ids if list_id in self.task_lists}
+
     def get_all(self) -> List[TaskList]:
         """
         Return all tasks in the repository.
         """
+        self._refresh()
         return list(self.task_lists.values())
     
     def delete(self, id: str) -> None:
@@ -104,7 +233,9 @@ class JsonTaskListRepository(TaskListRepository):
         Delete a task list by its ID.
         If the task list doesn't exist, do nothing.
         """
-        if id in self.task_lists:
-            del self.task_lists[id]
-            # Save to file after deletion
-            self._save_to_file()
\ No newline at end of file
+        with self._writing():
+            if id in self.task_lists:
+                del self.task_lists[id]
+                # Save to file after deletion
+                self._group_commit.request()
+                self._notify_change([id])
\ No newline at end of file
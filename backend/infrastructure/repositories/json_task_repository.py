@@ -1,53 +1,296 @@
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from application.ports.outbound.repositories.task_repository import TaskRepository
 from domain.models.task import Task
+from infrastructure.repositories.indexes.due_date_index import DueDateIndex
+from infrastructure.repositories.indexes.field_index import FieldIndex
+from infrastructure.repositories.indexes.list_index import ListIndex
+from infrastructure.repositories.journal import Journal, SharedJournal
+from infrastructure.repositories.persistence import GroupCommit, write_atomically
+from infrastructure.repositories.snapshot_codec import decode_tasks, encode_tasks, is_snapshot
+from infrastructure.repositories.task_query import matcher, naive, select
 from uuid import uuid4
 
 class JsonTaskRepository(TaskRepository):
     """
     JSON file-based implementation of TaskRepository.
     Stores tasks in a JSON file for persistence across application restarts.
+
+    In journaled mode every mutation is appended to a log next to the JSON
+    snapshot instead of rewriting the whole file. On startup the snapshot is
+    loaded and the log replayed on top of it; once the log reaches
+    `compact_threshold` records it is folded back into the snapshot.
+
+    Writes made within `flush_interval` seconds of each other are committed
+    together by a background writer thread; call `flush` or `close` to commit
+    them right away. `durability` ("async" or "sync") decides whether
+    `wait_until_durable` returns at once or once the changes are committed.
+
+    With `format="binary"` the snapshot is written with the binary snapshot
+    codec instead of JSON. Either format is recognised on load.
+
+    With `shared=True` (which implies a journal) several processes can use the
+    same files, e.g. uvicorn workers. Every write appends to the journal under
+    an exclusive file lock, after applying what the other processes appended,
+    and reads first apply any records appended since the last look. Only a
+    compaction, which replaces the journal, makes the others load the snapshot
+    again.
     """
-    def __init__(self, file_path=None):
+    def __init__(self, file_path=None, journaled: bool = False, compact_threshold: int = 10000,
+                 flush_interval: float = 0.0, format: str = "json", durability: str = "async",
+                 shared: bool = False):
+        if format not in ("json", "binary"):
+            raise ValueError(f"Unknown snapshot format: {format}")
         # Default file path is in the data directory
         if file_path is None:
             # Create data directory if it doesn't exist
             data_dir = Path(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data'))
             data_dir.mkdir(exist_ok=True)
-            file_path = data_dir / 'task.json'
+            file_path = data_dir / ('task.snap' if format == "binary" else 'task.json')
         
         self.file_path = file_path
+        self.format = format
         self.tasks: Dict[str, Task] = {}
+        self.list_index = ListIndex()
+        self.owner_index = FieldIndex(lambda task: task.owner)
+        self.done_index = FieldIndex(lambda task: bool(task.done))
+        self.due_index = DueDateIndex()
+        self.compact_threshold = compact_threshold
+        self.shared = shared
+        if shared:
+            self.journal = SharedJournal(f"{file_path}.log")
+        else:
+            self.journal = Journal(f"{file_path}.log") if journaled else None
+        self._pending_records: List[dict] = []
+        self._lock = threading.RLock()
+        # How many `_writing` blocks the thread holding `_lock` is in
+        self._writing_depth = 0
+        self._group_commit = GroupCommit(self._commit, flush_interval, durability)
+        if shared:
+            with self.journal.lock.shared():
+                self._load()
+        else:
+            self._load()
+
+    def _load(self):
+        """Load the snapshot and replay the journal on top of it."""
+        self.tasks = {}
+        self._clear_indexes()
         self._load_from_file()
+        if self.journal:
+            self._replay_journal()
     
     def _load_from_file(self):
-        """Load tasks from the JSON file."""
+        """Load tasks from the snapshot file, in either format."""
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                # Convert the JSON data back to Task objects
-                for task_data in data:
-                    task = Task.from_dict(task_data)
+                with open(self.file_path, 'rb') as f:
+                    data = f.read()
+
+                if is_snapshot(data):
+                    tasks = decode_tasks(data)
+                else:
+                    # Convert the JSON data back to Task objects; the file was written
+                    # by this repository, so the trusted hydration path is used
+                    tasks = [Task.from_trusted_dict(task_data) for task_data in json.loads(data)]
+                del data
+                for task in tasks:
                     self.tasks[task.id] = task
-            except (json.JSONDecodeError, KeyError) as e:
+                self._rebuild_indexes()
+            except (ValueError, KeyError) as e:
                 print(f"Error loading tasks from file: {e}")
                 # If there's an error, start with an empty dictionary
                 self.tasks = {}
+                self._clear_indexes()
     
     def _save_to_file(self):
-        """Save tasks to the JSON file."""
+        """Save tasks to the snapshot file, replacing it atomically."""
+        # Only the references are copied under the lock: encoding takes time in
+        # proportion to the store and must not hold up writers meanwhile
+        with self._lock:
+            tasks = list(self.tasks.values())
+        if self.format == "binary":
+            write_atomically(self.file_path, encode_tasks(tasks))
+            return
+
         # Convert Task objects to dictionaries
-        data = [task.to_dict() for task in self.tasks.values()]
+        data = [task.to_stored_dict() for task in tasks]
         
         # Save to file
-        with open(self.file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_atomically(self.file_path, json.dumps(data, indent=2))
+
+    def _replay_journal(self):
+        """Apply the mutations recorded in the journal on top of the loaded snapshot."""
+        self._apply_records(self.journal.replay())
+        # A shared journal is compacted by the next write, which holds the lock exclusively
+        if not self.shared and self.journal.record_count >= self.compact_threshold:
+            self.compact()
+
+    def _apply_records(self, records: Iterable[dict]) -> tuple[List[str], set]:
+        """Apply journal records in memory; returns the ids of the tasks and lists they touched."""
+        ids, list_ids = [], set()
+        for record in records:
+            if record['op'] == 'save':
+                task = Task.from_trusted_dict(record['task'])
+                list_ids |= self._indexed_list_ids([task.id]) | {task.list_id}
+                ids.append(task.id)
+                self._put(task)
+            elif record['op'] == 'delete':
+                list_ids |= self._indexed_list_ids([record['id']])
+                ids.append(record['id'])
+                self._remove(record['id'])
+            elif record['op'] == 'delete_list':
+                list_ids.add(record['list_id'])
+                for task_id in self.list_index.get(record['list_id']):
+                    ids.append(task_id)
+                    self._remove(task_id)
+        return ids, list_ids
+
+    def _catch_up(self):
+        """In shared mode, apply what other processes wrote since the last look."""
+        if not self.shared or not self.journal.changed():
+            return
+        with self._lock:
+            if self._writing_depth:
+                # This thread holds the lock exclusively and is up to date already
+                return
+            with self.journal.lock.shared():
+                self._catch_up_locked()
+
+    def _catch_up_locked(self):
+        if self.journal.replaced():
+            # Another process compacted the journal into the snapshot
+            ids = set(self.tasks)
+            list_ids = {task.list_id for task in self.tasks.values()}
+            self._load()
+            ids.update(self.tasks)
+            list_ids.update(task.list_id for task in self.tasks.values())
+            self._notify_change(list(ids), list_ids)
+        else:
+            self._notify_change(*self._apply_records(self.journal.read_new()))
+
+    @contextmanager
+    def _writing(self):
+        """
+        Hold the repository for a write. In shared mode the journal is also locked
+        exclusively and caught up with the other processes first.
+        """
+        with self._lock:
+            if not self.shared or self._writing_depth:
+                self._writing_depth += 1
+                try:
+                    yield
+                finally:
+                    self._writing_depth -= 1
+                return
+            with self.journal.lock.exclusive():
+                self._catch_up_locked()
+                self.journal.discard_torn_tail()
+                self._writing_depth += 1
+                try:
+                    yield
+                finally:
+                    self._writing_depth -= 1
+
+    def _rebuild_indexes(self):
+        self.list_index.rebuild(self.tasks.values())
+        self.owner_index.rebuild(self.tasks.values())
+        self.done_index.rebuild(self.tasks.values())
+        self.due_index.rebuild(self.tasks.values())
+
+    def _clear_indexes(self):
+        for index in (self.list_index, self.owner_index, self.done_index, self.due_index):
+            index.clear()
+
+    def _put(self, task: Task):
+        """Store a task in memory and keep the indexes up to date."""
+        self.tasks[task.id] = task
+        self.list_index.add(task)
+        self.owner_index.add(task)
+        self.done_index.add(task)
+        self.due_index.add(task)
+
+    def _remove(self, id: str):
+        """Remove a task from memory and from the indexes."""
+        self.tasks.pop(id, None)
+        for index in (self.list_index, self.owner_index, self.done_index, self.due_index):
+            index.remove(id)
+
+    def _indexed_list_ids(self, ids: List[str]) -> set:
+        """The lists the given tasks are currently indexed under."""
+        entries = (self.list_index.entry(id) for id in ids)
+        return {entry[0] for entry in entries if entry is not None}
+
+    def _persist(self, records: List[dict]):
+        """Queue a set of mutations to be committed with the next group commit."""
+        if not records:
+            return
+        if self.shared:
+            # Appended right away, while the journal is locked; the commit only fsyncs
+            self.journal.append_many(records)
+        elif self.journal:
+            with self._lock:
+                self._pending_records.extend(records)
+        self._group_commit.request()
+
+    def _commit(self):
+        """
+        Commit the queued mutations: append them to the journal when journaled,
+        otherwise rewrite the whole JSON file.
+        """
+        if not self.journal:
+            self._save_to_file()
+            return
+        if self.shared:
+            self.journal.sync()
+            if self.journal.record_count >= self.compact_threshold:
+                self.compact()
+            return
+        with self._lock:
+            records, self._pending_records = self._pending_records, []
+        try:
+            self.journal.append_many(records)
+        except BaseException:
+            # Put back ahead of the newer records, so the retry appends them in order
+            with self._lock:
+                self._pending_records[:0] = records
+            raise
+        if self.journal.record_count >= self.compact_threshold:
+            self.compact()
+
+    def compact(self):
+        """Fold the journal into the JSON snapshot and start a new, empty log."""
+        if self.shared:
+            # The other processes must not append until the new log is in place
+            with self._writing():
+                self._save_to_file()
+                self.journal.truncate()
+            return
+        self._save_to_file()
+        if self.journal:
+            self.journal.truncate()
+
+    def flush(self) -> None:
+        """Commit every pending mutation right away."""
+        self._group_commit.flush()
+
+    async def wait_until_durable(self) -> None:
+        await self._group_commit.durable()
+
+    def close(self) -> None:
+        """Commit every pending mutation; called on application shutdown."""
+        self._group_commit.close()
+        if self.shared:
+            self.journal.close()
+
+    def version_tag(self, list_id: str | None = None) -> str:
+        self._catch_up()
+        return super().version_tag(list_id)
     
     def save(self, task: Task) -> Task:
         """
@@ -58,19 +301,37 @@ class JsonTaskRepository(TaskRepository):
         if not hasattr(task, 'id') or not task.id:
             task.id = str(uuid4())
             
-        # Store the task
-        self.tasks[task.id] = task
-        
-        # Save to file
-        self._save_to_file()
+        # Store the task and save to file
+        with self._writing():
+            list_ids = self._indexed_list_ids([task.id]) | {task.list_id}
+            self._put(task)
+            self._persist([{"op": "save", "task": task.to_stored_dict()}])
+            self._notify_change([task.id], list_ids)
         
         return task
     
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        Save several tasks, persisting all of them with a single write.
+        Tasks without an ID get one generated.
+        """
+        with self._writing():
+            for task in tasks:
+                if not task.id:
+                    task.id = str(uuid4())
+            list_ids = self._indexed_list_ids([task.id for task in tasks]) | {task.list_id for task in tasks}
+            for task in tasks:
+                self._put(task)
+            self._persist([{"op": "save", "task": task.to_stored_dict()} for task in tasks])
+            self._notify_change([task.id for task in tasks], list_ids)
+        return tasks
+
     def get_by_id(self, id: str) -> Optional[Task]:
         """
         Get a task by its ID.
         Returns None if no task is found.
         """
+        self._catch_up()
         result = self.tasks.get(id)
         if not result:
             raise ValueError(f"Task with ID {id} does not exist.")
@@ -80,6 +341,7 @@ class JsonTaskRepository(TaskRepository):
         """
         Return all tasks in the repository.
         """
+        self._catch_up()
         return list(self.tasks.values())
     
     def delete(self, id: str) -> None:
@@ -87,13 +349,104 @@ class JsonTaskRepository(TaskRepository):
         Delete a task by its ID.
         If the task doesn't exist, do nothing.
         """
-        if id in self.tasks:
-            del self.tasks[id]
-            # Save to file after deletion
-            self._save_to_file()
+        with self._writing():
+            if id in self.tasks:
+                list_ids = self._indexed_list_ids([id])
+                self._remove(id)
+                # Save to file after deletion
+                self._persist([{"op": "delete", "id": id}])
+                self._notify_change([id], list_ids)
     
+    def delete_many(self, ids: List[str]) -> List[str]:
+        """
+        Delete several tasks, persisting all the deletions with a single write.
+        Returns the ids that existed; unknown ids are ignored.
+        """
+        with self._writing():
+            deleted = [id for id in dict.fromkeys(ids) if id in self.tasks]
+            list_ids = self._indexed_list_ids(deleted)
+            for id in deleted:
+                self._remove(id)
+            self._persist([{"op": "delete", "id": id} for id in deleted])
+            self._notify_change(deleted, list_ids)
+        return deleted
+
+    def delete_by_list_id(self, list_id: str) -> int:
+        """
+        Delete every task of a list.
+        Uses the list index and persists the whole deletion with a single write.
+        """
+        with self._writing():
+            task_ids = self.list_index.get(list_id)
+            for task_id in task_ids:
+                self._remove(task_id)
+            if task_ids:
+                self._persist([{"op": "delete_list", "list_id": list_id}])
+            self._notify_change(task_ids, [list_id])
+        return len(task_ids)
+
     def get_by_list_id(self, list_id: str) -> List[Task]:
         """
-        Get all tasks that belong to a specific list.
+        Get all tasks that belong to a specific list, in order.
+        Served from the list index, so the cost depends on the size of the list.
+        """
+        self._catch_up()
+        return [self.tasks[task_id] for task_id in self.list_index.get(list_id)]
+
+    def get_page_by_list_id(self, list_id: str, limit: int, after: tuple | None = None) -> List[Task]:
+        """
+        Get a page of the tasks of a list, ordered by (order, created_at, id)
+        and starting right after the sort key `after`.
+        """
+        self._catch_up()
+        return [self.tasks[task_id] for task_id in self.list_index.page(list_id, limit, after)]
+
+    def query(self, done: bool | None = None, owner: str | None = None, list_id: str | None = None,
+              due_after: datetime | None = None, due_before: datetime | None = None,
+              sort: str = "order", descending: bool = False, limit: int | None = None) -> List[Task]:
+        """
+        Get the tasks matching every given filter; see `TaskRepository.query`.
+        Candidates come from the most selective index that applies (list, owner,
+        due date range or done), so only those are checked against the other
+        filters. When that index already yields them in the requested order,
+        reading stops after `limit` matches.
+        """
+        self._catch_up()
+        matches = matcher(done, owner, list_id, due_after, due_before)
+        with self._lock:
+            # (number of candidates, candidate ids, order they come in) for every index that applies
+            options = []
+            if list_id is not None:
+                options.append((self.list_index.count(list_id), lambda: self.list_index.get(list_id), "order"))
+            if owner is not None:
+                options.append((self.owner_index.count(owner), lambda: self.owner_index.get(owner), None))
+            if due_after is not None or due_before is not None:
+                options.append((self.due_index.count(due_after, due_before, done),
+                                lambda: self.due_index.range(due_after, due_before, done), "due_date"))
+            if done is not None:
+                options.append((self.done_index.count(done), lambda: self.done_index.get(done), None))
+            _, candidates, candidate_order = min(options, key=lambda option: option[0],
+                                                 default=(len(self.tasks), lambda: self.tasks, None))
+            return select((self.tasks[id] for id in candidates()), matches, sort, descending, limit,
+                          presorted=candidate_order == sort)
+
+    def iter_tasks(self, list_id: str | None = None, updated_since: datetime | None = None,
+                   batch_size: int = 1000) -> Iterator[Task]:
+        """
+        Yield the tasks a batch at a time; see `TaskRepository.iter_tasks`.
+        Only the ids are copied up front; each batch of tasks is then looked
+        up under the lock, so writers are never held up for long.
         """
-        return [task for task in self.tasks.values() if task.list_id == list_id]
+        self._catch_up()
+        with self._lock:
+            ids = self.list_index.get(list_id) if list_id is not None else list(self.tasks)
+        since = naive(updated_since) if updated_since else None
+        for start in range(0, len(ids), batch_size):
+            self._catch_up()
+            with self._lock:
+                batch = [self.tasks.get(id) for id in ids[start:start + batch_size]]
+            for task in batch:
+                if task is None or (list_id is not None and task.list_id != list_id):
+                    continue
+                if since is None or naive(task.updated_at) >= since:
+                    yield task
@@ -0,0 +1,77 @@
+from typing import BinaryIO
+from pathlib import Path
+import hashlib
+import os
+import re
+import tempfile
+from application.ports.outbound.repositories.attachment_repository import AttachmentRepository, AttachmentWriter
+
+_ATTACHMENT_ID = re.compile(r'^[0-9a-f]{64}$')
+
+
+class LocalAttachmentWriter(AttachmentWriter):
+    """
+    Streams an attachment into a temporary file while hashing it; on commit the
+    file is moved to its content address, or dropped if that content is
+    already stored.
+    """
+    def __init__(self, repository: 'LocalAttachmentRepository'):
+        self.repository = repository
+        self._hash = hashlib.sha256()
+        self._size = 0
+        fd, self._tmp_path = tempfile.mkstemp(dir=repository.tmp_dir, suffix='.part')
+        self._file = os.fdopen(fd, 'wb')
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self._size += len(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> tuple[str, int]:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        attachment_id = self._hash.hexdigest()
+        path = self.repository.path_of(attachment_id)
+        if path.exists():
+            os.remove(self._tmp_path)
+        else:
+            path.parent.mkdir(exist_ok=True)
+            os.replace(self._tmp_path, path)
+        return attachment_id, self._size
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class LocalAttachmentRepository(AttachmentRepository):
+    """
+    Stores attachments in a local directory, each one in a file named after
+    the SHA-256 of its content (`<base_dir>/<first 2 hex chars>/<hash>`).
+    """
+    def __init__(self, base_dir=None):
+        # Default directory is data/attachments
+        if base_dir is None:
+            base_dir = Path(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'attachments'))
+        self.base_dir = Path(base_dir)
+        self.tmp_dir = self.base_dir / 'tmp'
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_of(self, attachment_id: str) -> Path:
+        if not _ATTACHMENT_ID.match(attachment_id or ''):
+            raise ValueError(f"Invalid attachment ID {attachment_id}")
+        return self.base_dir / attachment_id[:2] / attachment_id
+
+    def open_writer(self) -> LocalAttachmentWriter:
+        return LocalAttachmentWriter(self)
+
+    def open(self, attachment_id: str) -> BinaryIO:
+        path = self.path_of(attachment_id)
+        if not path.exists():
+            raise ValueError(f"Attachment with ID {attachment_id} does not exist.")
+        return open(path, 'rb')
+
+    def exists(self, attachment_id: str) -> bool:
+        return self.path_of(attachment_id).exists()
@@ -0,0 +1,443 @@
+from collections import OrderedDict
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+from pathlib import Path
+from sys import intern, maxsize
+from typing import Dict, Iterator, List, Optional, Tuple
+import json
+import mmap
+import os
+import struct
+import threading
+from uuid import uuid4
+from application.ports.outbound.repositories.task_repository import TaskRepository
+from domain.models.task import Task
+from infrastructure.repositories.indexes.due_date_index import DueDateIndex
+from infrastructure.repositories.indexes.list_index import ListIndex
+from infrastructure.repositories.indexes.offset_index import Entry, OffsetIndex, from_microseconds, to_microseconds
+from infrastructure.repositories.persistence import GroupCommit, write_atomically
+from infrastructure.repositories.task_query import matcher, naive, select
+
+# The data file starts with a magic string and a token identifying its
+# generation; an index written for another generation is ignored and rebuilt.
+_MAGIC = b"TODOTSK1"
+_TOKEN_SIZE = 16
+_HEADER_SIZE = len(_MAGIC) + _TOKEN_SIZE
+
+# Record: op, payload length, order, created_at in microseconds, id length and
+# list id length, followed by the id, the list id and the payload (the encoded
+# task; empty for deletions). The list sort key is kept out of the payload so
+# records can be indexed without decoding them.
+_RECORD = struct.Struct("<BIqqHH")
+_PUT = 1
+_DELETE = 2
+
+
+def _encode(task: Task) -> bytes:
+    return json.dumps(task.to_stored_dict(), separators=(',', ':')).encode('utf-8')
+
+
+class MmapTaskRepository(TaskRepository):
+    """
+    Task repository backed by an append-only data file that is memory-mapped
+    and decoded lazily.
+
+    Every save appends the encoded task to the data file. An `OffsetIndex`
+    next to it maps ids and list positions to record offsets; only the records
+    appended since that index was written are indexed in memory. Startup reads
+    those recent records' headers and nothing else, and no task is decoded
+    until it is first accessed. Decoded tasks are kept in an LRU cache of
+    `cache_size` entries.
+
+    Once `checkpoint_threshold` records were appended since the index was
+    written, a new index is written; when most records in the data file are
+    superseded, the data file is compacted instead. Writes made within
+    `flush_interval` seconds of each other are fsynced together by a background
+    writer thread; with `durability="sync"`, `wait_until_durable` waits for it.
+
+    Due dates are not part of the written index: the first query by due date
+    decodes every task once to build an in-memory `DueDateIndex`, which later
+    saves and deletes keep up to date.
+    """
+    def __init__(self, file_path=None, cache_size: int = 10000, checkpoint_threshold: int = 50000,
+                 flush_interval: float = 0.0, durability: str = "async"):
+        if file_path is None:
+            data_dir = Path(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data'))
+            data_dir.mkdir(exist_ok=True)
+            file_path = data_dir / 'task.mmap'
+
+        self.file_path = str(file_path)
+        self.index_path = f"{file_path}.idx"
+        self.cache_size = cache_size
+        self.checkpoint_threshold = checkpoint_threshold
+        self._cache: "OrderedDict[str, Task]" = OrderedDict()
+        # Changes since the index was written: id -> (offset, length), or None once deleted
+        self._recent: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._recent_lists = ListIndex()
+        self._index: Optional[OffsetIndex] = None
+        # Built by the first query by due date
+        self._due_index: Optional[DueDateIndex] = None
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.RLock()
+        self._group_commit = GroupCommit(self._commit, flush_interval, durability)
+        self._open()
+
+    def _open(self):
+        """Open the data file and its index, creating them or rebuilding the index when needed."""
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) < _HEADER_SIZE:
+            write_atomically(self.file_path, _MAGIC + os.urandom(_TOKEN_SIZE))
+        with open(self.file_path, 'rb') as f:
+            header = f.read(_HEADER_SIZE)
+        if not header.startswith(_MAGIC):
+            raise ValueError(f"{self.file_path} is not a task data file")
+        self._token = header[len(_MAGIC):]
+        self._data_size = os.path.getsize(self.file_path)
+        self._reader = open(self.file_path, 'rb')
+        self._data_file = open(self.file_path, 'ab')
+
+        self._index = self._open_index()
+        self._count = self._index.count if self._index else 0
+        self._dead = self._index.dead if self._index else 0
+        self._scan(self._index.data_size if self._index else _HEADER_SIZE)
+        if self._index is None:
+            self.checkpoint()
+
+    def _open_index(self) -> Optional[OffsetIndex]:
+        """Open the index, or return None when it is missing or was written for another data file."""
+        try:
+            index = OffsetIndex(self.index_path)
+        except (FileNotFoundError, ValueError):
+            return None
+        if index.token != self._token or index.data_size > self._data_size:
+            index.close()
+            return None
+        return index
+
+    def _scan(self, start: int):
+        """
+        Index in memory the records appended after `start`, reading only their
+        headers, and cut off a torn last record left by a crash.
+        """
+        if start >= self._data_size:
+            return
+        self._remap()
+        position = start
+        while position + _RECORD.size <= self._data_size:
+            op, length, order, created_at, id_length, list_length = _RECORD.unpack_from(self._map, position)
+            payload_offset = position + _RECORD.size + id_length + list_length
+            if payload_offset + length > self._data_size:
+                break
+            id = self._map[position + _RECORD.size:position + _RECORD.size + id_length].decode('utf-8')
+            if op == _PUT:
+                list_id = intern(self._map[payload_offset - list_length:payload_offset].decode('utf-8'))
+                self._apply_put(id, payload_offset, length, list_id, (order, from_microseconds(created_at), id))
+            else:
+                self._apply_delete(id)
+            position = payload_offset + length
+        if position < self._data_size:
+            self._map.close()
+            self._map = None
+            os.truncate(self.file_path, position)
+            self._data_size = position
+
+    def _remap(self):
+        """Map the data file again so records appended since the last mapping are visible."""
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _payload(self, offset: int, length: int) -> bytes:
+        if self._map is None or offset + length > len(self._map):
+            self._remap()
+        return self._map[offset:offset + length]
+
+    def _location(self, id: str) -> Optional[Tuple[int, int]]:
+        if id in self._recent:
+            return self._recent[id]
+        return self._index.find(id) if self._index else None
+
+    def _list_id_of(self, id: str) -> Optional[str]:
+        """The list a live task belongs to, or None."""
+        if id in self._recent:
+            entry = self._recent_lists.entry(id)
+            return entry[0] if entry else None
+        return self._index.list_id_of(id) if self._index else None
+
+    def _apply_put(self, id: str, offset: int, length: int, list_id: str, key: tuple):
+        if self._location(id) is None:
+            self._count += 1
+        else:
+            self._dead += 1
+        self._recent[id] = (offset, length)
+        self._recent_lists.add_key(id, list_id, key)
+
+    def _apply_delete(self, id: str):
+        if self._location(id) is not None:
+            self._count -= 1
+            self._dead += 1
+        # The deletion record itself is garbage as well
+        self._dead += 1
+        self._recent[id] = None
+        self._recent_lists.remove(id)
+        self._cache.pop(id, None)
+        if self._due_index is not None:
+            self._due_index.remove(id)
+
+    @staticmethod
+    def _record(op: int, id: str, payload: bytes, list_id: str, key: tuple | None) -> bytes:
+        id_bytes = id.encode('utf-8')
+        list_bytes = list_id.encode('utf-8')
+        order, created_at = (key[0], to_microseconds(key[1])) if key else (0, 0)
+        return _RECORD.pack(op, len(payload), order, created_at, len(id_bytes), len(list_bytes)) \
+            + id_bytes + list_bytes + payload
+
+    def _persist(self, items: List[tuple]):
+        """
+        Append (op, id, payload, list_id, sort_key) items to the data file with a
+        single write, apply them in memory and request a commit. The write reaches
+        the OS right away, so later reads through the map see it.
+        """
+        if not items:
+            return
+        data = bytearray()
+        list_ids = set()
+        for op, id, payload, list_id, key in items:
+            list_ids.add(self._list_id_of(id))
+            if op == _PUT:
+                list_ids.add(list_id)
+            record = self._record(op, id, payload, list_id, key)
+            payload_offset = self._data_size + len(data) + len(record) - len(payload)
+            data += record
+            if op == _PUT:
+                self._apply_put(id, payload_offset, len(payload), list_id, key)
+            else:
+                self._apply_delete(id)
+        self._data_file.write(data)
+        self._data_file.flush()
+        self._data_size += len(data)
+        self._group_commit.request()
+        list_ids.discard(None)
+        self._notify_change([item[1] for item in items], list_ids)
+
+    def _put_items(self, tasks: List[Task]) -> List[tuple]:
+        items = []
+        for task in tasks:
+            if not task.id:
+                task.id = str(uuid4())
+            items.append((_PUT, task.id, _encode(task), task.list_id, task.sort_key()))
+            self._remember(task)
+            if self._due_index is not None:
+                self._due_index.add(task)
+        return items
+
+    def _delete_items(self, ids: List[str]) -> List[tuple]:
+        return [(_DELETE, id, b"", "", None) for id in ids]
+
+    def _remember(self, task: Task):
+        """Keep a task in the LRU cache of decoded tasks."""
+        self._cache[task.id] = task
+        self._cache.move_to_end(task.id)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _read(self, id: str, remember: bool = True) -> Optional[Task]:
+        """Return a task from the cache, or decode it from the mapped data file."""
+        task = self._cache.get(id)
+        if task is not None:
+            self._cache.move_to_end(id)
+            return task
+        location = self._location(id)
+        if location is None:
+            return None
+        task = Task.from_trusted_dict(json.loads(self._payload(*location)))
+        if remember:
+            self._remember(task)
+        return task
+
+    def _entries(self) -> Iterator[Entry]:
+        """Yield the current entry of every live task."""
+        if self._index:
+            for entry in self._index.entries():
+                if entry[0] not in self._recent:
+                    yield entry
+        for id, location in self._recent.items():
+            if location is not None:
+                list_id, key = self._recent_lists.entry(id)
+                yield (id, location[0], location[1], list_id, key)
+
+    def _list_ids(self, list_id: str, limit: int = maxsize, after: tuple | None = None) -> List[str]:
+        """Ids of a list in order, merging the written index with the recent changes."""
+        recent = [(self._recent_lists.entry(id)[1], id) for id in self._recent_lists.page(list_id, limit, after)]
+        indexed = ((key, id) for id, _, _, _, key in self._index.list_entries(list_id, after)
+                   if id not in self._recent) if self._index else ()
+        return [id for _, id in islice(merge(recent, indexed), limit)]
+
+    def _commit(self):
+        """Make the appended records durable, then write a new index if the recent changes grew too many."""
+        with self._lock:
+            os.fsync(self._data_file.fileno())
+            if len(self._recent) >= self.checkpoint_threshold:
+                if self._dead > self._count:
+                    self.compact()
+                else:
+                    self.checkpoint()
+
+    def checkpoint(self):
+        """Write a new index covering the whole data file and forget the recent changes."""
+        with self._lock:
+            os.fsync(self._data_file.fileno())
+            OffsetIndex.write(self.index_path, self._token, self._data_size, self._dead, list(self._entries()))
+            self._reopen_index()
+
+    def compact(self):
+        """Rewrite the data file with only the live records, then index it."""
+        with self._lock:
+            token = os.urandom(_TOKEN_SIZE)
+            data = bytearray(_MAGIC + token)
+            entries = []
+            for id, offset, length, list_id, key in list(self._entries()):
+                payload = self._payload(offset, length)
+                record = self._record(_PUT, id, payload, list_id, key)
+                entries.append((id, len(data) + len(record) - length, length, list_id, key))
+                data += record
+            self._close_files()
+            write_atomically(self.file_path, bytes(data))
+            OffsetIndex.write(self.index_path, token, len(data), 0, entries)
+            self._token = token
+            self._data_size = len(data)
+            self._dead = 0
+            self._reader = open(self.file_path, 'rb')
+            self._data_file = open(self.file_path, 'ab')
+            self._reopen_index()
+
+    def _reopen_index(self):
+        if self._index:
+            self._index.close()
+        self._index = OffsetIndex(self.index_path)
+        self._recent.clear()
+        self._recent_lists.clear()
+
+    def _close_files(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._index:
+            self._index.close()
+            self._index = None
+        self._reader.close()
+        self._data_file.close()
+
+    def flush(self) -> None:
+        """Make every write durable right away."""
+        self._group_commit.flush()
+
+    async def wait_until_durable(self) -> None:
+        await self._group_commit.durable()
+
+    def close(self) -> None:
+        """
+        Make every write durable, index the recent changes so the next startup
+        does not have to scan them, and release the maps and the open files.
+        """
+        self._group_commit.close()
+        with self._lock:
+            if self._recent:
+                self.checkpoint()
+            self._close_files()
+
+    def save(self, task: Task) -> Task:
+        """Append a task to the data file. If the task has no ID, one will be generated."""
+        with self._lock:
+            self._persist(self._put_items([task]))
+        return task
+
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """Append several tasks to the data file with a single write."""
+        with self._lock:
+            self._persist(self._put_items(tasks))
+        return tasks
+
+    def get_by_id(self, id: str) -> Optional[Task]:
+        with self._lock:
+            result = self._read(id)
+        if not result:
+            raise ValueError(f"Task with ID {id} does not exist.")
+        return result
+
+    def get_all(self) -> List[Task]:
+        """Return all tasks. Tasks that are not cached are decoded without being cached."""
+        with self._lock:
+            return [self._read(entry[0], remember=False) for entry in list(self._entries())]
+
+    def delete(self, id: str) -> None:
+        with self._lock:
+            if self._location(id) is not None:
+                self._persist(self._delete_items([id]))
+
+    def delete_many(self, ids: List[str]) -> List[str]:
+        with self._lock:
+            deleted = [id for id in dict.fromkeys(ids) if self._location(id) is not None]
+            self._persist(self._delete_items(deleted))
+        return deleted
+
+    def delete_by_list_id(self, list_id: str) -> int:
+        with self._lock:
+            task_ids = self._list_ids(list_id)
+            self._persist(self._delete_items(task_ids))
+        return len(task_ids)
+
+    def get_by_list_id(self, list_id: str) -> List[Task]:
+        with self._lock:
+            return [self._read(id) for id in self._list_ids(list_id)]
+
+    def get_page_by_list_id(self, list_id: str, limit: int, after: tuple | None = None) -> List[Task]:
+        with self._lock:
+            return [self._read(id) for id in self._list_ids(list_id, limit, after)]
+
+    def query(self, done: bool | None = None, owner: str | None = None, list_id: str | None = None,
+              due_after: datetime | None = None, due_before: datetime | None = None,
+              sort: str = "order", descending: bool = False, limit: int | None = None) -> List[Task]:
+        """
+        Get the tasks matching every given filter; see `TaskRepository.query`.
+        A query of a list decodes the tasks of that list, in order, and a query
+        by due date the tasks due within the range; any other query decodes
+        every task. Tasks decoded for a query are not cached.
+        """
+        matches = matcher(done, owner, list_id, due_after, due_before)
+        with self._lock:
+            if list_id is not None:
+                ids, candidate_order = self._list_ids(list_id), "order"
+            elif due_after is not None or due_before is not None:
+                ids, candidate_order = self._due_dates().range(due_after, due_before, done), "due_date"
+            else:
+                ids, candidate_order = [entry[0] for entry in self._entries()], None
+            return select((self._read(id, remember=False) for id in ids), matches, sort, descending, limit,
+                          presorted=candidate_order == sort)
+
+    def _due_dates(self) -> DueDateIndex:
+        """The due date index, built the first time it is needed."""
+        if self._due_index is None:
+            due_index = DueDateIndex()
+            due_index.rebuild(self._read(entry[0], remember=False) for entry in list(self._entries()))
+            self._due_index = due_index
+        return self._due_index
+
+    def iter_tasks(self, list_id: str | None = None, updated_since: datetime | None = None,
+                   batch_size: int = 1000) -> Iterator[Task]:
+        """
+        Yield the tasks a batch at a time; see `TaskRepository.iter_tasks`.
+        Only the ids are collected up front. Tasks are decoded a batch at a
+        time and not cached.
+        """
+        with self._lock:
+            ids = self._list_ids(list_id) if list_id is not None else [entry[0] for entry in self._entries()]
+        since = naive(updated_since) if updated_since else None
+        for start in range(0, len(ids), batch_size):
+            with self._lock:
+                batch = [self._read(id, remember=False) for id in ids[start:start + batch_size]]
+            for task in batch:
+                if task is None or (list_id is not None and task.list_id != list_id):
+                    continue
+                if since is None or naive(task.updated_at) >= since:
+                    yield task
@@ -0,0 +1,191 @@
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+import asyncio
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def write_atomically(file_path, content: str | bytes) -> None:
+    """
+    Replace `file_path` with `content` without ever leaving a truncated file behind.
+    The content is written to a temporary file in the same directory, fsynced and
+    renamed over the target, so readers see either the old or the new version.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(content, bytes) else 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Make the rename itself durable. Not every platform allows opening directories."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class FileLock:
+    """
+    Advisory lock on `file_path` (created if needed), shared by every process
+    that opens the same path. Used to coordinate writers across uvicorn workers.
+    Each instance holds its own open file, so two instances exclude each other
+    even within one process; a single instance must not be locked re-entrantly.
+    """
+    def __init__(self, file_path):
+        if fcntl is None:
+            raise ImportError("Sharing files between processes needs fcntl (POSIX systems)")
+        self.file_path = file_path
+        self._fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        fcntl.flock(self._fd, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def exclusive(self):
+        """Hold the lock alone, e.g. while appending to or replacing the shared files."""
+        return self._locked(fcntl.LOCK_EX)
+
+    def shared(self):
+        """Hold the lock along with other readers, so no writer changes the files meanwhile."""
+        return self._locked(fcntl.LOCK_SH)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class GroupCommit:
+    """
+    Coalesces every commit requested within `interval` seconds into a single call
+    to `commit`. With an interval of 0 each request commits immediately, on the
+    calling thread. Otherwise a dedicated writer thread commits in the background,
+    so `request` never waits for the disk.
+
+    `durability` decides when callers of `durable` consider their changes
+    acknowledged: "async" once they are applied in memory, "sync" once a commit
+    covering them has completed.
+    """
+    def __init__(self, commit: Callable[[], None], interval: float = 0.0, durability: str = "async"):
+        if durability not in ("async", "sync"):
+            raise ValueError(f"Unknown durability policy: {durability}")
+        self.interval = interval
+        self.durability = durability
+        self._commit = commit
+        self._state_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._wake = threading.Condition(self._state_lock)
+        self._pending = False
+        # Requests made so far, and how many of them the last successful commit covered
+        self._requested = 0
+        self._committed = 0
+        self._waiters: List[Tuple[int, Future]] = []
+        self._writer: threading.Thread | None = None
+        self._closing = threading.Event()
+
+    def request(self) -> None:
+        """Ask for the pending changes to be committed within the configured window."""
+        with self._state_lock:
+            self._pending = True
+            self._requested += 1
+            if self.interval > 0:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._run, name="group-commit-writer", daemon=True)
+                    self._writer.start()
+                self._wake.notify()
+                return
+        self.flush()
+
+    def _run(self) -> None:
+        """Writer thread: wait for a request, let the window fill up, then commit."""
+        while True:
+            with self._state_lock:
+                while not self._pending and not self._closing.is_set():
+                    self._wake.wait()
+                if self._closing.is_set():
+                    return
+            self._closing.wait(self.interval)
+            try:
+                self.flush()
+            except Exception as e:
+                # Still pending: retried after the next window
+                print(f"Error committing changes: {e}")
+
+    def committed(self) -> Future:
+        """Return a future resolved once every change requested so far has been committed."""
+        future = Future()
+        with self._state_lock:
+            if self._committed >= self._requested:
+                future.set_result(None)
+            else:
+                self._waiters.append((self._requested, future))
+        return future
+
+    async def durable(self) -> None:
+        """Wait, without blocking the event loop, until the changes requested so far meet the durability policy."""
+        if self.durability == "sync":
+            await asyncio.wrap_future(self.committed())
+
+    def _take_waiters(self, covered: int) -> List[Future]:
+        ready = [future for ticket, future in self._waiters if ticket <= covered]
+        self._waiters = [(ticket, future) for ticket, future in self._waiters if ticket > covered]
+        return ready
+
+    def flush(self) -> None:
+        """Commit the pending changes right away, if there are any."""
+        with self._commit_lock:
+            with self._state_lock:
+                if not self._pending:
+                    return
+                self._pending = False
+                covered = self._requested
+            try:
+                self._commit()
+            except BaseException as error:
+                # Keep the changes pending so the next request retries them
+                with self._state_lock:
+                    self._pending = True
+                    failed = self._take_waiters(covered)
+                for future in failed:
+                    future.set_exception(error)
+                raise
+            with self._state_lock:
+                self._committed = covered
+                done = self._take_waiters(covered)
+            for future in done:
+                future.set_result(None)
+
+    def close(self) -> None:
+        """Stop the writer thread and commit whatever is still pending; used on application shutdown."""
+        with self._state_lock:
+            self._closing.set()
+            self._wake.notify()
+            writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        self.flush()
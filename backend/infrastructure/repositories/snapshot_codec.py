@@ -0,0 +1,200 @@
+"""
+Versioned binary snapshot format for tasks and task lists.
+
+A snapshot starts with a header (magic, format version, kind of entity and
+number of records) followed by length-prefixed records. Each record is a
+fixed-size block of numbers and byte lengths followed by the UTF-8 strings,
+always in the same field order, so no key names are stored. Datetimes are
+stored as microseconds since the epoch. Readers skip whatever a record holds
+beyond the fields they know, so later versions can append fields.
+
+Version 2 appends the modification time to every task record; tasks read
+from version 1 snapshots were last modified when they were created.
+"""
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, List
+import gc
+import json
+import struct
+from domain.models.list import TaskList
+from domain.models.task import Task
+
+MAGIC = b"TODOSNAP"
+VERSION = 2
+TASKS = 1
+TASK_LISTS = 2
+
+# magic, version, kind, number of records
+_HEADER = struct.Struct("<8sBBQ")
+_LENGTH = struct.Struct("<I")
+# created_at, due_date, order, attachment_size, done, the character lengths of
+# id, title, list_id, description, owner and attachment_id, then the byte
+# lengths of those strings together, of the attachment and of the checklist.
+# The strings are stored back to back so a record is decoded with a single call.
+_TASK = struct.Struct("<qqqq?9I")
+# Appended to task records by version 2: updated_at
+_TASK_V2 = struct.Struct("<q")
+# order, then the byte lengths of id and name
+_TASK_LIST = struct.Struct("<q2I")
+# Stored instead of a missing due date, order or attachment size
+_NONE = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def is_snapshot(data: bytes) -> bool:
+    """Tell whether `data` holds a binary snapshot rather than JSON."""
+    return data[:len(MAGIC)] == MAGIC
+
+
+def _to_microseconds(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=8192)
+def _from_microseconds(value: int) -> datetime:
+    # Dates repeat a lot across tasks, so decoded values are cached and shared
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _read_header(data: bytes, kind: int) -> int:
+    if len(data) < _HEADER.size or not is_snapshot(data):
+        raise ValueError("Not a binary snapshot")
+    _, version, stored_kind, count = _HEADER.unpack_from(data, 0)
+    if version > VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    if stored_kind != kind:
+        raise ValueError(f"Snapshot holds another kind of entity: {stored_kind}")
+    return count
+
+
+def _records(data: bytes, kind: int):
+    """Yield the start and end offsets of every record of a snapshot, checking it is complete."""
+    position = _HEADER.size
+    for _ in range(_read_header(data, kind)):
+        if position + _LENGTH.size > len(data):
+            raise ValueError("Truncated snapshot")
+        length, = _LENGTH.unpack_from(data, position)
+        position += _LENGTH.size
+        if position + length > len(data):
+            raise ValueError("Truncated snapshot")
+        yield position, position + length
+        position += length
+
+
+def _encode(kind: int, records: List[bytes]) -> bytes:
+    parts = [_HEADER.pack(MAGIC, VERSION, kind, len(records))]
+    for record in records:
+        parts.append(_LENGTH.pack(len(record)))
+        parts.append(record)
+    return b"".join(parts)
+
+
+def _encode_task(task: Task) -> bytes:
+    id, title, list_id = task.id, task.title, task.list_id
+    description = task.description or ""
+    owner = task.owner or ""
+    attachment_id = task.attachment_id or ""
+    text = (id + title + list_id + description + owner + attachment_id).encode('utf-8')
+    attachment = bytes(task.attachment or b"")
+    # Checklist items are free-form, so the checklist is kept as JSON
+    checklist = json.dumps(task.checklist, separators=(',', ':')).encode('utf-8') if task.checklist else b""
+    return b"".join((
+        _TASK.pack(
+            _to_microseconds(task.created_at),
+            _to_microseconds(task.due_date) if task.due_date else _NONE,
+            _NONE if task.order is None else task.order,
+            _NONE if task.attachment_size is None else task.attachment_size,
+            bool(task.done),
+            len(id), len(title), len(list_id), len(description), len(owner), len(attachment_id),
+            len(text), len(attachment), len(checklist),
+        ),
+        text, attachment, checklist,
+        _TASK_V2.pack(_to_microseconds(task.updated_at or task.created_at)),
+    ))
+
+
+def encode_tasks(tasks: Iterable[Task]) -> bytes:
+    """Encode tasks as a binary snapshot."""
+    return _encode(TASKS, [_encode_task(task) for task in tasks])
+
+
+def decode_tasks(data: bytes) -> List[Task]:
+    """Decode a binary snapshot written by `encode_tasks`."""
+    # Creating this many objects at once triggers repeated garbage collections
+    # that find nothing to free, so the collector is paused while decoding
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _decode_tasks(data)
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _decode_tasks(data: bytes) -> List[Task]:
+    tasks = []
+    for position, end in _records(data, TASKS):
+        (created_at, due_date, order, attachment_size, done, id_end, title_length, list_id_length,
+         description_length, owner_length, attachment_id_length, text_length, attachment_length,
+         checklist_length) = _TASK.unpack_from(data, position)
+        position += _TASK.size
+        text = data[position:position + text_length].decode('utf-8')
+        position += text_length
+        attachment = data[position:position + attachment_length]
+        position += attachment_length
+        checklist = data[position:position + checklist_length]
+        position += checklist_length
+        created = _from_microseconds(created_at)
+        if position + _TASK_V2.size <= end:
+            # Modification times rarely repeat: not worth a place in the cache
+            updated = _EPOCH + timedelta(microseconds=_TASK_V2.unpack_from(data, position)[0])
+        else:
+            updated = created
+        title_end = id_end + title_length
+        list_id_end = title_end + list_id_length
+        description_end = list_id_end + description_length
+        owner_end = description_end + owner_length
+        tasks.append(Task.from_trusted_fields(
+            text[:id_end],
+            text[id_end:title_end],
+            text[title_end:list_id_end],
+            text[list_id_end:description_end],
+            created,
+            _from_microseconds(due_date) if due_date != _NONE else None,
+            attachment or None,
+            json.loads(checklist) if checklist else [],
+            text[description_end:owner_end] or 'default',
+            done,
+            order if order != _NONE else None,
+            text[owner_end:owner_end + attachment_id_length] or None,
+            attachment_size if attachment_size != _NONE else None,
+            updated,
+        ))
+    return tasks
+
+
+def encode_task_lists(task_lists: Iterable[TaskList]) -> bytes:
+    """Encode task lists as a binary snapshot."""
+    records = []
+    for task_list in task_lists:
+        id = task_list.id.encode('utf-8')
+        name = task_list.name.encode('utf-8')
+        order = _NONE if task_list.order is None else task_list.order
+        records.append(_TASK_LIST.pack(order, len(id), len(name)) + id + name)
+    return _encode(TASK_LISTS, records)
+
+
+def decode_task_lists(data: bytes) -> List[TaskList]:
+    """Decode a binary snapshot written by `encode_task_lists`."""
+    task_lists = []
+    for position, _ in _records(data, TASK_LISTS):
+        order, id_length, name_length = _TASK_LIST.unpack_from(data, position)
+        position += _TASK_LIST.size
+        id = data[position:position + id_length].decode('utf-8')
+        name = data[position + id_length:position + id_length + name_length].decode('utf-8')
+        task_lists.append(TaskList(name=name, id=id, order=order if order != _NONE else None))
+    return task_lists
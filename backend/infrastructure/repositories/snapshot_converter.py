@@ -0,0 +1,55 @@
+"""
+Converts repository files between the JSON and the binary snapshot formats.
+
+Run from the backend directory:
+    python -m infrastructure.repositories.snapshot_converter {tasks,lists} SOURCE TARGET --to {json,binary}
+
+The format of SOURCE is detected from its content. A task journal is not
+converted: compact the repository before converting its snapshot.
+"""
+import argparse
+import json
+from domain.models.list import TaskList
+from domain.models.task import Task
+from infrastructure.repositories.persistence import write_atomically
+from infrastructure.repositories.snapshot_codec import (
+    decode_task_lists, decode_tasks, encode_task_lists, encode_tasks, is_snapshot,
+)
+
+
+def convert(kind: str, source, target, to: str) -> int:
+    """Convert the `kind` ("tasks" or "lists") file `source` into `target`; returns the number of records."""
+    with open(source, 'rb') as f:
+        data = f.read()
+    if kind == "tasks":
+        entities = decode_tasks(data) if is_snapshot(data) else [Task.from_trusted_dict(item) for item in json.loads(data)]
+        encode = encode_tasks
+    elif kind == "lists":
+        entities = decode_task_lists(data) if is_snapshot(data) else [TaskList.from_dict(item) for item in json.loads(data)]
+        encode = encode_task_lists
+    else:
+        raise ValueError(f"Unknown kind of file: {kind}")
+
+    if to == "binary":
+        write_atomically(target, encode(entities))
+    elif to == "json":
+        records = [entity.to_stored_dict() if kind == "tasks" else entity.to_dict() for entity in entities]
+        write_atomically(target, json.dumps(records, indent=2))
+    else:
+        raise ValueError(f"Unknown snapshot format: {to}")
+    return len(entities)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert repository files between JSON and binary snapshots.")
+    parser.add_argument("kind", choices=["tasks", "lists"])
+    parser.add_argument("source")
+    parser.add_argument("target")
+    parser.add_argument("--to", choices=["json", "binary"], required=True)
+    args = parser.parse_args()
+    count = convert(args.kind, args.source, args.target, args.to)
+    print(f"Converted {count} {args.kind} from {args.source} to {args.target} ({args.to})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from pathlib import Path
+import os
+import sqlite3
+import threading
+
+
+class SqliteDatabase:
+    """
+    Hands out SQLite connections to a single database file.
+    sqlite3 connections cannot be shared between threads, so each thread gets
+    its own connection, opened once and reused for every later call.
+    The database runs in WAL mode so readers never block the writer.
+    """
+    def __init__(self, db_path=None):
+        # Default database file is in the data directory
+        if db_path is None:
+            # Create data directory if it doesn't exist
+            data_dir = Path(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data'))
+            data_dir.mkdir(exist_ok=True)
+            db_path = data_dir / 'todo.sqlite3'
+
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it on first use."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # Only the owning thread uses it; the flag lets close() run from any thread
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """Close every connection opened so far."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
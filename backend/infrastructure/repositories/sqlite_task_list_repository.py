@@ -0,0 +1,126 @@
+from typing import Iterable, List, Optional
+from application.ports.outbound.repositories.task_list_repository import TaskListRepository
+from domain.models.list import TaskList
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from uuid import uuid4
+
+class SqliteTaskListRepository(TaskListRepository):
+    """
+    SQLite implementation of TaskListRepository.
+    Stores task lists in the `task_lists` table of a SqliteDatabase.
+    """
+    def __init__(self, database: SqliteDatabase):
+        self.database = database
+        with self.database.connection() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS task_lists (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    "order" INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_task_lists_order ON task_lists ("order", id);
+            """)
+
+    @staticmethod
+    def _to_task_list(row) -> TaskList:
+        return TaskList(id=row['id'], name=row['name'], order=row['order'])
+
+    def save(self, task_list: TaskList) -> TaskList:
+        """
+        Insert or replace a task list.
+        If the task list has no ID, one will be generated.
+        """
+        if not hasattr(task_list, 'id') or not task_list.id:
+            task_list.id = str(uuid4())
+
+        with self.database.connection() as connection:
+            connection.execute(
+                """
+                INSERT INTO task_lists (id, name, "order") VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET name = excluded.name, "order" = excluded."order"
+                """,
+                (task_list.id, task_list.name, task_list.order or 0)
+            )
+        self._notify_change([task_list.id])
+        return task_list
+
+    def save_many(self, task_lists: List[TaskList]) -> List[TaskList]:
+        """
+        Insert or replace several task lists in a single transaction.
+        Task lists without an ID get one generated.
+        """
+        for task_list in task_lists:
+            if not task_list.id:
+                task_list.id = str(uuid4())
+        with self.database.connection() as connection:
+            connection.executemany(
+                """
+                INSERT INTO task_lists (id, name, "order") VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET name = excluded.name, "order" = excluded."order"
+                """,
+                [(task_list.id, task_list.name, task_list.order or 0) for task_list in task_lists]
+            )
+        self._notify_change([task_list.id for task_list in task_lists])
+        return task_lists
+
+    def update(self, task_list: TaskList) -> TaskList:
+        """
+        Update an existing task list.
+        If the task list doesn't exist, it will raise an error.
+        """
+        if not hasattr(task_list, 'id') or not task_list.id:
+            raise ValueError("TaskList must have an ID to be updated.")
+
+        with self.database.connection() as connection:
+            cursor = connection.execute(
+                'UPDATE task_lists SET name = ?, "order" = ? WHERE id = ?',
+                (task_list.name, task_list.order or 0, task_list.id)
+            )
+        if cursor.rowcount == 0:
+            raise ValueError(f"TaskList with ID {task_list.id} does not exist.")
+        self._notify_change([task_list.id])
+        return task_list
+
+    def get_by_id(self, list_id: str) -> Optional[TaskList]:
+        """
+        Get a task list by its ID.
+        Raises ValueError if no task list is found, like the JSON repository.
+        """
+        row = self.database.connection().execute(
+            'SELECT * FROM task_lists WHERE id = ?', (list_id,)
+        ).fetchone()
+        if not row:
+            raise ValueError(f"TaskList with ID {list_id} does not exist.")
+        return self._to_task_list(row)
+
+    def existing_ids(self, list_ids: Iterable[str]) -> set[str]:
+        """Return which of `list_ids` belong to stored task lists, querying them in chunks."""
+        list_ids = list(set(list_ids))
+        existing = set()
+        for start in range(0, len(list_ids), 500):
+            chunk = list_ids[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = self.database.connection().execute(f'SELECT id FROM task_lists WHERE id IN ({placeholders})', chunk)
+            existing.update(row['id'] for row in rows)
+        return existing
+
+    def get_all(self) -> List[TaskList]:
+        """
+        Return all task lists in the repository.
+        """
+        rows = self.database.connection().execute('SELECT * FROM task_lists')
+        return [self._to_task_list(row) for row in rows]
+
+    def delete(self, id: str) -> None:
+        """
+        Delete a task list by its ID.
+        If the task list doesn't exist, do nothing.
+        """
+        with self.database.connection() as connection:
+            cursor = connection.execute('DELETE FROM task_lists WHERE id = ?', (id,))
+        if cursor.rowcount:
+            self._notify_change([id])
+
+    def close(self) -> None:
+        """Close the database connections."""
+        self.database.close()
@@ -0,0 +1,309 @@
+from typing import Iterator, List, Optional
+from datetime import datetime
+import json
+from application.ports.outbound.repositories.task_repository import TASK_QUERY_SORTS, TaskRepository
+from domain.models.task import Task
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from infrastructure.repositories.task_query import naive
+from uuid import uuid4
+
+
+def _timestamp(value: datetime) -> str:
+    """Modification times are stored with a fixed width, so comparing the text compares the times."""
+    return naive(value).isoformat(timespec='microseconds')
+
+# ORDER BY columns of every `query` sort, matching the keys of task_query.sort_key
+_SORT_COLUMNS = {
+    "order": ('"order"', 'created_at', 'id'),
+    "due_date": ('due_date IS NULL', 'due_date', 'id'),
+    "created_at": ('created_at', 'id'),
+}
+
+class SqliteTaskRepository(TaskRepository):
+    """
+    SQLite implementation of TaskRepository.
+    Stores tasks in the `tasks` table of a SqliteDatabase, indexed by list and
+    position, owner and due date, so only the rows a query needs are read.
+    """
+    def __init__(self, database: SqliteDatabase):
+        self.database = database
+        with self.database.connection() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    list_id TEXT NOT NULL,
+                    description TEXT NOT NULL DEFAULT '',
+                    created_at TEXT NOT NULL,
+                    due_date TEXT,
+                    attachment BLOB,
+                    checklist TEXT NOT NULL DEFAULT '[]',
+                    owner TEXT NOT NULL DEFAULT 'default',
+                    done INTEGER NOT NULL DEFAULT 0,
+                    "order" INTEGER NOT NULL DEFAULT 0,
+                    attachment_id TEXT,
+                    attachment_size INTEGER,
+                    updated_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_tasks_list_order ON tasks (list_id, "order", created_at, id);
+                CREATE INDEX IF NOT EXISTS idx_tasks_owner ON tasks (owner);
+                CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+                CREATE INDEX IF NOT EXISTS idx_tasks_order ON tasks ("order");
+                CREATE INDEX IF NOT EXISTS idx_tasks_done_due_date ON tasks (done, due_date);
+            """)
+            # Databases created before attachments were stored out of line, or before
+            # modification times were kept, lack these columns
+            columns = {row['name'] for row in connection.execute('PRAGMA table_info(tasks)')}
+            for column, column_type in (('attachment_id', 'TEXT'), ('attachment_size', 'INTEGER'), ('updated_at', 'TEXT')):
+                if column not in columns:
+                    connection.execute(f'ALTER TABLE tasks ADD COLUMN {column} {column_type}')
+            if 'updated_at' not in columns:
+                # Those tasks were last modified when they were created
+                connection.executemany(
+                    'UPDATE tasks SET updated_at = ? WHERE id = ?',
+                    [(_timestamp(datetime.fromisoformat(row['created_at'])), row['id'])
+                     for row in connection.execute('SELECT id, created_at FROM tasks')]
+                )
+            # Covers the lookup of the tasks modified since a given time
+            connection.execute('DROP INDEX IF EXISTS idx_tasks_updated_at')
+            connection.execute('CREATE INDEX IF NOT EXISTS idx_tasks_updated_at_id ON tasks (updated_at, id)')
+
+    @staticmethod
+    def _to_row(task: Task) -> tuple:
+        return (
+            task.id,
+            task.title,
+            task.list_id,
+            task.description,
+            task.created_at.isoformat(),
+            task.due_date.isoformat() if task.due_date else None,
+            task.attachment,
+            json.dumps(task.checklist),
+            task.owner,
+            int(task.done),
+            task.order or 0,
+            task.attachment_id,
+            task.attachment_size,
+            _timestamp(task.updated_at),
+        )
+
+    @staticmethod
+    def _to_task(row) -> Task:
+        return Task(
+            id=row['id'],
+            title=row['title'],
+            list_id=row['list_id'],
+            description=row['description'],
+            created_at=datetime.fromisoformat(row['created_at']),
+            due_date=datetime.fromisoformat(row['due_date']) if row['due_date'] else None,
+            attachment=row['attachment'],
+            checklist=json.loads(row['checklist']),
+            owner=row['owner'],
+            done=bool(row['done']),
+            order=row['order'],
+            attachment_id=row['attachment_id'],
+            attachment_size=row['attachment_size'],
+            updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+        )
+
+    def save(self, task: Task) -> Task:
+        """
+        Insert or replace a task.
+        If the task has no ID, one will be generated.
+        """
+        self.save_many([task])
+        return task
+
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        Insert or replace several tasks in a single transaction.
+        Tasks without an ID get one generated.
+        """
+        for task in tasks:
+            if not task.id:
+                task.id = str(uuid4())
+        with self.database.connection() as connection:
+            list_ids = self._list_ids_of(connection, [task.id for task in tasks]) | {task.list_id for task in tasks}
+            connection.executemany(
+                """
+                INSERT OR REPLACE INTO tasks
+                    (id, title, list_id, description, created_at, due_date, attachment, checklist, owner, done, "order",
+                     attachment_id, attachment_size, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [self._to_row(task) for task in tasks]
+            )
+        self._notify_change([task.id for task in tasks], list_ids)
+        return tasks
+
+    @staticmethod
+    def _list_ids_of(connection, ids: List[str]) -> set:
+        """The lists the given tasks are stored in."""
+        list_ids = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = connection.execute(f'SELECT DISTINCT list_id FROM tasks WHERE id IN ({placeholders})', chunk)
+            list_ids.update(row['list_id'] for row in rows)
+        return list_ids
+
+    def get_by_id(self, id: str) -> Optional[Task]:
+        """
+        Get a task by its ID.
+        Raises ValueError if no task is found, like the JSON repository.
+        """
+        row = self.database.connection().execute('SELECT * FROM tasks WHERE id = ?', (id,)).fetchone()
+        if not row:
+            raise ValueError(f"Task with ID {id} does not exist.")
+        return self._to_task(row)
+
+    def get_all(self) -> List[Task]:
+        """
+        Return all tasks in the repository.
+        """
+        rows = self.database.connection().execute('SELECT * FROM tasks')
+        return [self._to_task(row) for row in rows]
+
+    def delete(self, id: str) -> None:
+        """
+        Delete a task by its ID.
+        If the task doesn't exist, do nothing.
+        """
+        with self.database.connection() as connection:
+            list_ids = self._list_ids_of(connection, [id])
+            cursor = connection.execute('DELETE FROM tasks WHERE id = ?', (id,))
+        if cursor.rowcount:
+            self._notify_change([id], list_ids)
+
+    def delete_many(self, ids: List[str]) -> List[str]:
+        """
+        Delete several tasks in a single transaction.
+        Returns the ids that existed; unknown ids are ignored.
+        """
+        ids = list(dict.fromkeys(ids))
+        deleted = []
+        list_ids = set()
+        with self.database.connection() as connection:
+            # Stay well below SQLite's limit on the number of bound parameters
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                rows = connection.execute(f'SELECT id, list_id FROM tasks WHERE id IN ({placeholders})', chunk).fetchall()
+                existing = {row['id'] for row in rows}
+                list_ids.update(row['list_id'] for row in rows)
+                connection.execute(f'DELETE FROM tasks WHERE id IN ({placeholders})', chunk)
+                deleted.extend(id for id in chunk if id in existing)
+        self._notify_change(deleted, list_ids)
+        return deleted
+
+    def delete_by_list_id(self, list_id: str) -> int:
+        """
+        Delete every task of a list in one statement, using the list index.
+        """
+        with self.database.connection() as connection:
+            task_ids = [row['id'] for row in connection.execute('SELECT id FROM tasks WHERE list_id = ?', (list_id,))]
+            connection.execute('DELETE FROM tasks WHERE list_id = ?', (list_id,))
+        self._notify_change(task_ids, [list_id])
+        return len(task_ids)
+
+    def get_by_list_id(self, list_id: str) -> List[Task]:
+        """
+        Get all tasks that belong to a specific list, in order.
+        """
+        rows = self.database.connection().execute(
+            'SELECT * FROM tasks WHERE list_id = ? ORDER BY "order", created_at, id', (list_id,)
+        )
+        return [self._to_task(row) for row in rows]
+
+    def get_page_by_list_id(self, list_id: str, limit: int, after: tuple | None = None) -> List[Task]:
+        """
+        Get a page of the tasks of a list, ordered by (order, created_at, id)
+        and starting right after the sort key `after`. Uses keyset pagination
+        over the (list_id, order, created_at, id) index.
+        """
+        return self._page_of_list(list_id, limit, after)
+
+    def _page_of_list(self, list_id: str, limit: int, after: tuple | None, since: str | None = None) -> List[Task]:
+        conditions, parameters = ['list_id = ?'], [list_id]
+        if after is not None:
+            order, created_at, task_id = after
+            conditions.append('("order", created_at, id) > (?, ?, ?)')
+            parameters += [order, created_at.isoformat(), task_id]
+        if since is not None:
+            conditions.append('updated_at >= ?')
+            parameters.append(since)
+        rows = self.database.connection().execute(
+            f'SELECT * FROM tasks WHERE {" AND ".join(conditions)} ORDER BY "order", created_at, id LIMIT ?',
+            parameters + [limit]
+        )
+        return [self._to_task(row) for row in rows]
+
+    def query(self, done: bool | None = None, owner: str | None = None, list_id: str | None = None,
+              due_after: datetime | None = None, due_before: datetime | None = None,
+              sort: str = "order", descending: bool = False, limit: int | None = None) -> List[Task]:
+        """
+        Get the tasks matching every given filter; see `TaskRepository.query`.
+        The filters become a single WHERE clause, so SQLite picks whichever of
+        the list, owner or (done, due_date) indexes is the most selective.
+        """
+        if sort not in _SORT_COLUMNS:
+            raise ValueError(f"Unknown sort {sort}, expected one of: {', '.join(TASK_QUERY_SORTS)}")
+        conditions, parameters = [], []
+        for column, value in (('done', None if done is None else int(done)), ('owner', owner), ('list_id', list_id)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                parameters.append(value)
+        # Dates are stored as ISO strings, which sort like the dates themselves
+        if due_after is not None:
+            conditions.append('due_date >= ?')
+            parameters.append(naive(due_after).isoformat())
+        if due_before is not None:
+            conditions.append('due_date < ?')
+            parameters.append(naive(due_before).isoformat())
+        direction = ' DESC' if descending else ''
+        sql = 'SELECT * FROM tasks'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY ' + ', '.join(column + direction for column in _SORT_COLUMNS[sort])
+        if limit is not None:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+        return [self._to_task(row) for row in self.database.connection().execute(sql, parameters)]
+
+    def iter_tasks(self, list_id: str | None = None, updated_since: datetime | None = None,
+                   batch_size: int = 1000) -> Iterator[Task]:
+        """
+        Yield the tasks a batch at a time; see `TaskRepository.iter_tasks`.
+        Every batch is a separate query, so no cursor is kept open between
+        batches and the generator may be resumed from any thread, each batch
+        using the connection of the thread it runs on. The tasks of a list are
+        paged by list position and the others by id, also when only the tasks
+        modified since a time are wanted: modification times change while
+        iterating and cannot be paged by.
+        """
+        since = _timestamp(updated_since) if updated_since else None
+        if list_id is not None:
+            after = None
+            while True:
+                tasks = self._page_of_list(list_id, batch_size, after, since)
+                yield from tasks
+                if len(tasks) < batch_size:
+                    return
+                after = tasks[-1].sort_key()
+        sql, parameters = 'SELECT * FROM tasks WHERE id > ?', []
+        if since is not None:
+            sql += ' AND updated_at >= ?'
+            parameters.append(since)
+        sql += ' ORDER BY id LIMIT ?'
+        after_id = ""
+        while True:
+            rows = self.database.connection().execute(sql, [after_id, *parameters, batch_size]).fetchall()
+            for row in rows:
+                yield self._to_task(row)
+            if len(rows) < batch_size:
+                return
+            after_id = rows[-1]['id']
+
+    def close(self) -> None:
+        """Close the database connections."""
+        self.database.close()
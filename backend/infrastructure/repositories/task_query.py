@@ -0,0 +1,64 @@
+from datetime import datetime
+from heapq import nlargest, nsmallest
+from itertools import islice
+from typing import Callable, Iterable, List, Optional
+from application.ports.outbound.repositories.task_repository import TASK_QUERY_SORTS
+from domain.models.task import Task
+
+
+def naive(value: datetime) -> datetime:
+    """Drop the time zone, so that stored and requested dates always compare."""
+    return value.replace(tzinfo=None)
+
+
+def sort_key(sort: str) -> Callable[[Task], tuple]:
+    """Key function ordering tasks as `TaskRepository.query` does for `sort`."""
+    if sort == "order":
+        return Task.sort_key
+    if sort == "due_date":
+        return lambda task: (task.due_date is None, naive(task.due_date) if task.due_date else datetime.min, task.id)
+    if sort == "created_at":
+        return lambda task: (naive(task.created_at), task.id)
+    raise ValueError(f"Unknown sort {sort}, expected one of: {', '.join(TASK_QUERY_SORTS)}")
+
+
+def matcher(done: Optional[bool] = None, owner: Optional[str] = None, list_id: Optional[str] = None,
+            due_after: Optional[datetime] = None, due_before: Optional[datetime] = None) -> Callable[[Task], bool]:
+    """Predicate telling whether a task passes every given `TaskRepository.query` filter."""
+    due_after = naive(due_after) if due_after else None
+    due_before = naive(due_before) if due_before else None
+
+    def matches(task: Task) -> bool:
+        if done is not None and task.done != done:
+            return False
+        if owner is not None and task.owner != owner:
+            return False
+        if list_id is not None and task.list_id != list_id:
+            return False
+        if due_after is not None or due_before is not None:
+            if task.due_date is None:
+                return False
+            due = naive(task.due_date)
+            if due_after is not None and due < due_after:
+                return False
+            if due_before is not None and due >= due_before:
+                return False
+        return True
+    return matches
+
+
+def select(tasks: Iterable[Task], matches: Callable[[Task], bool], sort: str = "order", descending: bool = False,
+           limit: Optional[int] = None, presorted: bool = False) -> List[Task]:
+    """
+    Keep the tasks that match, ordered by `sort` and cut at `limit`. When
+    `presorted`, `tasks` already come in ascending `sort` order and are only
+    read until `limit` of them matched.
+    """
+    key = sort_key(sort)
+    matching = (task for task in tasks if matches(task))
+    if presorted and not descending:
+        return list(islice(matching, limit))
+    if limit is None:
+        return sorted(matching, key=key, reverse=descending)
+    # Keeps only `limit` tasks at a time: O(n log limit)
+    return (nlargest if descending else nsmallest)(limit, matching, key=key)
@@ -1,11 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from infrastructure.api.routes import (
     task,
-    lists
+    lists,
+    transfer
 )
+from dependencies.get_task_repo import get_task_repository
+from dependencies.get_task_list_repo import get_task_list_repository
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Commit the writes still waiting in the repositories before exiting
+    get_task_repository().close()
+    get_task_list_repository().close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,3 +30,4 @@ app.add_middleware(
 
 app.include_router(task.router)
 app.include_router(lists.router)
+app.include_router(transfer.router)
@@ -0,0 +1,8 @@
+from datetime import datetime
+from domain.models.task import Task
+
+
+def make_task(title="Task", list_id="list-1", **fields):
+    """A valid task created on a fixed day; any other Task argument can be given in `fields`."""
+    defaults = {"description": "desc", "due_date": None, "attachment": None, "created_at": datetime(2024, 1, 1)}
+    return Task(title=title, list_id=list_id, **{**defaults, **fields})
@@ -197,3 +197,54 @@ class TestListsRoutes:
         # Verify it was actually deleted by trying to get it
         response = client.get(f"/lists/{list_id}")
         assert response.status_code == 500  # Not found returns 500 in your implementation
+
+    def test_get_tasks_of_list_paginated(self, setup_test_environment):
+        """Test walking the tasks of a list page by page with the cursor"""
+        _, task_repo = setup_test_environment
+
+        create_response = client.post("/lists/", json={"name": f"Paginated List {uuid4()}"})
+        list_id = create_response.json()["data"]["id"]
+        for order in [3, 1, 2, 0, 4]:
+            client.post("/task/", json={"title": f"Task {order}", "description": "", "list_id": list_id, "order": order})
+
+        orders, cursor = [], None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get(f"/lists/{list_id}/tasks", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            assert data["successful"] is True
+            assert len(data["data"]) <= 2
+            orders.extend(task["order"] for task in data["data"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert orders == [0, 1, 2, 3, 4]
+
+    def test_get_tasks_of_list_invalid_cursor(self, setup_test_environment):
+        """Test that a malformed cursor is reported as an error"""
+        response = client.get(f"/lists/{uuid4()}/tasks", params={"limit": 2, "cursor": "bogus"})
+        assert response.status_code == 500
+        assert "Invalid cursor" in response.json()["error"]
+
+    def test_conditional_get_of_lists_and_their_tasks(self, setup_test_environment):
+        """Test that unchanged lists and tasks are answered with 304 Not Modified"""
+        list_id = client.post("/lists/", json={"name": f"Polled List {uuid4()}"}).json()["data"]["id"]
+        client.post("/task/", json={"title": "Polled", "description": "", "list_id": list_id})
+
+        for url in ["/lists/", f"/lists/{list_id}", f"/lists/{list_id}/tasks"]:
+            response = client.get(url)
+            etag = response.headers["ETag"]
+            response = client.get(url, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.content == b""
+
+        etag = client.get(f"/lists/{list_id}/tasks").headers["ETag"]
+        client.post("/task/", json={"title": "Another", "description": "", "list_id": list_id})
+        response = client.get(f"/lists/{list_id}/tasks", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 2
+        assert response.headers["ETag"] != etag
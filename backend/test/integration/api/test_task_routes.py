@@ -6,10 +6,13 @@ from domain.models.task import Task
 from domain.models.list import TaskList
 from infrastructure.repositories.json_task_repository import JsonTaskRepository
 from infrastructure.repositories.json_task_list_repository import JsonTaskListRepository
+from infrastructure.repositories.local_attachment_repository import LocalAttachmentRepository
+import base64
+import hashlib
 import os
 import json
 import shutil
-from datetime import datetime
+from datetime import datetime, timedelta
 
 client = TestClient(app)
 
@@ -37,10 +40,12 @@ def setup_test_environment():
     # Patch the dependency injection to use our test files
     import dependencies.get_task_list_repo
     import dependencies.get_task_repo
+    import dependencies.get_attachment_repo
     
     # Store original functions
     original_get_task_list_repo = dependencies.get_task_list_repo.get_task_list_repository
     original_get_task_repo = dependencies.get_task_repo.get_task_repository
+    original_get_attachment_repo = dependencies.get_attachment_repo.get_attachment_repository
     
     # Create test repositories
     task_list_repo = JsonTaskListRepository(file_path=task_lists_file)
@@ -64,6 +69,7 @@ def setup_test_environment():
     # Patch the dependency functions
     dependencies.get_task_list_repo._task_list_repo_instance = task_list_repo
     dependencies.get_task_repo._task_repo_instance = task_repo
+    dependencies.get_attachment_repo._attachment_repo_instance = LocalAttachmentRepository(os.path.join(test_data_dir, "attachments"))
     
     # Yield test data and repositories
     yield {
@@ -77,6 +83,7 @@ def setup_test_environment():
     # Restore original functions
     dependencies.get_task_list_repo._task_list_repo_instance = original_get_task_list_repo()
     dependencies.get_task_repo._task_repo_instance = original_get_task_repo()
+    dependencies.get_attachment_repo._attachment_repo_instance = original_get_attachment_repo()
     
     # Cleanup
     if os.path.exists(test_data_dir):
@@ -180,3 +187,251 @@ class TestTaskRoutes:
         # Check if all returned tasks have the correct list_id
         for task in data["data"]:
             assert task["list_id"] == test_list_id
+
+    def test_create_tasks_batch(self, setup_test_environment):
+        """Test creating several tasks with one request"""
+        test_list_id = setup_test_environment["test_list_id"]
+        task_repo = setup_test_environment["task_repo"]
+
+        batch = [{"title": f"Batch Task {i}", "description": "", "list_id": test_list_id, "order": i} for i in range(3)]
+        batch.append({"title": "Orphan", "description": "", "list_id": str(uuid4())})
+
+        response = client.post("/task/batch", json=batch)
+        assert response.status_code == 200
+        results = response.json()["data"]
+        assert [result["successful"] for result in results] == [True, True, True, False]
+        assert "does not exist" in results[3]["error"]
+        for result in results[:3]:
+            assert result["data"]["id"] in task_repo.tasks
+
+    def test_create_tasks_batch_validates_whole_array(self, setup_test_environment):
+        """Test that a schema error anywhere in the batch rejects the request"""
+        test_list_id = setup_test_environment["test_list_id"]
+
+        response = client.post("/task/batch", json=[{"title": "Valid", "description": "", "list_id": test_list_id}, {"title": "No list"}])
+        assert response.status_code == 422
+
+    def test_update_tasks_batch(self, setup_test_environment):
+        """Test updating several tasks with one request"""
+        test_task_id = setup_test_environment["test_task_id"]
+        task_repo = setup_test_environment["task_repo"]
+
+        response = client.put("/task/batch", json=[
+            {"id": test_task_id, "order": 5, "done": True},
+            {"id": str(uuid4()), "order": 1}
+        ])
+        assert response.status_code == 200
+        results = response.json()["data"]
+        assert results[0]["successful"] is True
+        assert results[0]["data"]["order"] == 5
+        assert results[1]["successful"] is False
+        assert task_repo.get_by_id(test_task_id).done is True
+
+    def test_delete_tasks_batch(self, setup_test_environment):
+        """Test deleting several tasks with one request"""
+        test_task_id = setup_test_environment["test_task_id"]
+        task_repo = setup_test_environment["task_repo"]
+        missing_id = str(uuid4())
+
+        response = client.request("DELETE", "/task/batch", json={"ids": [test_task_id, missing_id]})
+        assert response.status_code == 200
+        results = response.json()["data"]
+        assert results[0] == {"successful": True, "id": test_task_id}
+        assert results[1]["successful"] is False
+        assert test_task_id not in task_repo.tasks
+
+    def test_upload_and_download_attachment(self, setup_test_environment):
+        """Test streaming an attachment in and out of the blob store"""
+        test_task_id = setup_test_environment["test_task_id"]
+        content = bytes(range(256)) * 1000
+
+        response = client.put(f"/task/{test_task_id}/attachment", content=content)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["attachment_id"] == hashlib.sha256(content).hexdigest()
+        assert data["attachment_size"] == len(content)
+        assert data["attachment"] is None
+
+        response = client.get(f"/task/{test_task_id}/attachment")
+        assert response.status_code == 200
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.content == content
+
+    def test_download_attachment_range(self, setup_test_environment):
+        """Test Range requests on attachment downloads"""
+        test_task_id = setup_test_environment["test_task_id"]
+        content = b"0123456789"
+        client.put(f"/task/{test_task_id}/attachment", content=content)
+
+        response = client.get(f"/task/{test_task_id}/attachment", headers={"Range": "bytes=2-5"})
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 2-5/10"
+        assert response.content == b"2345"
+
+        response = client.get(f"/task/{test_task_id}/attachment", headers={"Range": "bytes=-3"})
+        assert response.status_code == 206
+        assert response.content == b"789"
+
+        response = client.get(f"/task/{test_task_id}/attachment", headers={"Range": "bytes=20-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    def test_create_task_stores_attachment_out_of_line(self, setup_test_environment):
+        """Test that inline base64 attachments end up in the blob store"""
+        test_list_id = setup_test_environment["test_list_id"]
+        content = b"\x00\xffbinary"
+
+        response = client.post("/task/", json={
+            "title": "With attachment",
+            "description": "",
+            "list_id": test_list_id,
+            "attachment": base64.b64encode(content).decode("ascii")
+        })
+        assert response.status_code == 201
+        data = response.json()["data"]
+        assert data["attachment"] is None
+        assert data["attachment_size"] == len(content)
+
+        response = client.get(f"/task/{data['id']}/attachment")
+        assert response.content == content
+
+    def test_get_tasks_by_list_lean_projection(self, setup_test_environment):
+        """Test that collection reads return a lean projection unless fields are requested"""
+        test_list_id = setup_test_environment["test_list_id"]
+
+        response = client.get(f"/lists/{test_list_id}/tasks")
+        assert set(response.json()["data"][0]) == {"id", "title", "list_id", "done", "order"}
+
+        response = client.get(f"/lists/{test_list_id}/tasks", params={"fields": "id,description"})
+        assert set(response.json()["data"][0]) == {"id", "description"}
+
+        response = client.get(f"/lists/{test_list_id}/tasks", params={"fields": "all"})
+        assert "attachment_id" in response.json()["data"][0]
+
+        response = client.get(f"/lists/{test_list_id}/tasks", params={"fields": "id,nope"})
+        assert response.status_code == 500
+        assert "Unknown task field(s): nope" in response.json()["error"]
+
+    def test_get_task_with_fields(self, setup_test_environment):
+        """Test field projection on a single task read"""
+        test_task_id = setup_test_environment["test_task_id"]
+
+        response = client.get(f"/task/{test_task_id}", params={"fields": "id,title"})
+        assert response.json()["data"] == {"id": test_task_id, "title": "Test Task"}
+
+    def test_get_task_after_update_is_not_stale(self, setup_test_environment):
+        """Test a cached task body is dropped when the task is updated"""
+        test_task_id = setup_test_environment["test_task_id"]
+        test_list_id = setup_test_environment["test_list_id"]
+
+        assert client.get(f"/task/{test_task_id}").json()["data"]["title"] == "Test Task"
+        assert client.get(f"/lists/{test_list_id}/tasks").json()["data"][0]["title"] == "Test Task"
+
+        client.put(f"/task/{test_task_id}", json={"title": "Renamed"})
+        assert client.get(f"/task/{test_task_id}").json()["data"]["title"] == "Renamed"
+        assert client.get(f"/lists/{test_list_id}/tasks").json()["data"][0]["title"] == "Renamed"
+
+    def test_query_tasks(self, setup_test_environment):
+        """Test filtering and sorting tasks across lists"""
+        test_list_id = setup_test_environment["test_list_id"]
+
+        batch = [{"title": f"Due {day}", "description": "", "list_id": test_list_id, "owner": "ana",
+                  "due_date": f"2024-01-{day:02d}T09:00:00", "done": day == 4} for day in (6, 2, 4)]
+        client.post("/task/batch", json=batch)
+
+        response = client.get("/task/", params={"owner": "ana", "done": "false", "sort": "due_date"})
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()["data"]] == ["Due 2", "Due 6"]
+
+        response = client.get("/task/", params={"due_after": "2024-01-03", "due_before": "2024-01-10",
+                                                "sort": "due_date", "descending": "true", "fields": "title,done"})
+        assert response.json()["data"] == [{"title": "Due 6", "done": False}, {"title": "Due 4", "done": True}]
+
+        response = client.get("/task/", params={"sort": "title"})
+        assert response.status_code == 500
+        assert "Unknown sort" in response.json()["error"]
+
+    def test_search_tasks(self, setup_test_environment):
+        """Test full-text search over title, description and checklist"""
+        test_list_id = setup_test_environment["test_list_id"]
+
+        client.post("/task/batch", json=[
+            {"title": "Buy groceries", "description": "milk and bread", "list_id": test_list_id},
+            {"title": "Milk the cow", "description": "", "list_id": test_list_id},
+        ])
+        response = client.get("/task/search", params={"q": "milk", "fields": "title"})
+        assert response.status_code == 200
+        assert response.json()["data"] == [{"title": "Milk the cow"}, {"title": "Buy groceries"}]
+
+        task_id = setup_test_environment["test_task_id"]
+        client.put(f"/task/{task_id}", json={"checklist": ["buy milk"]})
+        assert len(client.get("/task/search", params={"q": "mil"}).json()["data"]) == 3
+        assert client.get("/task/search", params={"q": "bread groc"}).json()["data"][0]["title"] == "Buy groceries"
+
+    def test_overdue_and_due_soon_tasks(self, setup_test_environment):
+        """Test listing overdue tasks and tasks due within some days, across lists"""
+        test_list_id = setup_test_environment["test_list_id"]
+        now = datetime.now()
+
+        def due_in(hours):
+            return (now + timedelta(hours=hours)).isoformat()
+
+        client.post("/task/batch", json=[
+            {"title": "Late", "description": "", "list_id": test_list_id, "due_date": due_in(-30)},
+            {"title": "Later", "description": "", "list_id": test_list_id, "due_date": due_in(-2)},
+            {"title": "Late but done", "description": "", "list_id": test_list_id, "due_date": due_in(-5), "done": True},
+            {"title": "Tomorrow", "description": "", "list_id": test_list_id, "due_date": due_in(20)},
+            {"title": "Next week", "description": "", "list_id": test_list_id, "due_date": due_in(24 * 7)},
+        ])
+
+        response = client.get("/task/overdue")
+        assert response.status_code == 200
+        overdue = response.json()["data"]
+        assert [task["title"] for task in overdue] == ["Late", "Later"]
+        assert "due_date" in overdue[0]
+
+        soon = client.get("/task/due-soon", params={"days": 2}).json()["data"]
+        assert [task["title"] for task in soon] == ["Tomorrow"]
+        week = client.get("/task/due-soon", params={"days": 8, "fields": "title"}).json()["data"]
+        assert week == [{"title": "Tomorrow"}, {"title": "Next week"}]
+        assert client.get("/task/due-soon", params={"days": 0}).status_code == 422
+
+    def test_move_task(self, setup_test_environment):
+        """Test moving a task before another one of a list"""
+        test_list_id = setup_test_environment["test_list_id"]
+        test_task_id = setup_test_environment["test_task_id"]
+
+        created = client.post("/task/batch", json=[
+            {"title": f"Card {i}", "description": "", "list_id": test_list_id, "order": i * 1024} for i in (1, 2)
+        ]).json()["data"]
+        first_id = created[0]["data"]["id"]
+
+        response = client.post(f"/task/{test_task_id}/move", json={"list_id": test_list_id, "after_id": first_id})
+        assert response.status_code == 200
+        assert response.json()["data"]["order"] == 1536
+        titles = [task["title"] for task in client.get(f"/lists/{test_list_id}/tasks").json()["data"]]
+        assert titles == ["Card 1", "Test Task", "Card 2"]
+
+        response = client.post(f"/task/{test_task_id}/move", json={"list_id": test_list_id, "before_id": str(uuid4())})
+        assert response.status_code == 500
+        assert "is not in list" in response.json()["error"]
+
+    def test_move_tasks_batch(self, setup_test_environment):
+        """Test moving the tasks of one list that match a filter to another list"""
+        test_list_id = setup_test_environment["test_list_id"]
+        task_repo = setup_test_environment["task_repo"]
+        target_id = client.post("/lists/", json={"name": "Archive"}).json()["data"]["id"]
+
+        client.post("/task/batch", json=[
+            {"title": f"Done {i}", "description": "", "list_id": test_list_id, "done": True} for i in range(3)
+        ])
+        response = client.post("/task/batch/move", json={"list_id": target_id, "from_list_id": test_list_id, "done": True})
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 3
+        assert {task.title for task in task_repo.get_by_list_id(target_id)} == {"Done 0", "Done 1", "Done 2"}
+        assert [task.title for task in task_repo.get_by_list_id(test_list_id)] == ["Test Task"]
+
+        missing_id = str(uuid4())
+        response = client.post("/task/batch/move", json={"list_id": str(uuid4()), "ids": [missing_id]})
+        assert response.status_code == 500
+        assert "does not exist" in response.json()["error"]
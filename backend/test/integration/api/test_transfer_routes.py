@@ -0,0 +1,244 @@
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from domain.models.task import Task
+from domain.models.list import TaskList
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from infrastructure.repositories.json_task_list_repository import JsonTaskListRepository
+from infrastructure.repositories.local_attachment_repository import LocalAttachmentRepository
+import os
+import json
+import shutil
+from datetime import datetime
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="function")
+def setup_test_environment():
+    """Setup test environment with actual repositories pointing to test files"""
+    test_data_dir = "/tmp/toDoTest_transfer_test_data"
+    if os.path.exists(test_data_dir):
+        shutil.rmtree(test_data_dir)
+    os.makedirs(test_data_dir)
+
+    task_lists_file = os.path.join(test_data_dir, "task_lists.json")
+    tasks_file = os.path.join(test_data_dir, "tasks.json")
+    for file_path in (task_lists_file, tasks_file):
+        with open(file_path, "w") as f:
+            json.dump([], f)
+
+    import dependencies.get_task_list_repo
+    import dependencies.get_task_repo
+    import dependencies.get_attachment_repo
+
+    original_get_task_list_repo = dependencies.get_task_list_repo.get_task_list_repository
+    original_get_task_repo = dependencies.get_task_repo.get_task_repository
+    original_get_attachment_repo = dependencies.get_attachment_repo.get_attachment_repository
+
+    task_list_repo = JsonTaskListRepository(file_path=task_lists_file)
+    task_repo = JsonTaskRepository(file_path=tasks_file)
+
+    test_list = TaskList(name="Test List")
+    test_list.id = "test-list-id"
+    task_list_repo.save(test_list)
+    other_list = TaskList(name="Other List")
+    other_list.id = "other-list-id"
+    task_list_repo.save(other_list)
+
+    dependencies.get_task_list_repo._task_list_repo_instance = task_list_repo
+    dependencies.get_task_repo._task_repo_instance = task_repo
+    attachment_repo = LocalAttachmentRepository(os.path.join(test_data_dir, "attachments"))
+    dependencies.get_attachment_repo._attachment_repo_instance = attachment_repo
+
+    yield {
+        "task_repo": task_repo,
+        "task_list_repo": task_list_repo,
+        "attachment_repo": attachment_repo,
+        "test_list_id": test_list.id,
+        "other_list_id": other_list.id
+    }
+
+    dependencies.get_task_list_repo._task_list_repo_instance = original_get_task_list_repo()
+    dependencies.get_task_repo._task_repo_instance = original_get_task_repo()
+    dependencies.get_attachment_repo._attachment_repo_instance = original_get_attachment_repo()
+
+    if os.path.exists(test_data_dir):
+        shutil.rmtree(test_data_dir)
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestTransferRoutes:
+
+    def test_export_streams_lists_then_tasks(self, setup_test_environment):
+        """Test the export holds every list followed by every task, one record per line"""
+        task_repo = setup_test_environment["task_repo"]
+        tasks = [
+            task_repo.save(Task(title=f"Task {i}", list_id=list_id, description=None, due_date=None,
+                                attachment=None, created_at=datetime(2024, 1, 1), order=i))
+            for i, list_id in enumerate(["test-list-id", "other-list-id", "test-list-id"])
+        ]
+
+        response = client.get("/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = read_ndjson(response)
+        assert [record["type"] for record in records] == ["list", "list", "task", "task", "task"]
+        assert {record["data"]["id"] for record in records[:2]} == {"test-list-id", "other-list-id"}
+        assert [record["data"]["id"] for record in records[2:]] == [task.id for task in tasks]
+        assert records[2]["data"] == tasks[0].to_stored_dict()
+
+        response = client.get("/export", params={"list_id": "test-list-id"})
+        records = read_ndjson(response)
+        assert [record["data"]["id"] for record in records] == ["test-list-id", tasks[0].id, tasks[2].id]
+
+    def test_export_filters_tasks_by_modification_time(self, setup_test_environment):
+        """Test only the tasks modified at or after `modified_since` are exported"""
+        task_repo = setup_test_environment["task_repo"]
+        old = task_repo.save(Task(title="Old", list_id="test-list-id", description=None, due_date=None,
+                                  attachment=None, created_at=datetime(2024, 1, 1)))
+        changed = task_repo.save(Task(title="Changed", list_id="test-list-id", description=None, due_date=None,
+                                      attachment=None, created_at=datetime(2024, 1, 1)))
+        changed.update(title="Changed again")
+        task_repo.save(changed)
+
+        response = client.get("/export", params={"modified_since": "2025-01-01T00:00:00"})
+        records = read_ndjson(response)
+        task_ids = [record["data"]["id"] for record in records if record["type"] == "task"]
+        assert task_ids == [changed.id]
+        assert old.id not in task_ids
+
+    def test_export_of_missing_list(self, setup_test_environment):
+        """Test exporting a list that does not exist"""
+        response = client.get("/export", params={"list_id": "missing"})
+        assert response.status_code == 500
+        data = response.json()
+        assert data["successful"] is False
+        assert "Error exporting" in data["error"]
+
+    def test_import_round_trips_an_export(self, setup_test_environment):
+        """Test an exported file imports into an empty store with the same lists and tasks"""
+        task_repo = setup_test_environment["task_repo"]
+        task_list_repo = setup_test_environment["task_list_repo"]
+        tasks = [
+            task_repo.save(Task(title=f"Task {i}", list_id="test-list-id", description="desc", due_date=datetime(2024, 2, 1),
+                                attachment=None, checklist=["a"], created_at=datetime(2024, 1, 1), order=i))
+            for i in range(3)
+        ]
+        exported = client.get("/export").content
+        for task in tasks:
+            task_repo.delete(task.id)
+        for task_list in task_list_repo.get_all():
+            task_list_repo.delete(task_list.id)
+
+        response = client.post("/import", content=exported, headers={"Content-Type": "application/x-ndjson"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["successful"] is True
+        assert data["data"]["imported"] == {"lists": 2, "tasks": 3}
+        assert data["data"]["failed"] == 0
+        assert {task_list.id for task_list in task_list_repo.get_all()} == {"test-list-id", "other-list-id"}
+        for task in tasks:
+            assert task_repo.get_by_id(task.id).to_dict() == task.to_dict()
+
+    def test_import_round_trips_creation_times(self, setup_test_environment):
+        """Test tasks of equal order come back with their creation times, so in the same order"""
+        task_repo = setup_test_environment["task_repo"]
+        tasks = [
+            task_repo.save(Task(title=f"Task {hour}", list_id="test-list-id", description="", due_date=None,
+                                attachment=None, created_at=datetime(2024, 1, 1, hour, 30), order=0))
+            for hour in (11, 9, 10)
+        ]
+        exported = client.get("/export", params={"list_id": "test-list-id"}).content
+        for task in tasks:
+            task_repo.delete(task.id)
+
+        response = client.post("/import", content=exported)
+        assert response.json()["data"]["failed"] == 0
+        for task in tasks:
+            assert task_repo.get_by_id(task.id).created_at == task.created_at
+        assert [task.title for task in task_repo.get_by_list_id("test-list-id")] == ["Task 9", "Task 10", "Task 11"]
+
+    def test_import_round_trips_inline_attachments(self, setup_test_environment):
+        """Test an attachment kept inline is exported and imported with the same content"""
+        task_repo = setup_test_environment["task_repo"]
+        attachment_repo = setup_test_environment["attachment_repo"]
+        # Text that is also valid base64 must not be decoded as such
+        task = task_repo.save(Task(title="With attachment", list_id="test-list-id", description="", due_date=None,
+                                   attachment=b"abcd", created_at=datetime(2024, 1, 1)))
+        exported = client.get("/export", params={"list_id": "test-list-id"}).content
+        task_repo.delete(task.id)
+
+        response = client.post("/import", content=exported)
+        data = response.json()["data"]
+        assert data["failed"] == 0
+        assert data["imported"]["tasks"] == 1
+        imported = task_repo.get_by_id(task.id)
+        assert imported.attachment_size == 4
+        with attachment_repo.open(imported.attachment_id) as stream:
+            assert stream.read() == b"abcd"
+
+    def test_import_reports_errors_by_line(self, setup_test_environment):
+        """Test invalid lines are reported with their line numbers while the valid ones are imported"""
+        task_repo = setup_test_environment["task_repo"]
+        lines = [
+            {"type": "list", "data": {"id": "imported-list", "name": "Imported"}},
+            {"type": "task", "data": {"title": "Kept", "description": "", "list_id": "imported-list"}},
+            "not json",
+            {"type": "task", "data": {"description": "", "list_id": "imported-list"}},
+            {"type": "task", "data": {"title": "Orphan", "description": "", "list_id": "missing"}},
+            {"type": "comment", "data": {}},
+        ]
+        body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n\n"
+
+        response = client.post("/import", content=body)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["imported"] == {"lists": 1, "tasks": 1}
+        assert data["failed"] == 4
+        assert [error["line"] for error in data["errors"]] == [3, 4, 5, 6]
+        assert "title" in data["errors"][1]["error"]
+        assert "does not exist" in data["errors"][2]["error"]
+        assert [task.title for task in task_repo.get_by_list_id("imported-list")] == ["Kept"]
+
+    def test_import_stores_times_with_time_zones_in_utc(self, setup_test_environment):
+        """Test aware and naive creation times of one list are imported together and sorted"""
+        task_repo = setup_test_environment["task_repo"]
+        lines = [
+            {"type": "task", "data": {"id": f"t{i}", "title": f"Task {i}", "description": "", "list_id": "test-list-id",
+                                      "created_at": created_at, "updated_at": created_at}}
+            for i, created_at in enumerate(["2024-01-01T00:30:00", "2024-01-01T00:00:00Z", "2024-01-01T02:00:00+02:00"])
+        ]
+        body = "".join(json.dumps(line) + "\n" for line in lines)
+
+        response = client.post("/import", content=body)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["imported"] == {"lists": 0, "tasks": 3}
+        assert data["failed"] == 0
+        assert task_repo.get_by_id("t1").created_at == datetime(2024, 1, 1)
+        assert task_repo.get_by_id("t2").updated_at == datetime(2024, 1, 1)
+        assert [task.id for task in task_repo.get_by_list_id("test-list-id")] == ["t1", "t2", "t0"]
+
+    def test_import_reads_the_body_in_batches(self, setup_test_environment, monkeypatch):
+        """Test records split across chunks are rejoined and committed a batch at a time"""
+        import infrastructure.api.routes.transfer as transfer
+        monkeypatch.setattr(transfer, "IMPORT_BATCH_RECORDS", 4)
+        task_repo = setup_test_environment["task_repo"]
+        body = "".join(
+            json.dumps({"type": "task", "data": {"title": f"Task {i}", "description": "", "list_id": "other-list-id"}}) + "\n"
+            for i in range(10)
+        ).encode()
+
+        def chunks():
+            for start in range(0, len(body), 7):
+                yield body[start:start + 7]
+
+        response = client.post("/import", content=chunks())
+        data = response.json()["data"]
+        assert data["imported"] == {"lists": 0, "tasks": 10}
+        assert data["batches"] == 3
+        assert sorted(task.title for task in task_repo.get_by_list_id("other-list-id")) == sorted(f"Task {i}" for i in range(10))
@@ -128,3 +128,23 @@ class TestCreateTaskService:
             
         assert "Database error" in str(excinfo.value)
         self.task_repository.save.assert_called_once()
+
+    def test_create_task_moves_attachment_out_of_line(self):
+        """Inline attachment bytes are stored in the attachment repository."""
+        attachment_repository = Mock()
+        attachment_repository.put.return_value = ("a" * 64, 4)
+        self.task_list_repository.get_by_id.return_value = TaskList(name="Sample List", id=self.list_id)
+        service = CreateTaskService(self.task_repository, self.task_list_repository, attachment_repository)
+
+        result = service.execute(
+            title=self.title,
+            list_id=self.list_id,
+            description=self.description,
+            due_date=self.due_date,
+            attachment=b"data"
+        )
+
+        attachment_repository.put.assert_called_once_with(b"data")
+        assert result.attachment is None
+        assert result.attachment_id == "a" * 64
+        assert result.attachment_size == 4
@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+from application.usecases.task.create_tasks_batch import CreateTasksBatchService
+from domain.models.list import TaskList
+from domain.models.task import Task
+
+class TestCreateTasksBatchService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.task_repository = Mock()
+        self.task_list_repository = Mock()
+        self.service = CreateTasksBatchService(self.task_repository, self.task_list_repository)
+        self.list_id = str(uuid4())
+        self.task_list_repository.get_by_id.side_effect = lambda list_id: (
+            TaskList(name="List", id=list_id) if list_id == self.list_id else None
+        )
+
+    def test_create_tasks_batch_success(self):
+        """All tasks are saved with one call and the list is looked up once."""
+        items = [{"title": f"Task {i}", "list_id": self.list_id, "description": None} for i in range(50)]
+
+        results = self.service.execute(items)
+
+        assert [result.title for result in results] == [f"Task {i}" for i in range(50)]
+        self.task_list_repository.get_by_id.assert_called_once_with(self.list_id)
+        self.task_repository.save_many.assert_called_once_with(results)
+
+    def test_create_tasks_batch_reports_invalid_items(self):
+        """Invalid items are reported in place and the valid ones are still saved."""
+        missing_list_id = str(uuid4())
+        items = [
+            {"title": "Valid", "list_id": self.list_id},
+            {"title": "", "list_id": self.list_id},
+            {"title": "Orphan", "list_id": missing_list_id},
+        ]
+
+        results = self.service.execute(items)
+
+        assert isinstance(results[0], Task)
+        assert "Title of the Task could not be empty" in str(results[1])
+        assert f"Task list with ID {missing_list_id} does not exist." in str(results[2])
+        self.task_repository.save_many.assert_called_once_with([results[0]])
+
+    def test_create_tasks_batch_repository_error(self):
+        """Test behavior when repository raises an exception."""
+        self.task_repository.save_many.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception) as excinfo:
+            self.service.execute([{"title": "Task", "list_id": self.list_id}])
+
+        assert "Database error" in str(excinfo.value)
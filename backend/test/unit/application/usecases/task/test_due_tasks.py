@@ -0,0 +1,34 @@
+import pytest
+from unittest.mock import Mock
+from datetime import datetime
+from application.usecases.task.get_overdue_tasks import GetOverdueTasksService
+from application.usecases.task.get_tasks_due_soon import GetTasksDueSoonService
+
+NOW = datetime(2024, 3, 1, 12, 0)
+
+
+class TestDueTasksServices:
+    def setup_method(self):
+        """Setup for each test."""
+        self.task_repository = Mock()
+        self.task_repository.query.return_value = []
+
+    def test_overdue_queries_pending_tasks_due_before_now(self):
+        """Test overdue tasks are the pending ones due before now, by due date."""
+        GetOverdueTasksService(self.task_repository).execute(limit=5, now=NOW)
+
+        self.task_repository.query.assert_called_once_with(done=False, due_before=NOW, sort="due_date", limit=5)
+
+    def test_due_soon_queries_the_next_days(self):
+        """Test tasks due soon are the pending ones due between now and now + days."""
+        GetTasksDueSoonService(self.task_repository).execute(2, now=NOW)
+
+        self.task_repository.query.assert_called_once_with(
+            done=False, due_after=NOW, due_before=datetime(2024, 3, 3, 12, 0), sort="due_date", limit=None
+        )
+
+    def test_due_soon_rejects_non_positive_days(self):
+        """Test a window of zero days is rejected before querying."""
+        with pytest.raises(ValueError):
+            GetTasksDueSoonService(self.task_repository).execute(0)
+        self.task_repository.query.assert_not_called()
@@ -0,0 +1,62 @@
+import pytest
+from unittest.mock import Mock
+from application.usecases.task.move_task import MoveTaskService
+from application.usecases.task.ordering import ORDER_GAP
+from domain.models.list import TaskList
+from domain.models.task import Task
+from test.factories import make_task
+
+
+class TestMoveTaskService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.tasks = {task.id: task for task in [make_task("a", order=1024, id="a"), make_task("b", order=2048, id="b"), make_task("c", order=2049, id="c"),
+                                                 make_task("x", list_id="list-2", order=0, id="x")]}
+        self.task_repository = Mock()
+        self.task_repository.get_by_id.side_effect = lambda id: self.tasks[id]
+        self.task_repository.get_by_list_id.side_effect = lambda list_id: sorted(
+            (task for task in self.tasks.values() if task.list_id == list_id), key=Task.sort_key
+        )
+        self.task_list_repository = Mock()
+        self.task_list_repository.get_by_id.side_effect = lambda list_id: TaskList(name="List", id=list_id)
+        self.service = MoveTaskService(self.task_repository, self.task_list_repository)
+
+    def titles(self, list_id="list-1"):
+        return [task.title for task in self.task_repository.get_by_list_id(list_id)]
+
+    def test_move_between_neighbours_saves_only_the_task(self):
+        """A move into a gap takes the middle key and is a single save."""
+        moved = self.service.execute("x", "list-1", before_id="b")
+
+        assert moved.order == 1536
+        assert self.titles() == ["a", "x", "b", "c"]
+        self.task_repository.save.assert_called_once_with(moved)
+        self.task_repository.save_many.assert_not_called()
+
+    def test_move_to_the_top_and_to_the_end(self):
+        """Without a neighbour on one side the key is one gap past the last or first task."""
+        assert self.service.execute("c", "list-1", before_id="a").order == 1024 - ORDER_GAP
+        assert self.service.execute("a", "list-1").order == 2048 + ORDER_GAP
+        assert self.titles() == ["c", "b", "a"]
+
+    def test_rebalances_when_no_key_is_left(self):
+        """Between adjacent keys the list is renumbered and saved with one write."""
+        moved = self.service.execute("x", "list-1", after_id="b")
+
+        assert self.titles() == ["a", "b", "x", "c"]
+        assert [task.order for task in self.task_repository.get_by_list_id("list-1")] == [1024, 2048, 3072, 4096]
+        saved = self.task_repository.save_many.call_args.args[0]
+        assert {task.title for task in saved} == {"x", "c"}
+        assert moved.list_id == "list-1"
+        self.task_repository.save.assert_not_called()
+
+    @pytest.mark.parametrize("arguments", [
+        {"before_id": "a", "after_id": "b"},
+        {"before_id": "x"},
+        {"after_id": "missing"},
+    ])
+    def test_rejects_invalid_neighbours(self, arguments):
+        """Neighbours must be a single other task of the target list."""
+        with pytest.raises(ValueError):
+            self.service.execute("x", "list-1", **arguments)
+        self.task_repository.save.assert_not_called()
@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import Mock
+from application.usecases.task.move_tasks_batch import MoveTasksBatchService
+from domain.models.list import TaskList
+from domain.models.task import Task
+from test.factories import make_task
+
+
+class TestMoveTasksBatchService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.tasks = {task.id: task for task in [make_task("a", order=2, id="a"), make_task("b", order=1, id="b"), make_task("c", order=3, id="c"),
+                                                 make_task("z", list_id="list-2", order=5000, id="z")]}
+        self.task_repository = Mock()
+        self.task_repository.get_by_id.side_effect = lambda id: self._get(id)
+        self.task_repository.query.side_effect = lambda list_id, descending=False, limit=None, **filters: sorted(
+            (task for task in self.tasks.values() if task.list_id == list_id and
+             all(getattr(task, field) == value for field, value in filters.items() if value is not None)),
+            key=Task.sort_key, reverse=descending
+        )[:limit]
+        self.task_list_repository = Mock()
+        self.task_list_repository.get_by_id.side_effect = lambda list_id: TaskList(name="List", id=list_id)
+        self.service = MoveTasksBatchService(self.task_repository, self.task_list_repository)
+
+    def _get(self, id):
+        if id not in self.tasks:
+            raise ValueError(f"Task with ID {id} does not exist.")
+        return self.tasks[id]
+
+    def test_moves_ids_to_the_end_of_the_target_list_with_one_write(self):
+        """The target list is checked once and the moved tasks are saved together, in order."""
+        moved, missing = self.service.execute("list-2", ids=["a", "missing", "b", "z"])
+
+        assert [task.id for task in moved] == ["b", "a"]
+        assert [task.order for task in moved] == [5000 + 1024, 5000 + 2048]
+        assert missing == ["missing"]
+        assert self.tasks["z"].order == 5000
+        self.task_list_repository.get_by_id.assert_called_once_with("list-2")
+        self.task_repository.save_many.assert_called_once_with(moved)
+
+    def test_moves_the_tasks_of_a_list_matching_filters(self):
+        """A filter moves the matching tasks of the source list only."""
+        self.tasks["c"].update(done=True)
+
+        moved, _ = self.service.execute("list-3", from_list_id="list-1", done=False)
+
+        assert [task.id for task in moved] == ["b", "a"]
+        assert [task.order for task in moved] == [1024, 2048]
+        assert self.tasks["c"].list_id == "list-1"
+
+    def test_requires_ids_or_a_source_list(self):
+        """Either the ids or the source list must be given, not both."""
+        with pytest.raises(ValueError):
+            self.service.execute("list-2")
+        with pytest.raises(ValueError):
+            self.service.execute("list-2", ids=["a"], from_list_id="list-1")
+        self.task_repository.save_many.assert_not_called()
+
+    def test_rejects_filters_with_ids(self):
+        """Filters select tasks of a source list; given together with ids they would be ignored."""
+        with pytest.raises(ValueError):
+            self.service.execute("list-2", ids=["a"], done=False)
+        self.task_repository.save_many.assert_not_called()
@@ -0,0 +1,34 @@
+import pytest
+from unittest.mock import Mock
+from datetime import datetime
+from application.usecases.task.query_tasks import QueryTasksService
+
+
+class TestQueryTasksService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.task_repository = Mock()
+        self.service = QueryTasksService(self.task_repository)
+
+    def test_query_passes_filters_to_repository(self):
+        """Test the filters and sort reach the repository unchanged."""
+        self.task_repository.query.return_value = []
+
+        result = self.service.execute(done=False, owner="ana", due_before=datetime(2024, 1, 1), sort="due_date", limit=10)
+
+        assert result == []
+        self.task_repository.query.assert_called_once_with(
+            done=False, owner="ana", list_id=None, due_after=None, due_before=datetime(2024, 1, 1),
+            sort="due_date", descending=False, limit=10
+        )
+
+    @pytest.mark.parametrize("arguments", [
+        {"sort": "title"},
+        {"limit": 0},
+        {"due_after": datetime(2024, 2, 1), "due_before": datetime(2024, 1, 1)},
+    ])
+    def test_query_rejects_invalid_arguments(self, arguments):
+        """Test invalid sorts, limits and date ranges are rejected before querying."""
+        with pytest.raises(ValueError):
+            self.service.execute(**arguments)
+        self.task_repository.query.assert_not_called()
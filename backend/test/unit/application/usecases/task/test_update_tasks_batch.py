@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+from datetime import datetime
+from application.usecases.task.update_tasks_batch import UpdateTasksBatchService
+from domain.models.task import Task
+
+class TestUpdateTasksBatchService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.task_repository = Mock()
+        self.service = UpdateTasksBatchService(self.task_repository)
+        self.tasks = {
+            task.id: task for task in (
+                Task(title=f"Task {i}", list_id=str(uuid4()), description=None, due_date=None,
+                     attachment=None, created_at=datetime.now())
+                for i in range(3)
+            )
+        }
+        self.task_repository.get_by_id.side_effect = lambda task_id: self.tasks.get(task_id)
+
+    def test_update_tasks_batch_success(self):
+        """Every update is applied and everything is saved with one call."""
+        updates = [(task_id, {"order": i, "done": True}) for i, task_id in enumerate(self.tasks)]
+
+        results = self.service.execute(updates)
+
+        assert [result.order for result in results] == [0, 1, 2]
+        assert all(result.done for result in results)
+        self.task_repository.save_many.assert_called_once()
+        assert len(self.task_repository.save_many.call_args[0][0]) == 3
+
+    def test_invalid_update_leaves_task_untouched(self):
+        """A failing update is reported and the stored task is not modified."""
+        task_id = next(iter(self.tasks))
+        missing_id = str(uuid4())
+
+        results = self.service.execute([(task_id, {"title": "Renamed", "done": "yes"}), (missing_id, {"done": True})])
+
+        assert "Status of the Task must be a True or False" in str(results[0])
+        assert f"Task with ID {missing_id} does not exist." in str(results[1])
+        assert self.tasks[task_id].title == "Task 0"
+        self.task_repository.save_many.assert_called_once_with([])
+
+    def test_repeated_task_keeps_every_update(self):
+        """Two updates of the same task in one batch are both applied."""
+        task_id = next(iter(self.tasks))
+
+        results = self.service.execute([(task_id, {"title": "Renamed"}), (task_id, {"done": True})])
+
+        assert results[0] is results[1]
+        assert results[1].title == "Renamed" and results[1].done is True
+        assert self.task_repository.save_many.call_args[0][0] == [results[1]]
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock
 from uuid import uuid4
 from domain.models.list import TaskList
+from application.usecases.lists.delete_task_list import DeleteTaskListService
 
 class TestDeleteTaskListService:
     def setup_method(self):
@@ -59,3 +60,17 @@ class TestDeleteTaskListService:
             
         assert "Database error" in str(excinfo.value)
         self.task_list_repository.delete.assert_called_once_with(self.task_list_id)
+
+
+class TestDeleteTaskListCascade:
+    def test_deletes_tasks_of_list_in_bulk(self):
+        """The cascade runs as one bulk delete instead of one delete per task."""
+        task_list_repository = Mock()
+        task_repository = Mock()
+        list_id = str(uuid4())
+
+        DeleteTaskListService(task_list_repository, task_repository).execute(list_id)
+
+        task_repository.delete_by_list_id.assert_called_once_with(list_id)
+        task_repository.delete.assert_not_called()
+        task_list_repository.delete.assert_called_once_with(list_id)
@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+from datetime import datetime
+from application.usecases.lists.get_tasks_page_of_list import GetTasksPageOfListService, decode_cursor, encode_cursor
+from domain.models.task import Task
+
+class TestGetTasksPageOfListService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.task_repository = Mock()
+        self.service = GetTasksPageOfListService(self.task_repository)
+        self.list_id = str(uuid4())
+        self.tasks = [
+            Task(title=f"Task {i}", list_id=self.list_id, description=None, due_date=None,
+                 attachment=None, created_at=datetime(2024, 1, 1), order=i)
+            for i in range(3)
+        ]
+
+    def test_returns_next_cursor_when_more_tasks_exist(self):
+        """The extra task fetched is not returned, but signals a next page."""
+        self.task_repository.get_page_by_list_id.return_value = self.tasks
+
+        tasks, next_cursor = self.service.execute(self.list_id, limit=2)
+
+        assert tasks == self.tasks[:2]
+        assert decode_cursor(next_cursor) == self.tasks[1].sort_key()
+        self.task_repository.get_page_by_list_id.assert_called_once_with(self.list_id, 3, None)
+
+    def test_last_page_has_no_cursor(self):
+        """No next cursor is returned once the list is exhausted."""
+        self.task_repository.get_page_by_list_id.return_value = self.tasks[2:]
+
+        cursor = encode_cursor(self.tasks[1].sort_key())
+        tasks, next_cursor = self.service.execute(self.list_id, limit=2, cursor=cursor)
+
+        assert tasks == self.tasks[2:]
+        assert next_cursor is None
+        self.task_repository.get_page_by_list_id.assert_called_once_with(self.list_id, 3, self.tasks[1].sort_key())
+
+    def test_invalid_cursor(self):
+        """A malformed cursor is rejected before reaching the repository."""
+        with pytest.raises(ValueError) as excinfo:
+            self.service.execute(self.list_id, limit=2, cursor="not-a-cursor")
+
+        assert "Invalid cursor" in str(excinfo.value)
+        self.task_repository.get_page_by_list_id.assert_not_called()
@@ -0,0 +1,45 @@
+import pytest
+from unittest.mock import Mock
+from datetime import datetime
+from application.usecases.transfer.export_data import ExportDataService
+
+
+class TestExportDataService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.task_repository = Mock()
+        self.task_list_repository = Mock()
+        self.service = ExportDataService(self.task_repository, self.task_list_repository)
+
+    def test_export_yields_lists_then_tasks(self):
+        """Test every list is exported before the tasks that reference it."""
+        task_lists = [Mock(), Mock()]
+        tasks = [Mock(), Mock(), Mock()]
+        self.task_list_repository.get_all.return_value = task_lists
+        self.task_repository.iter_tasks.return_value = iter(tasks)
+
+        records = list(self.service.execute())
+
+        assert records == [("list", task_list) for task_list in task_lists] + [("task", task) for task in tasks]
+        self.task_repository.iter_tasks.assert_called_once_with(list_id=None, updated_since=None)
+
+    def test_export_of_one_list_passes_filters_to_repository(self):
+        """Test a list and a modification time restrict the tasks read."""
+        task_list = Mock()
+        since = datetime(2024, 1, 1)
+        self.task_list_repository.get_by_id.return_value = task_list
+        self.task_repository.iter_tasks.return_value = iter([])
+
+        records = list(self.service.execute(list_id="list-1", modified_since=since))
+
+        assert records == [("list", task_list)]
+        self.task_list_repository.get_all.assert_not_called()
+        self.task_repository.iter_tasks.assert_called_once_with(list_id="list-1", updated_since=since)
+
+    def test_export_of_missing_list_fails_before_streaming(self):
+        """Test an unknown list is reported when the export is requested, not while it streams."""
+        self.task_list_repository.get_by_id.return_value = None
+
+        with pytest.raises(ValueError):
+            self.service.execute(list_id="missing")
+        self.task_repository.iter_tasks.assert_not_called()
@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+from datetime import datetime
+from domain.models.list import TaskList
+from domain.models.task import Task
+from application.usecases.transfer.import_data import ImportDataService
+
+
+class TestImportDataService:
+    def setup_method(self):
+        """Setup for each test."""
+        self.task_repository = Mock()
+        self.task_list_repository = Mock()
+        self.task_repository.save_many.side_effect = lambda tasks: tasks
+        self.task_list_repository.save_many.side_effect = lambda task_lists: task_lists
+        self.task_list_repository.existing_ids.side_effect = lambda ids: {id for id in ids if id == "stored-list"}
+        self.service = ImportDataService(self.task_repository, self.task_list_repository)
+
+    def test_import_saves_lists_and_tasks_with_one_write_each(self):
+        """Test a batch keeps ids and dates and references lists of the same batch."""
+        updated_at = datetime(2024, 3, 1, 10, 30)
+        results = self.service.execute([
+            ("task", {"id": "t1", "title": "First", "list_id": "new-list", "description": "", "updated_at": updated_at}),
+            ("list", {"id": "new-list", "name": "New", "order": 2}),
+            ("task", {"title": "Second", "list_id": "stored-list", "description": "", "done": True}),
+        ])
+
+        assert isinstance(results[1], TaskList) and results[1].id == "new-list"
+        assert isinstance(results[0], Task) and results[0].id == "t1"
+        assert results[0].updated_at == updated_at
+        assert results[2].done is True
+        self.task_list_repository.save_many.assert_called_once_with([results[1]])
+        self.task_repository.save_many.assert_called_once_with([results[0], results[2]])
+        self.task_list_repository.existing_ids.assert_called_once_with({"stored-list"})
+
+    def test_import_reports_invalid_records_and_keeps_the_rest(self):
+        """Test records that cannot be imported become errors without stopping the batch."""
+        results = self.service.execute([
+            ("task", {"title": "Orphan", "list_id": "missing", "description": ""}),
+            ("list", {"name": ""}),
+            ("task", {"title": "Kept", "list_id": "stored-list", "description": ""}),
+            ("task", {"title": "Unknown attachment", "list_id": "stored-list", "description": "", "attachment_id": "abc"}),
+            ("comment", {}),
+        ])
+
+        assert isinstance(results[0], ValueError)
+        assert isinstance(results[1], Exception)
+        assert isinstance(results[2], Task)
+        assert isinstance(results[3], ValueError)
+        assert isinstance(results[4], ValueError)
+        self.task_repository.save_many.assert_called_once_with([results[2]])
+
+    def test_known_lists_are_looked_up_once_per_import(self):
+        """Test later batches do not look up lists already known to exist."""
+        self.service.execute([("task", {"title": "A", "list_id": "stored-list", "description": ""})])
+        self.service.execute([("task", {"title": "B", "list_id": "stored-list", "description": ""})])
+
+        assert self.task_list_repository.existing_ids.call_args_list[1].args == (set(),)
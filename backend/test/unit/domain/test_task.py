@@ -96,3 +96,49 @@ def test_task_checklist_add_and_remove():
 	assert "item1" not in new_task.checklist
 	with pytest.raises(Exception):
 		new_task.remove_item_from_checklist("notfound")
+
+def test_task_to_dict_projection():
+	new_task = Task(title="A", list_id=str(uuid4()), description="desc", created_at=datetime.now(), due_date=None, attachment=None, order=3)
+	assert new_task.to_dict(("id", "title", "done", "order")) == {"id": new_task.id, "title": "A", "done": False, "order": 3}
+	assert new_task.to_dict(tuple(new_task.to_dict())) == new_task.to_dict()
+	with pytest.raises(ValueError):
+		new_task.to_dict(("id", "secret"))
+
+def test_task_is_compact_and_shares_identifiers():
+	first = Task.from_dict({"title": "A", "list_id": "".join(["list-", "1"]), "owner": "".join(["some", "one"]), "created_at": "2024-01-01"})
+	second = Task.from_dict({"title": "B", "list_id": "".join(["list-", "1"]), "owner": "".join(["some", "one"]), "created_at": "2024-01-01"})
+	assert not hasattr(first, "__dict__")
+	assert first.list_id is second.list_id
+	assert first.owner is second.owner
+	first.update(list_id="".join(["list-", "2"]))
+	second.update(list_id="".join(["list-", "2"]))
+	assert first.list_id is second.list_id
+
+def test_task_from_trusted_dict_matches_from_dict():
+	original = Task(title="A", list_id=str(uuid4()), description=None, created_at=datetime(2024, 1, 2), due_date=datetime(2024, 3, 4), attachment=b"file", checklist=["x"], owner="me", done=True, order=7)
+	data = original.to_dict()
+	trusted = Task.from_trusted_dict(data)
+	assert trusted.to_dict() == Task.from_dict(data).to_dict() == data
+	assert trusted.created_at == datetime(2024, 1, 2)
+
+def test_task_from_dict_accepts_unpadded_and_iso_dates():
+	task = Task.from_dict({"title": "A", "list_id": "l", "created_at": "2024-1-5", "due_date": "2024-02-01T10:30:00"})
+	assert task.created_at == datetime(2024, 1, 5)
+	assert task.due_date == datetime(2024, 2, 1, 10, 30)
+
+def test_task_tracks_modification_time():
+	created_at = datetime(2024, 1, 1, 12, 0)
+	new_task = Task(title="A", list_id=str(uuid4()), description="desc", created_at=created_at, due_date=None, attachment=None)
+	assert new_task.updated_at == created_at
+
+	new_task.update(title="B", updated_at=datetime(2000, 1, 1))
+	assert new_task.updated_at > created_at
+	modified = new_task.updated_at
+	new_task.mark_complete()
+	assert new_task.updated_at >= modified
+
+	restored = Task.from_dict(new_task.to_dict())
+	assert restored.updated_at == new_task.updated_at
+	legacy = new_task.to_dict()
+	del legacy["updated_at"]
+	assert Task.from_dict(legacy).updated_at == Task.from_dict(legacy).created_at
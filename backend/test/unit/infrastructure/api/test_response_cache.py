@@ -0,0 +1,64 @@
+from functools import partial
+from fastapi.responses import JSONResponse
+from domain.models.list import TaskList
+from infrastructure.api.response_cache import ResponseCache, data_response, join_fragments
+from infrastructure.repositories.json_task_list_repository import JsonTaskListRepository
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from test.factories import make_task
+
+# Text outside ASCII, so the cached encoding has to match JSONResponse's
+make_task = partial(make_task, title="Título", description="ñandú", owner="ana")
+
+
+class TestResponseCache:
+    def test_encodes_like_json_response(self):
+        task = make_task(checklist=["a", "b"])
+        cache = ResponseCache()
+
+        response = data_response(join_fragments([cache.fragment("task", task)]), next_cursor=None)
+        expected = JSONResponse(content={"successful": True, "data": [task.to_dict()], "next_cursor": None})
+        assert response.body == expected.body
+
+    def test_reuses_encoding_until_repository_changes(self, tmp_path):
+        repository = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        task = make_task()
+        repository.save(task)
+        cache = ResponseCache()
+        cache.watch("task", repository)
+
+        first = cache.fragment("task", task)
+        task.title = "Changed without saving"
+        assert cache.fragment("task", task) is first
+
+        repository.save(task)
+        assert b"Changed without saving" in cache.fragment("task", task)
+
+        repository.delete(task.id)
+        assert ("task", task.id) not in cache._fragments
+
+    def test_caches_each_field_selection(self):
+        task = make_task()
+        cache = ResponseCache()
+
+        assert cache.fragment("task", task, ("id", "title")) == f'{{"id":"{task.id}","title":"Título"}}'.encode()
+        assert b'"description"' in cache.fragment("task", task)
+        assert set(cache._fragments[("task", task.id)]) == {("id", "title"), None}
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entities=2)
+        first, second, third = make_task(), make_task(), make_task()
+        cache.fragment("task", first)
+        cache.fragment("task", second)
+        cache.fragment("task", first)
+        cache.fragment("task", third)
+
+        assert list(cache._fragments) == [("task", first.id), ("task", third.id)]
+
+    def test_watching_another_repository_drops_its_kind(self, tmp_path):
+        task_list = TaskList(name="Inbox")
+        cache = ResponseCache()
+        cache.fragment("list", task_list)
+        cache.fragment("task", make_task())
+
+        cache.watch("list", JsonTaskListRepository(file_path=str(tmp_path / "lists.json")))
+        assert [key[0] for key in cache._fragments] == ["task"]
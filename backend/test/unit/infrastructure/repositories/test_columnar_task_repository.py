@@ -0,0 +1,85 @@
+import random
+from collections import Counter
+from datetime import datetime
+import pytest
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from test.factories import make_task
+
+pytest.importorskip("numpy")
+from infrastructure.repositories.columnar_task_repository import ColumnarTaskRepository
+
+NOW = datetime(2024, 3, 1)
+
+
+@pytest.fixture
+def inner(tmp_path):
+    return JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+
+
+class TestColumnarTaskRepository:
+    def test_loads_existing_tasks_of_the_inner_repository(self, inner):
+        inner.save(make_task("A", owner="ana", done=True))
+        inner.save(make_task("B", owner="ana"))
+        repo = ColumnarTaskRepository(inner, capacity=1)
+
+        assert repo.count() == 2
+        assert repo.done_ratio() == 0.5
+        assert repo.owner_counts() == {"ana": 2}
+
+    def test_aggregates_match_a_scan_after_random_mutations(self, inner):
+        repo = ColumnarTaskRepository(inner, capacity=4)
+        rng = random.Random(7)
+        list_ids = [f"list-{i}" for i in range(4)]
+        owners = [None, "ana", "bob"]
+        for step in range(400):
+            action = rng.random()
+            if action < 0.5 or not inner.tasks:
+                due_date = rng.choice([None, datetime(2024, 2, 1), datetime(2024, 4, 1)])
+                repo.save(make_task(f"Task {step}", rng.choice(list_ids), owner=rng.choice(owners), due_date=due_date,
+                                    done=rng.random() < 0.5, order=rng.randint(0, 5)))
+            elif action < 0.8:
+                task = repo.get_by_id(rng.choice(list(inner.tasks)))
+                task.update(done=not task.done, owner=rng.choice(owners[1:]), list_id=rng.choice(list_ids))
+                repo.save(task)
+            elif action < 0.95:
+                repo.delete_many([rng.choice(list(inner.tasks))])
+            else:
+                repo.delete_by_list_id(rng.choice(list_ids))
+
+        tasks = inner.get_all()
+        overdue = Counter(task.list_id for task in tasks if not task.done and task.due_date and task.due_date < NOW)
+        assert repo.overdue_by_list(NOW) == dict(overdue)
+        assert repo.owner_counts() == dict(Counter(task.owner for task in tasks))
+        assert repo.done_ratio("list-1") == pytest.approx(
+            sum(task.done for task in tasks if task.list_id == "list-1") / max(1, sum(task.list_id == "list-1" for task in tasks)))
+        expected = sorted((task for task in tasks if task.owner == "ana" and not task.done),
+                          key=lambda task: (task.order, task.created_at))
+        assert [task.order for task in repo.filter(owner="ana", done=False)] == [task.order for task in expected]
+        assert set(repo.filter_ids(owner="ana", done=False)) == {task.id for task in expected}
+
+    def test_due_range_ignores_tasks_without_due_date(self, inner):
+        repo = ColumnarTaskRepository(inner)
+        due = repo.save(make_task("Due", due_date=datetime(2024, 2, 1)))
+        repo.save(make_task("No date"))
+
+        assert repo.filter_ids(due_before=NOW) == [due.id]
+        assert repo.filter_ids(due_after=NOW) == []
+
+    def test_query_sorts_the_filtered_tasks(self, inner):
+        repo = ColumnarTaskRepository(inner)
+        late = repo.save(make_task("Late", owner="ana", due_date=datetime(2024, 2, 20), order=1))
+        early = repo.save(make_task("Early", owner="ana", due_date=datetime(2024, 2, 10), order=2))
+        repo.save(make_task("Done", owner="ana", due_date=datetime(2024, 2, 15), done=True))
+        repo.save(make_task("Other owner", owner="bob", due_date=datetime(2024, 2, 12)))
+
+        assert repo.query(owner="ana", done=False) == [late, early]
+        assert repo.query(owner="ana", done=False, sort="due_date") == [early, late]
+        assert repo.query(due_before=NOW, sort="due_date", descending=True, limit=2)[0] == late
+
+    def test_unknown_values_match_nothing(self, inner):
+        repo = ColumnarTaskRepository(inner)
+        repo.save(make_task(owner="ana"))
+
+        assert repo.count(owner="nobody") == 0
+        assert repo.count(list_id="missing-list") == 0
+        assert repo.done_ratio("missing-list") == 0.0
@@ -0,0 +1,62 @@
+from infrastructure.repositories.inverted_search_index import InvertedSearchIndex, tokenize
+from test.factories import make_task
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+
+
+class TestInvertedSearchIndex:
+    def test_tokenize_lowercases_and_drops_accents(self):
+        assert tokenize("Revisar la Canción, v2!") == ["revisar", "la", "cancion", "v2"]
+
+    def test_every_word_must_match_whole_or_as_prefix(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        invoice = repo.save(make_task("Send invoice", description="to the accountant"))
+        report = repo.save(make_task("Write report", checklist=["send draft", "review"]))
+        index = InvertedSearchIndex()
+        index.watch(repo)
+
+        assert index.search("send", 10) == [invoice.id, report.id]
+        assert index.search("rep", 10) == [report.id]
+        assert index.search("send acc", 10) == [invoice.id]
+        assert index.search("send nothing", 10) == []
+        # One-letter words are not expanded as prefixes
+        assert index.search("s", 10) == []
+
+    def test_ranks_rare_words_and_titles_first(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        in_description = repo.save(make_task("Groceries", description="buy milk"))
+        in_title = repo.save(make_task("Milk", description="buy"))
+        repo.save_many([make_task(f"Buy thing {i}") for i in range(5)])
+        index = InvertedSearchIndex()
+        index.watch(repo)
+
+        assert index.search("milk", 10) == [in_title.id, in_description.id]
+        assert index.search("buy milk", 1) == [in_title.id]
+        assert len(index.search("buy", 3)) == 3
+
+    def test_follows_saves_and_deletes_of_the_repository(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        index = InvertedSearchIndex()
+        index.watch(repo)
+        task = repo.save(make_task("Plan trip"))
+        assert index.search("trip", 10) == [task.id]
+
+        task.update(title="Plan holidays")
+        repo.save(task)
+        assert index.search("trip", 10) == []
+        assert index.search("holi", 10) == [task.id]
+
+        repo.delete(task.id)
+        assert index.search("plan", 10) == []
+        assert index._vocabulary == []
+
+    def test_watching_another_repository_replaces_the_index(self, tmp_path):
+        first = JsonTaskRepository(file_path=str(tmp_path / "first.json"))
+        second = JsonTaskRepository(file_path=str(tmp_path / "second.json"))
+        first.save(make_task("Old task"))
+        new = second.save(make_task("New task"))
+        index = InvertedSearchIndex()
+        index.watch(first)
+        index.watch(second)
+        first.save(make_task("Another old task"))
+
+        assert index.search("task", 10) == [new.id]
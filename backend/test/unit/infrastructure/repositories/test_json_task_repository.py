@@ -0,0 +1,276 @@
+import json
+import os
+import random
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from domain.models.task import Task
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from test.factories import make_task
+
+
+def assert_list_index_consistent(repo):
+    """The list index must return exactly what a full scan of the store returns."""
+    list_ids = {task.list_id for task in repo.tasks.values()} | {"missing-list"}
+    for list_id in list_ids:
+        scanned = {task.id for task in repo.tasks.values() if task.list_id == list_id}
+        assert {task.id for task in repo.get_by_list_id(list_id)} == scanned
+
+
+class TestListIndex:
+    def test_index_matches_full_scan_after_random_mutations(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True)
+        rng = random.Random(42)
+        list_ids = [f"list-{i}" for i in range(5)]
+        for step in range(500):
+            action = rng.random()
+            if action < 0.5 or not repo.tasks:
+                repo.save(make_task(f"Task {step}", rng.choice(list_ids)))
+            elif action < 0.8:
+                task = repo.get_by_id(rng.choice(list(repo.tasks)))
+                task.update(list_id=rng.choice(list_ids))
+                repo.save(task)
+            else:
+                repo.delete(rng.choice(list(repo.tasks)))
+        assert_list_index_consistent(repo)
+
+        reloaded = JsonTaskRepository(file_path=file_path, journaled=True)
+        assert_list_index_consistent(reloaded)
+
+    def test_moved_task_leaves_previous_list(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        task = repo.save(make_task(list_id="list-1"))
+        task.update(list_id="list-2")
+        repo.save(task)
+
+        assert repo.get_by_list_id("list-1") == []
+        assert repo.get_by_list_id("list-2") == [task]
+
+    def test_version_tags_follow_changed_lists(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        task = repo.save(make_task(list_id="list-1"))
+        before = {list_id: repo.version_tag(list_id) for list_id in ("list-1", "list-2", "list-3")}
+
+        task.update(list_id="list-2")
+        repo.save(task)
+        assert repo.version_tag("list-1") != before["list-1"]
+        assert repo.version_tag("list-2") != before["list-2"]
+        assert repo.version_tag("list-3") == before["list-3"]
+
+        everything = repo.version_tag()
+        repo.delete("missing-id")
+        assert repo.version_tag() == everything
+
+    def test_queries_match_full_scan_after_random_mutations(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        rng = random.Random(7)
+        days = [None] + [datetime(2024, 1, day) for day in range(1, 11)]
+        for step in range(400):
+            if step < 100 or rng.random() < 0.4:
+                task = make_task(f"Task {step}", rng.choice(["list-1", "list-2", "list-3"]))
+            else:
+                task = repo.get_by_id(rng.choice(list(repo.tasks)))
+            # Fields changed in place must be re-indexed when the task is saved
+            task.update(owner=rng.choice(["ana", "bob"]), done=rng.random() < 0.3, due_date=rng.choice(days),
+                        order=rng.randrange(5))
+            repo.save(task)
+            if rng.random() < 0.1:
+                repo.delete(rng.choice(list(repo.tasks)))
+
+        queries = [{}, {"done": True}, {"owner": "bob"}, {"list_id": "list-2", "done": False},
+                   {"due_after": datetime(2024, 1, 3), "due_before": datetime(2024, 1, 6)},
+                   {"owner": "ana", "due_before": datetime(2024, 1, 4)}, {"list_id": "missing-list"}]
+        for filters in queries:
+            scanned = [task for task in repo.tasks.values()
+                       if all(getattr(task, field) == value for field, value in filters.items() if not field.startswith("due"))
+                       and ("due_after" not in filters or (task.due_date and task.due_date >= filters["due_after"]))
+                       and ("due_before" not in filters or (task.due_date and task.due_date < filters["due_before"]))]
+            by_order = sorted(scanned, key=Task.sort_key)
+            by_due = sorted(scanned, key=lambda task: (task.due_date is None, task.due_date or datetime.min, task.id))
+            assert repo.query(**filters) == by_order
+            assert repo.query(**filters, limit=5) == by_order[:5]
+            assert repo.query(**filters, sort="due_date", limit=5) == by_due[:5]
+            assert repo.query(**filters, sort="due_date", descending=True) == by_due[::-1]
+
+    def test_overdue_query_skips_completed_tasks(self, tmp_path):
+        class CountingDict(dict):
+            reads = 0
+
+            def __getitem__(self, key):
+                CountingDict.reads += 1
+                return super().__getitem__(key)
+
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        completed = [make_task(f"Done {i}") for i in range(200)]
+        for task in completed:
+            task.update(due_date=datetime(2024, 1, 1), done=True)
+        pending = make_task("Pending")
+        pending.update(due_date=datetime(2024, 1, 2))
+        repo.save_many(completed + [pending])
+        repo.tasks = CountingDict(repo.tasks)
+
+        assert repo.query(done=False, due_before=datetime(2024, 2, 1), sort="due_date", limit=1) == [pending]
+        assert CountingDict.reads == 1
+        assert repo.due_index.count(before=datetime(2024, 2, 1)) == 201
+
+        # Completing or reopening a task moves it between the two parts of the index
+        pending.update(done=True)
+        repo.save(pending)
+        assert repo.query(done=False, due_before=datetime(2024, 2, 1)) == []
+        completed[0].update(done=False)
+        repo.save(completed[0])
+        assert repo.query(done=False, due_before=datetime(2024, 2, 1)) == [completed[0]]
+
+    def test_pages_follow_order_created_at_and_id(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        tasks = [repo.save(make_task(f"Task {i}")) for i in range(10)]
+        for i, task in enumerate(tasks):
+            task.update(order=(i * 7) % 4)
+            repo.save(task)
+        expected = sorted(tasks, key=lambda task: (task.order, task.created_at, task.id))
+
+        pages, after = [], None
+        while True:
+            page = repo.get_page_by_list_id("list-1", 3, after)
+            if not page:
+                break
+            pages.extend(page)
+            after = page[-1].sort_key()
+
+        assert pages == expected
+        assert repo.get_by_list_id("list-1") == expected
+
+    def test_page_order_survives_a_reload(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True, compact_threshold=4)
+        # Same day and same order: only the creation time tells them apart
+        titles = [f"t{i}" for i in range(6)]
+        for minute, title in enumerate(titles):
+            repo.save(Task(title=title, list_id="list-1", description="", due_date=None, attachment=None,
+                           created_at=datetime(2024, 1, 1, 9, minute)))
+        cursor = repo.get_page_by_list_id("list-1", 3)[-1].sort_key()
+
+        reloaded = JsonTaskRepository(file_path=file_path, journaled=True)
+        assert [task.title for task in reloaded.get_by_list_id("list-1")] == titles
+        assert [task.title for task in reloaded.get_page_by_list_id("list-1", 3, cursor)] == titles[3:]
+
+
+class TestJournaledJsonTaskRepository:
+    def test_mutations_are_appended_to_the_journal(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True)
+        task = repo.save(make_task())
+        repo.delete(task.id)
+
+        # The snapshot is never rewritten, only the log grows
+        assert not os.path.exists(file_path)
+        with open(f"{file_path}.log") as f:
+            records = [json.loads(line) for line in f]
+        assert [record["op"] for record in records] == ["save", "delete"]
+
+    def test_replays_snapshot_and_journal_on_startup(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True)
+        kept = repo.save(make_task("Kept"))
+        removed = repo.save(make_task("Removed"))
+        repo.compact()
+        kept.update(title="Kept and updated")
+        repo.save(kept)
+        repo.delete(removed.id)
+
+        reloaded = JsonTaskRepository(file_path=file_path, journaled=True)
+        assert list(reloaded.tasks) == [kept.id]
+        assert reloaded.get_by_id(kept.id).title == "Kept and updated"
+
+    def test_compacts_when_threshold_is_reached(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True, compact_threshold=3)
+        for i in range(3):
+            repo.save(make_task(f"Task {i}"))
+
+        assert repo.journal.record_count == 0
+        with open(file_path) as f:
+            assert len(json.load(f)) == 3
+
+    def test_ignores_torn_last_record(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True)
+        task = repo.save(make_task())
+        with open(f"{file_path}.log", "a") as f:
+            f.write('{"op":"delete","id":')
+
+        reloaded = JsonTaskRepository(file_path=file_path, journaled=True)
+        assert list(reloaded.tasks) == [task.id]
+        second = reloaded.save(make_task("Second"))
+        assert set(JsonTaskRepository(file_path=file_path, journaled=True).tasks) == {task.id, second.id}
+
+    def test_delete_by_list_id_is_one_journal_record(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True)
+        for i in range(5):
+            repo.save(make_task(f"Task {i}", "list-1"))
+        other = repo.save(make_task("Other", "list-2"))
+
+        assert repo.delete_by_list_id("list-1") == 5
+        assert repo.journal.record_count == 7
+        assert list(repo.tasks) == [other.id]
+        assert list(JsonTaskRepository(file_path=file_path, journaled=True).tasks) == [other.id]
+
+    def test_save_many_and_delete_many_write_once(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True)
+        repo.journal.append_many = Mock(wraps=repo.journal.append_many)
+        tasks = repo.save_many([make_task(f"Task {i}") for i in range(10)])
+        deleted = repo.delete_many([tasks[0].id, tasks[1].id, "missing"])
+
+        assert deleted == [tasks[0].id, tasks[1].id]
+        assert repo.journal.append_many.call_count == 2
+        assert len(JsonTaskRepository(file_path=file_path, journaled=True).get_by_list_id("list-1")) == 8
+
+    def test_failed_append_is_retried_by_the_next_commit(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True)
+        append_many = repo.journal.append_many
+        failures = [OSError("disk full")]
+
+        def fail_once(records):
+            if failures:
+                raise failures.pop()
+            append_many(records)
+
+        repo.journal.append_many = fail_once
+        with pytest.raises(OSError):
+            repo.save(make_task("Lost"))
+        repo.save(make_task("Kept"))
+
+        reloaded = JsonTaskRepository(file_path=file_path, journaled=True)
+        assert sorted(task.title for task in reloaded.get_all()) == ["Kept", "Lost"]
+
+    def test_group_commit_appends_burst_with_one_write(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        repo = JsonTaskRepository(file_path=file_path, journaled=True, flush_interval=60)
+        for i in range(200):
+            repo.save(make_task(f"Task {i}"))
+        assert repo.journal.record_count == 0
+
+        repo.flush()
+        assert repo.journal.record_count == 200
+        assert len(JsonTaskRepository(file_path=file_path, journaled=True).tasks) == 200
+
+    def test_iter_tasks_reads_batches_and_filters(self, tmp_path):
+        repo = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        tasks = repo.save_many([make_task(f"Task {i}", "list-1" if i % 2 else "list-2") for i in range(7)])
+        tasks[1].update(title="Renamed")
+        repo.save(tasks[1])
+        since = tasks[1].updated_at
+
+        assert [task.id for task in repo.iter_tasks(batch_size=3)] == [task.id for task in tasks]
+        assert {task.id for task in repo.iter_tasks(list_id="list-1", batch_size=2)} == {tasks[i].id for i in (1, 3, 5)}
+        assert [task.id for task in repo.iter_tasks(updated_since=since)] == [tasks[1].id]
+
+        # Tasks deleted while iterating are skipped
+        iterator = repo.iter_tasks(batch_size=2)
+        assert next(iterator) is tasks[0]
+        repo.delete_many([tasks[2].id, tasks[3].id])
+        assert [task.id for task in iterator] == [tasks[1].id] + [task.id for task in tasks[4:]]
@@ -0,0 +1,41 @@
+import hashlib
+import os
+import pytest
+from infrastructure.repositories.local_attachment_repository import LocalAttachmentRepository
+
+
+class TestLocalAttachmentRepository:
+    def test_stores_content_under_its_hash(self, tmp_path):
+        repo = LocalAttachmentRepository(tmp_path)
+        writer = repo.open_writer()
+        for chunk in (b"hello ", b"world"):
+            writer.write(chunk)
+        attachment_id, size = writer.commit()
+
+        assert attachment_id == hashlib.sha256(b"hello world").hexdigest()
+        assert size == 11
+        with repo.open(attachment_id) as f:
+            assert f.read() == b"hello world"
+
+    def test_deduplicates_identical_content(self, tmp_path):
+        repo = LocalAttachmentRepository(tmp_path)
+        first, _ = repo.put(b"same bytes")
+        second, _ = repo.put(b"same bytes")
+
+        assert first == second
+        assert os.listdir(tmp_path / first[:2]) == [first]
+        assert os.listdir(repo.tmp_dir) == []
+
+    def test_abort_discards_partial_upload(self, tmp_path):
+        repo = LocalAttachmentRepository(tmp_path)
+        writer = repo.open_writer()
+        writer.write(b"partial")
+        writer.abort()
+
+        assert os.listdir(repo.tmp_dir) == []
+        assert not repo.exists(hashlib.sha256(b"partial").hexdigest())
+
+    def test_rejects_ids_that_are_not_hashes(self, tmp_path):
+        repo = LocalAttachmentRepository(tmp_path)
+        with pytest.raises(ValueError):
+            repo.open("../../etc/passwd")
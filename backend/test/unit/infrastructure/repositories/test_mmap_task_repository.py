@@ -0,0 +1,143 @@
+import os
+import random
+from datetime import datetime
+from infrastructure.repositories.mmap_task_repository import MmapTaskRepository
+from test.factories import make_task
+
+
+def snapshot(repo):
+    return {task.id: task.to_dict() for task in repo.get_all()}
+
+
+class TestMmapTaskRepository:
+    def test_reopened_store_decodes_tasks_lazily(self, tmp_path):
+        file_path = str(tmp_path / "task.mmap")
+        repo = MmapTaskRepository(file_path=file_path)
+        tasks = repo.save_many([make_task(f"Task {i}", order=i) for i in range(10)])
+        repo.checkpoint()
+        repo.close()
+
+        reopened = MmapTaskRepository(file_path=file_path)
+        assert len(reopened._cache) == 0
+        assert len(reopened._recent) == 0
+        assert reopened.get_by_id(tasks[3].id).title == "Task 3"
+        assert list(reopened._cache) == [tasks[3].id]
+        assert [task.id for task in reopened.get_by_list_id("list-1")] == [task.id for task in tasks]
+
+    def test_matches_saved_state_after_random_mutations(self, tmp_path):
+        file_path = str(tmp_path / "task.mmap")
+        repo = MmapTaskRepository(file_path=file_path, cache_size=5, checkpoint_threshold=40)
+        rng = random.Random(3)
+        list_ids = [f"list-{i}" for i in range(3)]
+        for step in range(400):
+            action = rng.random()
+            ids = [task.id for task in repo.get_all()]
+            if action < 0.5 or not ids:
+                repo.save(make_task(f"Task {step}", rng.choice(list_ids), order=rng.randint(0, 3)))
+            elif action < 0.8:
+                task = repo.get_by_id(rng.choice(ids))
+                task.update(title=f"Updated {step}", list_id=rng.choice(list_ids), order=rng.randint(0, 3))
+                repo.save(task)
+            elif action < 0.95:
+                repo.delete(rng.choice(ids))
+            else:
+                repo.delete_by_list_id(rng.choice(list_ids))
+        expected = snapshot(repo)
+        lists = {list_id: [task.id for task in repo.get_by_list_id(list_id)] for list_id in list_ids}
+        repo.close()
+
+        reopened = MmapTaskRepository(file_path=file_path)
+        assert snapshot(reopened) == expected
+        for list_id in list_ids:
+            tasks = reopened.get_by_list_id(list_id)
+            assert [task.id for task in tasks] == lists[list_id]
+            assert tasks == sorted(tasks, key=lambda task: task.sort_key())
+
+            pages, after = [], None
+            while page := reopened.get_page_by_list_id(list_id, 4, after):
+                pages.extend(task.id for task in page)
+                after = page[-1].sort_key()
+            assert pages == lists[list_id]
+
+    def test_compaction_drops_superseded_records(self, tmp_path):
+        file_path = str(tmp_path / "task.mmap")
+        repo = MmapTaskRepository(file_path=file_path)
+        task = repo.save(make_task())
+        for i in range(50):
+            task.update(title=f"Version {i}")
+            repo.save(task)
+        size = os.path.getsize(file_path)
+
+        repo.compact()
+        assert os.path.getsize(file_path) < size / 10
+        repo.close()
+        assert MmapTaskRepository(file_path=file_path).get_by_id(task.id).title == "Version 49"
+
+    def test_drops_a_torn_last_record(self, tmp_path):
+        file_path = str(tmp_path / "task.mmap")
+        repo = MmapTaskRepository(file_path=file_path)
+        first = repo.save(make_task("First"))
+        repo.close()
+        with open(file_path, "ab") as f:
+            f.write(b"\x01\xff\x00")
+
+        reopened = MmapTaskRepository(file_path=file_path)
+        second = reopened.save(make_task("Second"))
+        reopened.close()
+        assert {task.id for task in MmapTaskRepository(file_path=file_path).get_all()} == {first.id, second.id}
+
+    def test_rebuilds_a_lost_index(self, tmp_path):
+        file_path = str(tmp_path / "task.mmap")
+        repo = MmapTaskRepository(file_path=file_path)
+        task = repo.save(make_task())
+        repo.checkpoint()
+        other = repo.save(make_task("Other", "list-2"))
+        repo.close()
+        os.remove(f"{file_path}.idx")
+
+        reopened = MmapTaskRepository(file_path=file_path)
+        assert [t.id for t in reopened.get_by_list_id("list-1")] == [task.id]
+        assert reopened.get_by_id(other.id).title == "Other"
+
+    def test_query_filters_indexed_and_recent_tasks(self, tmp_path):
+        repo = MmapTaskRepository(file_path=str(tmp_path / "task.mmap"))
+        tasks = repo.save_many([make_task(f"Task {i}", list_id=f"list-{i % 2}", order=-i) for i in range(8)])
+        repo.checkpoint()
+        tasks[2].update(done=True)
+        tasks[5].update(done=True, list_id="list-0")
+        repo.save_many([tasks[2], tasks[5]])
+
+        def ids(tasks_found):
+            return [task.id for task in tasks_found]
+
+        assert ids(repo.query(list_id="list-0", done=True)) == ids([tasks[5], tasks[2]])
+        assert ids(repo.query(done=False, limit=2)) == ids([tasks[7], tasks[6]])
+        assert ids(repo.query(list_id="list-1")) == ids([tasks[7], tasks[3], tasks[1]])
+
+    def test_due_date_index_is_built_once_and_kept_up_to_date(self, tmp_path):
+        repo = MmapTaskRepository(file_path=str(tmp_path / "task.mmap"))
+        tasks = repo.save_many([make_task(f"Task {i}") for i in range(6)])
+        for day, task in zip((5, 1, 3), tasks):
+            task.update(due_date=datetime(2024, 1, day))
+        repo.save_many(tasks[:3])
+
+        assert [task.title for task in repo.query(due_before=datetime(2024, 1, 4), sort="due_date")] == ["Task 1", "Task 2"]
+        tasks[3].update(due_date=datetime(2024, 1, 2))
+        repo.save(tasks[3])
+        repo.delete(tasks[1].id)
+        assert [task.title for task in repo.query(due_before=datetime(2024, 1, 4), sort="due_date")] == ["Task 3", "Task 2"]
+        assert repo._due_index.count() == 3
+
+    def test_version_tags_follow_changed_lists(self, tmp_path):
+        repo = MmapTaskRepository(file_path=str(tmp_path / "task.mmap"))
+        task = repo.save(make_task(list_id="list-1"))
+        repo.checkpoint()
+        before = {list_id: repo.version_tag(list_id) for list_id in ("list-1", "list-2", "list-3")}
+
+        # The previous list is only known through the written index here
+        task.update(list_id="list-2")
+        repo.save(task)
+        assert repo.version_tag("list-1") != before["list-1"]
+        assert repo.version_tag("list-2") != before["list-2"]
+        assert repo.version_tag("list-3") == before["list-3"]
+        repo.close()
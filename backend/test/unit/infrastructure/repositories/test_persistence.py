@@ -0,0 +1,120 @@
+import asyncio
+import json
+import os
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from domain.models.list import TaskList
+from infrastructure.repositories.json_task_list_repository import JsonTaskListRepository
+from infrastructure.repositories.persistence import GroupCommit, write_atomically
+
+
+class TestWriteAtomically:
+    def test_replaces_file_content(self, tmp_path):
+        file_path = str(tmp_path / "data.json")
+        write_atomically(file_path, "old")
+        write_atomically(file_path, "new")
+
+        with open(file_path) as f:
+            assert f.read() == "new"
+        assert os.listdir(tmp_path) == ["data.json"]
+
+    def test_keeps_previous_content_when_write_fails(self, tmp_path):
+        file_path = str(tmp_path / "data.json")
+        write_atomically(file_path, "old")
+
+        with patch("infrastructure.repositories.persistence.os.fsync", side_effect=OSError("disk full")):
+            try:
+                write_atomically(file_path, "new")
+            except OSError:
+                pass
+
+        with open(file_path) as f:
+            assert f.read() == "old"
+        assert os.listdir(tmp_path) == ["data.json"]
+
+
+class TestGroupCommit:
+    def test_commits_immediately_without_interval(self):
+        commit = Mock()
+        group_commit = GroupCommit(commit)
+        group_commit.request()
+        group_commit.request()
+        assert commit.call_count == 2
+
+    def test_coalesces_requests_within_interval(self):
+        commit = Mock()
+        group_commit = GroupCommit(commit, interval=60)
+        for _ in range(200):
+            group_commit.request()
+        commit.assert_not_called()
+
+        group_commit.close()
+        commit.assert_called_once()
+
+    def test_failed_commit_stays_pending(self):
+        commit = Mock(side_effect=[OSError("disk full"), None])
+        group_commit = GroupCommit(commit, interval=60)
+        group_commit.request()
+        try:
+            group_commit.flush()
+        except OSError:
+            pass
+        group_commit.flush()
+        assert commit.call_count == 2
+
+    def test_writer_thread_commits_in_the_background(self):
+        threads = []
+        group_commit = GroupCommit(lambda: threads.append(threading.current_thread()), interval=0.01)
+        group_commit.request()
+        group_commit.committed().result(timeout=5)
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+        group_commit.close()
+
+    def test_sync_durability_waits_for_the_commit(self):
+        commit = Mock()
+        group_commit = GroupCommit(commit, interval=60, durability="sync")
+        group_commit.request()
+
+        async def write_then_flush():
+            waiting = asyncio.ensure_future(group_commit.durable())
+            await asyncio.sleep(0)
+            assert not waiting.done()
+            group_commit.flush()
+            await asyncio.wait_for(waiting, timeout=5)
+
+        asyncio.run(write_then_flush())
+        commit.assert_called_once()
+
+    def test_async_durability_does_not_wait(self):
+        commit = Mock()
+        group_commit = GroupCommit(commit, interval=60, durability="async")
+        group_commit.request()
+
+        asyncio.run(group_commit.durable())
+        commit.assert_not_called()
+
+    def test_failed_commit_is_reported_to_waiters(self):
+        group_commit = GroupCommit(Mock(side_effect=OSError("disk full")), interval=60)
+        group_commit.request()
+        committed = group_commit.committed()
+        with pytest.raises(OSError):
+            group_commit.flush()
+        with pytest.raises(OSError):
+            committed.result(timeout=0)
+
+
+class TestJsonTaskListRepositoryGroupCommit:
+    def test_burst_of_writes_is_written_once_on_flush(self, tmp_path):
+        file_path = str(tmp_path / "task_lists.json")
+        repo = JsonTaskListRepository(file_path=file_path, flush_interval=60)
+        for i in range(200):
+            repo.save(TaskList(name=f"List {i}"))
+        assert not os.path.exists(file_path)
+
+        repo.close()
+        with open(file_path) as f:
+            assert len(json.load(f)) == 200
+        assert len(JsonTaskListRepository(file_path=file_path).get_all()) == 200
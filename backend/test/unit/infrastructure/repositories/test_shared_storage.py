@@ -0,0 +1,94 @@
+from unittest.mock import Mock
+from domain.models.list import TaskList
+from infrastructure.repositories.json_task_list_repository import JsonTaskListRepository
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from test.factories import make_task
+
+
+def snapshot(repo):
+    return {task.id: task.to_dict() for task in repo.get_all()}
+
+
+class TestSharedJsonTaskRepository:
+    """Two repositories on the same files stand for two worker processes."""
+
+    def test_sees_other_writers_incrementally(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        first = JsonTaskRepository(file_path=file_path, shared=True)
+        second = JsonTaskRepository(file_path=file_path, shared=True)
+        second._load_from_file = Mock(wraps=second._load_from_file)
+
+        task = first.save(make_task("From first"))
+        assert second.get_by_id(task.id).title == "From first"
+
+        other = second.save(make_task("From second", "list-2"))
+        first.delete(task.id)
+        assert [item.id for item in second.get_by_list_id("list-1")] == []
+        assert snapshot(first) == snapshot(second) == {other.id: other.to_dict()}
+        second._load_from_file.assert_not_called()
+
+    def test_interleaved_writes_are_all_kept(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        workers = [JsonTaskRepository(file_path=file_path, shared=True) for _ in range(3)]
+        for i in range(30):
+            workers[i % 3].save(make_task(f"Task {i}", f"list-{i % 4}"))
+        expected = snapshot(workers[0])
+        assert len(expected) == 30
+        assert snapshot(workers[1]) == snapshot(workers[2]) == expected
+        for worker in workers:
+            worker.close()
+
+        assert snapshot(JsonTaskRepository(file_path=file_path, shared=True)) == expected
+
+    def test_reloads_after_another_process_compacts(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        first = JsonTaskRepository(file_path=file_path, shared=True, compact_threshold=5)
+        second = JsonTaskRepository(file_path=file_path, shared=True, compact_threshold=5)
+        second.get_all()
+        for i in range(5):
+            first.save(make_task(f"Task {i}"))
+        assert first.journal.record_count == 0
+
+        later = first.save(make_task("After compaction"))
+        assert len(second.get_all()) == 6
+        assert second.get_by_id(later.id).title == "After compaction"
+
+    def test_changes_of_other_processes_reach_listeners_and_versions(self, tmp_path):
+        file_path = str(tmp_path / "tasks.json")
+        first = JsonTaskRepository(file_path=file_path, shared=True)
+        second = JsonTaskRepository(file_path=file_path, shared=True)
+        listener = Mock()
+        second.add_change_listener(listener)
+        before = second.version_tag("list-1")
+
+        task = first.save(make_task())
+        assert second.version_tag("list-1") != before
+        listener.assert_called_once_with([task.id])
+
+
+class TestSharedJsonTaskListRepository:
+    def test_sees_other_writers(self, tmp_path):
+        file_path = str(tmp_path / "task_lists.json")
+        first = JsonTaskListRepository(file_path=file_path, shared=True)
+        second = JsonTaskListRepository(file_path=file_path, shared=True)
+        listener = Mock()
+        second.add_change_listener(listener)
+
+        inbox = first.save(TaskList(name="Inbox"))
+        second.save(TaskList(name="Later"))
+        assert sorted(task_list.name for task_list in first.get_all()) == ["Inbox", "Later"]
+        listener.assert_any_call([inbox.id])
+
+        inbox.update(name="Renamed")
+        first.update(inbox)
+        assert second.get_by_id(inbox.id).name == "Renamed"
+        assert len(JsonTaskListRepository(file_path=file_path).get_all()) == 2
+
+    def test_save_many_is_seen_by_existing_ids(self, tmp_path):
+        file_path = str(tmp_path / "task_lists.json")
+        first = JsonTaskListRepository(file_path=file_path, shared=True)
+        second = JsonTaskListRepository(file_path=file_path, shared=True)
+
+        task_lists = first.save_many([TaskList(name=f"List {i}") for i in range(3)])
+        assert second.existing_ids([task_lists[0].id, task_lists[1].id, "missing"]) == {task_lists[0].id, task_lists[1].id}
+        assert len(JsonTaskListRepository(file_path=file_path).get_all()) == 3
@@ -0,0 +1,96 @@
+import json
+import struct
+from datetime import datetime
+import pytest
+from domain.models.list import TaskList
+from domain.models.task import Task
+from infrastructure.repositories.json_task_list_repository import JsonTaskListRepository
+from infrastructure.repositories.json_task_repository import JsonTaskRepository
+from infrastructure.repositories.snapshot_codec import (
+    decode_task_lists, decode_tasks, encode_task_lists, encode_tasks, is_snapshot,
+)
+from infrastructure.repositories.snapshot_converter import convert
+
+
+def make_tasks():
+    return [
+        Task(title="Plain", list_id="list-1", description=None, due_date=None, attachment=None,
+             created_at=datetime(2024, 1, 1, 12, 30, 15, 250)),
+        Task(title="Ñandú ✓", list_id="list-2", description="descripción", due_date=datetime(2024, 2, 1),
+             attachment=b"aGVsbG8=", created_at=datetime(2024, 1, 2), checklist=["uno", {"text": "dos"}],
+             owner="ana@example.com", done=True, order=-3, attachment_id="a" * 64, attachment_size=5),
+    ]
+
+
+class TestSnapshotCodec:
+    def test_tasks_round_trip(self):
+        tasks = make_tasks()
+        decoded = decode_tasks(encode_tasks(tasks))
+
+        assert [task.to_dict() for task in decoded] == [task.to_dict() for task in tasks]
+        assert decoded[0].created_at == tasks[0].created_at
+        assert decoded[0].order == 0
+
+    def test_reads_version_1_tasks_without_modification_time(self):
+        task = make_tasks()[1]
+        task.update(title="Edited")
+        record = encode_tasks([task])[struct.calcsize("<8sBBQ") + 4:]
+        # Version 1 records end right after the checklist
+        data = struct.pack("<8sBBQ", b"TODOSNAP", 1, 1, 1) + struct.pack("<I", len(record) - 8) + record[:-8]
+
+        decoded, = decode_tasks(data)
+        assert decoded.updated_at == decoded.created_at == datetime(2024, 1, 2)
+        assert decode_tasks(encode_tasks([task]))[0].updated_at == task.updated_at > task.created_at
+
+    def test_task_lists_round_trip(self):
+        task_lists = [TaskList(name="To Do", order=1), TaskList(name="Done", order=None)]
+        decoded = decode_task_lists(encode_task_lists(task_lists))
+
+        assert [task_list.to_dict() for task_list in decoded] == [task_list.to_dict() for task_list in task_lists]
+
+    def test_is_smaller_than_json(self):
+        tasks = make_tasks() * 100
+        assert len(encode_tasks(tasks)) < len(json.dumps([task.to_dict() for task in tasks], indent=2)) / 2
+
+    def test_rejects_truncated_and_foreign_snapshots(self):
+        data = encode_tasks(make_tasks())
+
+        with pytest.raises(ValueError):
+            decode_tasks(data[:-1])
+        with pytest.raises(ValueError):
+            decode_task_lists(data)
+        with pytest.raises(ValueError):
+            decode_tasks(b"[]")
+
+
+class TestBinarySnapshotRepositories:
+    def test_task_repository_saves_and_loads_binary_snapshots(self, tmp_path):
+        file_path = str(tmp_path / "task.snap")
+        repo = JsonTaskRepository(file_path=file_path, format="binary")
+        tasks = repo.save_many(make_tasks())
+
+        with open(file_path, "rb") as f:
+            assert is_snapshot(f.read())
+        reloaded = JsonTaskRepository(file_path=file_path, format="binary")
+        assert [task.to_dict() for task in reloaded.get_all()] == [task.to_dict() for task in tasks]
+        assert reloaded.get_by_list_id("list-2")[0].title == "Ñandú ✓"
+
+    def test_task_list_repository_reads_json_and_writes_binary(self, tmp_path):
+        file_path = str(tmp_path / "task_lists.json")
+        JsonTaskListRepository(file_path=file_path).save(TaskList(name="To Do", order=1))
+
+        repo = JsonTaskListRepository(file_path=file_path, format="binary")
+        assert [task_list.name for task_list in repo.get_all()] == ["To Do"]
+        repo.save(TaskList(name="Done", order=2))
+        with open(file_path, "rb") as f:
+            assert is_snapshot(f.read())
+        assert [task_list.name for task_list in JsonTaskListRepository(file_path=file_path).get_all()] == ["To Do", "Done"]
+
+    def test_converter_round_trips_through_binary(self, tmp_path):
+        source = str(tmp_path / "task.json")
+        JsonTaskRepository(file_path=source).save_many(make_tasks())
+
+        assert convert("tasks", source, str(tmp_path / "task.snap"), "binary") == 2
+        assert convert("tasks", str(tmp_path / "task.snap"), str(tmp_path / "back.json"), "json") == 2
+        with open(source) as original, open(tmp_path / "back.json") as converted:
+            assert json.load(converted) == json.load(original)
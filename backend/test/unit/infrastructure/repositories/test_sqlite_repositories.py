@@ -0,0 +1,214 @@
+import pytest
+import threading
+from functools import partial
+from datetime import datetime
+from domain.models.list import TaskList
+from domain.models.task import Task
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from infrastructure.repositories.sqlite_task_list_repository import SqliteTaskListRepository
+from infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from test.factories import make_task
+
+# Every column holds a value, so round trips cover them all
+make_task = partial(make_task, due_date=datetime(2024, 2, 1), attachment=b"data", checklist=["a"],
+                    created_at=datetime(2024, 1, 1, 12, 30))
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SqliteDatabase(tmp_path / "todo.sqlite3")
+    yield database
+    database.close()
+
+
+class TestSqliteDatabase:
+    def test_runs_in_wal_mode_and_reuses_connections(self, database):
+        connection = database.connection()
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert database.connection() is connection
+
+
+class TestSqliteTaskRepository:
+    def test_round_trips_every_field(self, database):
+        repo = SqliteTaskRepository(database)
+        task = repo.save(make_task())
+
+        loaded = SqliteTaskRepository(database).get_by_id(task.id)
+        assert loaded.to_dict() == task.to_dict()
+        assert loaded.created_at == task.created_at
+
+    def test_save_updates_existing_task(self, database):
+        repo = SqliteTaskRepository(database)
+        task = repo.save(make_task())
+        task.update(title="Updated", done=True, list_id="list-2")
+        repo.save(task)
+
+        assert repo.get_by_id(task.id).title == "Updated"
+        assert repo.get_by_list_id("list-1") == []
+        assert [t.id for t in repo.get_by_list_id("list-2")] == [task.id]
+
+    def test_missing_task_raises(self, database):
+        repo = SqliteTaskRepository(database)
+        with pytest.raises(ValueError):
+            repo.get_by_id("missing")
+
+    def test_delete(self, database):
+        repo = SqliteTaskRepository(database)
+        task = repo.save(make_task())
+        repo.delete(task.id)
+        repo.delete(task.id)
+        assert repo.get_all() == []
+
+    def test_delete_by_list_id(self, database):
+        repo = SqliteTaskRepository(database)
+        for i in range(3):
+            repo.save(make_task(f"Task {i}", "list-1"))
+        other = repo.save(make_task("Other", "list-2"))
+
+        assert repo.delete_by_list_id("list-1") == 3
+        assert [task.id for task in repo.get_all()] == [other.id]
+
+    def test_save_many_and_delete_many(self, database):
+        repo = SqliteTaskRepository(database)
+        tasks = repo.save_many([make_task(f"Task {i}") for i in range(3)])
+
+        assert repo.delete_many([tasks[0].id, "missing", tasks[0].id]) == [tasks[0].id]
+        assert {task.id for task in repo.get_all()} == {tasks[1].id, tasks[2].id}
+
+    def test_pages_follow_order_created_at_and_id(self, database):
+        repo = SqliteTaskRepository(database)
+        tasks = [repo.save(make_task(f"Task {i}", order=(i * 7) % 4)) for i in range(10)]
+        expected = [task.id for task in sorted(tasks, key=lambda task: task.sort_key())]
+
+        pages, after = [], None
+        while page := repo.get_page_by_list_id("list-1", 3, after):
+            pages.extend(task.id for task in page)
+            after = page[-1].sort_key()
+
+        assert pages == expected
+        assert [task.id for task in repo.get_by_list_id("list-1")] == expected
+
+    def test_uses_indexes_for_list_owner_and_due_date(self, database):
+        SqliteTaskRepository(database)
+        indexes = {row["name"] for row in database.connection().execute("PRAGMA index_list(tasks)")}
+        assert {"idx_tasks_list_order", "idx_tasks_owner", "idx_tasks_due_date", "idx_tasks_order",
+                "idx_tasks_done_due_date"} <= indexes
+
+    def test_query_filters_and_sorts(self, database):
+        repo = SqliteTaskRepository(database)
+        tasks = [make_task(f"Task {i}", list_id=f"list-{i % 2}", order=i % 3) for i in range(12)]
+        for i, task in enumerate(tasks):
+            task.update(owner="ana" if i % 3 else "bob", done=i % 4 == 0,
+                        due_date=datetime(2024, 1, 1 + i) if i % 5 else None)
+        repo.save_many(tasks)
+
+        due = repo.query(due_after=datetime(2024, 1, 3), due_before=datetime(2024, 1, 9), sort="due_date")
+        assert [task.title for task in due] == ["Task 2", "Task 3", "Task 4", "Task 6", "Task 7"]
+        pending_of_ana = repo.query(owner="ana", done=False, list_id="list-1")
+        assert [task.id for task in pending_of_ana] == [task.id for task in sorted([task for task in tasks if task.owner == "ana" and not task.done
+                                         and task.list_id == "list-1"], key=lambda task: task.sort_key())]
+        latest = repo.query(done=False, due_after=datetime(2024, 1, 1), sort="due_date", descending=True, limit=3)
+        assert [task.title for task in latest] == ["Task 11", "Task 9", "Task 7"]
+        with pytest.raises(ValueError):
+            repo.query(sort="title")
+
+
+    def test_version_tags_follow_changed_lists(self, database):
+        repo = SqliteTaskRepository(database)
+        task = repo.save(make_task(list_id="list-1"))
+        before = {list_id: repo.version_tag(list_id) for list_id in ("list-1", "list-2", "list-3")}
+
+        task.update(list_id="list-2")
+        repo.save(task)
+        assert repo.version_tag("list-1") != before["list-1"]
+        assert repo.version_tag("list-2") != before["list-2"]
+        assert repo.version_tag("list-3") == before["list-3"]
+
+        moved = repo.version_tag("list-2")
+        repo.delete_many([task.id])
+        assert repo.version_tag("list-2") != moved
+
+    def test_iter_tasks_pages_by_id_and_filters(self, database):
+        repo = SqliteTaskRepository(database)
+        tasks = repo.save_many([make_task(f"Task {i}", "list-1" if i % 2 else "list-2", order=i) for i in range(7)])
+        tasks[1].update(title="Renamed")
+        repo.save(tasks[1])
+
+        assert sorted(task.id for task in repo.iter_tasks(batch_size=3)) == sorted(task.id for task in tasks)
+        assert [task.id for task in repo.iter_tasks(list_id="list-1", batch_size=2)] == [tasks[i].id for i in (1, 3, 5)]
+        updated = list(repo.iter_tasks(updated_since=tasks[1].updated_at))
+        assert [task.id for task in updated] == [tasks[1].id]
+        assert updated[0].updated_at == tasks[1].updated_at
+
+    def test_iter_tasks_resumed_on_other_threads_uses_their_connections(self, database):
+        """Like a streamed export, every batch is read with the connection of the thread resuming it."""
+        repo = SqliteTaskRepository(database)
+        tasks = repo.save_many([make_task(f"Task {i}") for i in range(5)])
+        pages = repo.iter_tasks(updated_since=datetime(2024, 1, 1), batch_size=2)
+
+        read = []
+        for _ in range(len(tasks)):
+            thread = threading.Thread(target=lambda: read.append(next(pages)))
+            thread.start()
+            thread.join()
+
+        assert sorted(task.id for task in read) == sorted(task.id for task in tasks)
+        # The test thread saved the tasks, the three batches were read by their own threads
+        assert len(database._connections) == 1 + 3
+
+    def test_iter_tasks_modified_since_an_exact_time(self, database):
+        repo = SqliteTaskRepository(database)
+        old, recent = make_task("Old"), make_task("Recent")
+        old.updated_at = datetime(2024, 3, 1, 9, 59, 59, 999999)
+        # Whole seconds: isoformat alone would drop the microseconds and sort the text first
+        recent.updated_at = datetime(2024, 3, 1, 10, 0)
+        repo.save_many([old, recent])
+
+        assert [task.title for task in repo.iter_tasks(updated_since=datetime(2024, 3, 1, 10, 0))] == ["Recent"]
+        assert [task.title for task in repo.iter_tasks(list_id="list-1", updated_since=datetime(2024, 3, 1, 10, 0))] == ["Recent"]
+
+    def test_databases_without_modification_times_are_migrated(self, database):
+        with database.connection() as connection:
+            connection.execute("""
+                CREATE TABLE tasks (
+                    id TEXT PRIMARY KEY, title TEXT NOT NULL, list_id TEXT NOT NULL,
+                    description TEXT NOT NULL DEFAULT '', created_at TEXT NOT NULL, due_date TEXT,
+                    attachment BLOB, checklist TEXT NOT NULL DEFAULT '[]', owner TEXT NOT NULL DEFAULT 'default',
+                    done INTEGER NOT NULL DEFAULT 0, "order" INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            connection.execute("INSERT INTO tasks (id, title, list_id, created_at) VALUES ('t1', 'Legacy', 'list-1', '2024-01-01T12:30:00')")
+
+        repo = SqliteTaskRepository(database)
+        assert repo.get_by_id("t1").updated_at == datetime(2024, 1, 1, 12, 30)
+        assert [task.id for task in repo.iter_tasks(updated_since=datetime(2024, 1, 1))] == ["t1"]
+        assert list(repo.iter_tasks(updated_since=datetime(2024, 2, 1))) == []
+
+
+class TestSqliteTaskListRepository:
+    def test_crud(self, database):
+        repo = SqliteTaskListRepository(database)
+        task_list = repo.save(TaskList(name="To Do", order=1))
+        task_list.update(name="Doing")
+        repo.update(task_list)
+
+        assert repo.get_by_id(task_list.id).name == "Doing"
+        assert [item.id for item in repo.get_all()] == [task_list.id]
+
+        repo.delete(task_list.id)
+        with pytest.raises(ValueError):
+            repo.get_by_id(task_list.id)
+
+    def test_save_many_and_existing_ids(self, database):
+        repo = SqliteTaskListRepository(database)
+        listener = []
+        repo.add_change_listener(listener.append)
+        task_lists = repo.save_many([TaskList(name=f"List {i}", order=i) for i in range(3)])
+
+        assert listener == [[task_list.id for task_list in task_lists]]
+        assert repo.existing_ids([task_lists[0].id, task_lists[2].id, "missing"]) == {task_lists[0].id, task_lists[2].id}
+
+    def test_update_missing_list_raises(self, database):
+        repo = SqliteTaskListRepository(database)
+        with pytest.raises(ValueError):
+            repo.update(TaskList(name="Ghost"))
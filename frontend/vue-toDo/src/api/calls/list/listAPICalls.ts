@@ -91,7 +91,9 @@ export async function updateAllListsOrder(lists: TaskList[]) {
 
 export async function getTasksOfList(listId: string) {
   try {
-    const response = await fetch (`http://localhost:8000/lists/${listId}/tasks`, {
+    // The endpoint returns a lean projection by default; the task form needs these fields too
+    const fields = 'id,title,list_id,description,created_at,due_date,checklist,owner,done,order'
+    const response = await fetch (`http://localhost:8000/lists/${listId}/tasks?fields=${fields}`, {
       method: 'GET',
       headers: { 'Content-Type': 'application/json'}
     })